@@ -0,0 +1,26 @@
+namespace Calcio.Api.Core.DTOs;
+
+public class BulkUpsertMatchesResultDto
+{
+    public int Succeeded { get; set; }
+
+    public int Failed { get; set; }
+
+    public IEnumerable<MatchUpsertOutcomeDto> Results { get; set; } = [];
+}
+
+public class MatchUpsertOutcomeDto
+{
+    /// <summary>
+    /// Position of the record in the request
+    /// </summary>
+    public int Index { get; set; }
+
+    public string Url { get; set; } = string.Empty;
+
+    public bool Success { get; set; }
+
+    public int? MatchId { get; set; }
+
+    public string? Error { get; set; }
+}
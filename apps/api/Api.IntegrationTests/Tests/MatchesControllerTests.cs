@@ -414,6 +414,112 @@ public class MatchesControllerTests : IClassFixture<CalcioWebApplicationFactory>
         Assert.NotEmpty(filterOptions.AgeGroups);
     }
 
+    [Fact]
+    public async Task BulkUpsertMatches_ReportsOutcomePerRecord()
+    {
+        // Arrange
+        var (venueId, ageGroupId, competitionId, teamId) = await SeedBulkUpsertReferences();
+        var request = new
+        {
+            Matches = new object[]
+            {
+                new { Url = "https://example.com/match/1", Time = "2025-09-06T15:00:00", HomeTeamId = teamId, VenueId = venueId, AgeGroupId = ageGroupId, CompetitionId = competitionId },
+                new { Url = "https://example.com/match/2", Time = "not a time", VenueId = venueId, AgeGroupId = ageGroupId, CompetitionId = competitionId },
+                new { Url = "https://example.com/match/3", Time = "2025-09-07T11:00:00", VenueId = venueId + 1000, AgeGroupId = ageGroupId, CompetitionId = competitionId },
+                new { Url = "https://example.com/match/4", Time = "2025-09-07T13:00:00", AwayTeamId = teamId, VenueId = venueId, AgeGroupId = ageGroupId, CompetitionId = competitionId }
+            }
+        };
+
+        // Act
+        var response = await _client.PostAsJsonAsync("/api/matches/bulk", request);
+
+        // Assert
+        Assert.Equal(HttpStatusCode.OK, response.StatusCode);
+
+        var result = await response.Content.ReadFromJsonAsync<BulkUpsertMatchesResultDto>();
+        Assert.NotNull(result);
+        Assert.Equal(2, result.Succeeded);
+        Assert.Equal(2, result.Failed);
+
+        var outcomes = result.Results.ToList();
+        Assert.Equal(new[] { 0, 1, 2, 3 }, outcomes.Select(o => o.Index));
+        Assert.True(outcomes[0].Success);
+        Assert.NotNull(outcomes[0].MatchId);
+        Assert.False(outcomes[1].Success);
+        Assert.Equal("Invalid time format", outcomes[1].Error);
+        Assert.False(outcomes[2].Success);
+        Assert.Contains("Venue", outcomes[2].Error);
+        Assert.True(outcomes[3].Success);
+
+        using var scope = _factory.Services.CreateScope();
+        var context = scope.ServiceProvider.GetRequiredService<CalcioDbContext>();
+        Assert.Equal(2, await context.Matches.CountAsync());
+    }
+
+    [Fact]
+    public async Task BulkUpsertMatches_UpdatesExistingMatchesByUrl()
+    {
+        // Arrange
+        var (venueId, ageGroupId, competitionId, _) = await SeedBulkUpsertReferences();
+        var match = new { Url = "https://example.com/match/1", Time = "2025-09-06T15:00:00", VenueId = venueId, AgeGroupId = ageGroupId, CompetitionId = competitionId };
+        var first = await _client.PostAsJsonAsync("/api/matches/bulk", new { Matches = new[] { match } });
+        var created = await first.Content.ReadFromJsonAsync<BulkUpsertMatchesResultDto>();
+        var createdTime = await GetStoredMatchTime();
+
+        // Act
+        var moved = match with { Time = "2025-09-06T17:00:00" };
+        var second = await _client.PostAsJsonAsync("/api/matches/bulk", new { Matches = new[] { moved } });
+        var updated = await second.Content.ReadFromJsonAsync<BulkUpsertMatchesResultDto>();
+
+        // Assert
+        Assert.NotNull(created);
+        Assert.NotNull(updated);
+        Assert.Equal(created.Results.Single().MatchId, updated.Results.Single().MatchId);
+        Assert.Equal(TimeSpan.FromHours(2), await GetStoredMatchTime() - createdTime);
+    }
+
+    [Fact]
+    public async Task BulkUpsertMatches_WithTooManyMatches_ReturnsBadRequest()
+    {
+        // Arrange
+        var matches = Enumerable.Range(0, 1001)
+            .Select(i => new { Url = $"https://example.com/match/{i}", Time = "2025-09-06T15:00:00", VenueId = 1, AgeGroupId = 1, CompetitionId = 1 })
+            .ToArray();
+
+        // Act
+        var response = await _client.PostAsJsonAsync("/api/matches/bulk", new { Matches = matches });
+
+        // Assert
+        Assert.Equal(HttpStatusCode.BadRequest, response.StatusCode);
+    }
+
+    private async Task<DateTime> GetStoredMatchTime()
+    {
+        using var scope = _factory.Services.CreateScope();
+        var context = scope.ServiceProvider.GetRequiredService<CalcioDbContext>();
+        var match = await context.Matches.AsNoTracking().SingleAsync();
+        return match.Time!.Value;
+    }
+
+    private async Task<(int VenueId, int AgeGroupId, int CompetitionId, int TeamId)> SeedBulkUpsertReferences()
+    {
+        using var scope = _factory.Services.CreateScope();
+        var context = scope.ServiceProvider.GetRequiredService<CalcioDbContext>();
+
+        var club = new Club { Name = "Bulk Club" };
+        var ageGroup = new AgeGroup { Name = "Bulk Age Group" };
+        var competition = new Competition { Name = "Bulk Competition" };
+        var venue = new Venue { Address = "Bulk Street 1" };
+        context.AddRange(club, ageGroup, competition, venue);
+        await context.SaveChangesAsync();
+
+        var team = new Team { Name = "Bulk Team", ClubId = club.Id };
+        context.Teams.Add(team);
+        await context.SaveChangesAsync();
+
+        return (venue.Id, ageGroup.Id, competition.Id, team.Id);
+    }
+
     private async Task SeedTestData()
     {
         using var scope = _factory.Services.CreateScope();
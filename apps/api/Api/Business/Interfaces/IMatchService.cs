@@ -8,6 +8,8 @@ public interface IMatchService
 {
     Task<Match> UpsertMatchAsync(UpsertMatchRequestDto request);
 
+    Task<BulkUpsertMatchesResultDto> BulkUpsertMatchesAsync(IReadOnlyList<UpsertMatchRequestDto> requests);
+
     Task<IEnumerable<MatchLocationDto>> GetMatchLocationsAsync(GetMatchLocationsRequestDto request);
 
     Task<GroupedMatchesByVenueDto> GetMatchesByVenueAsync(int venueId, GetMatchesByVenueRequestDto request);
@@ -78,6 +78,146 @@ public class MatchService : IMatchService
         }
     }
 
+    public async Task<BulkUpsertMatchesResultDto> BulkUpsertMatchesAsync(IReadOnlyList<UpsertMatchRequestDto> requests)
+    {
+        var outcomes = requests
+            .Select((request, index) => new MatchUpsertOutcomeDto { Index = index, Url = request.Url })
+            .ToList();
+
+        // Validate every record up front so one bad record does not fail the batch
+        var valid = new List<(int Index, UpsertMatchRequestDto Request, DateTime Time)>();
+        for (var i = 0; i < requests.Count; i++)
+        {
+            var request = requests[i];
+            if (string.IsNullOrWhiteSpace(request.Url))
+            {
+                outcomes[i].Error = "Url is required";
+                continue;
+            }
+            try
+            {
+                valid.Add((i, request, ParseMatchTime(request)));
+            }
+            catch (ArgumentException ex)
+            {
+                outcomes[i].Error = ex.Message;
+            }
+        }
+
+        var venueIds = valid.Select(v => v.Request.VenueId).Distinct().ToList();
+        var ageGroupIds = valid.Select(v => v.Request.AgeGroupId).Distinct().ToList();
+        var competitionIds = valid.Select(v => v.Request.CompetitionId).Distinct().ToList();
+        var teamIds = valid
+            .SelectMany(v => new[] { v.Request.HomeTeamId, v.Request.AwayTeamId })
+            .Where(id => id.HasValue)
+            .Select(id => id!.Value)
+            .Distinct()
+            .ToList();
+
+        var knownVenues = (await _context.Venues.Where(v => venueIds.Contains(v.Id)).Select(v => v.Id).ToListAsync()).ToHashSet();
+        var knownAgeGroups = (await _context.AgeGroups.Where(a => ageGroupIds.Contains(a.Id)).Select(a => a.Id).ToListAsync()).ToHashSet();
+        var knownCompetitions = (await _context.Competitions.Where(c => competitionIds.Contains(c.Id)).Select(c => c.Id).ToListAsync()).ToHashSet();
+        var knownTeams = (await _context.Teams.Where(t => teamIds.Contains(t.Id)).Select(t => t.Id).ToListAsync()).ToHashSet();
+
+        valid = valid.Where(v =>
+        {
+            var error = MissingReference(v.Request, knownVenues, knownAgeGroups, knownCompetitions, knownTeams);
+            outcomes[v.Index].Error = error;
+            return error == null;
+        }).ToList();
+
+        // One lookup for all existing matches of the batch; later duplicates of a URL win
+        var urls = valid.Select(v => v.Request.Url).Distinct().ToList();
+        var matchesByUrl = await _context.Matches
+            .Where(m => m.Url != null && urls.Contains(m.Url))
+            .ToDictionaryAsync(m => m.Url!);
+
+        var saved = new List<(int Index, Match Match)>();
+        foreach (var (index, request, time) in valid)
+        {
+            if (!matchesByUrl.TryGetValue(request.Url, out var match))
+            {
+                match = new Match { Url = request.Url };
+                _context.Matches.Add(match);
+                matchesByUrl[request.Url] = match;
+            }
+            match.Time = time;
+            match.HomeTeamId = request.HomeTeamId;
+            match.AwayTeamId = request.AwayTeamId;
+            match.VenueId = request.VenueId;
+            match.AgeGroupId = request.AgeGroupId;
+            match.CompetitionId = request.CompetitionId;
+            saved.Add((index, match));
+        }
+
+        try
+        {
+            await _context.SaveChangesAsync();
+        }
+        catch (DbUpdateException)
+        {
+            // Fall back to one save per record so the failing ones can be reported
+            _context.ChangeTracker.Clear();
+            saved.Clear();
+            foreach (var (index, request, _) in valid)
+            {
+                try
+                {
+                    saved.Add((index, await UpsertMatchAsync(request)));
+                }
+                catch (InvalidOperationException ex)
+                {
+                    _context.ChangeTracker.Clear();
+                    outcomes[index].Error = ex.Message;
+                }
+            }
+        }
+
+        foreach (var (index, match) in saved)
+        {
+            outcomes[index].Success = true;
+            outcomes[index].MatchId = match.Id;
+        }
+
+        var succeeded = outcomes.Count(o => o.Success);
+        return new BulkUpsertMatchesResultDto
+        {
+            Succeeded = succeeded,
+            Failed = outcomes.Count - succeeded,
+            Results = outcomes
+        };
+    }
+
+    private static string? MissingReference(
+        UpsertMatchRequestDto request,
+        HashSet<int> venues,
+        HashSet<int> ageGroups,
+        HashSet<int> competitions,
+        HashSet<int> teams)
+    {
+        if (!venues.Contains(request.VenueId))
+        {
+            return $"Venue {request.VenueId} not found";
+        }
+        if (!ageGroups.Contains(request.AgeGroupId))
+        {
+            return $"Age group {request.AgeGroupId} not found";
+        }
+        if (!competitions.Contains(request.CompetitionId))
+        {
+            return $"Competition {request.CompetitionId} not found";
+        }
+        if (request.HomeTeamId.HasValue && !teams.Contains(request.HomeTeamId.Value))
+        {
+            return $"Team {request.HomeTeamId} not found";
+        }
+        if (request.AwayTeamId.HasValue && !teams.Contains(request.AwayTeamId.Value))
+        {
+            return $"Team {request.AwayTeamId} not found";
+        }
+        return null;
+    }
+
     private static DateTime ParseMatchTime(UpsertMatchRequestDto request)
     {
         // Parse the time string; support ISO8601 with or without offset.
@@ -11,6 +11,8 @@ namespace Api.Controllers;
 [Tags("Matches")]
 public class MatchesController : ControllerBase
 {
+    private const int MaxBulkUpsertSize = 1000;
+
     private readonly IMatchService _matchService;
 
     public MatchesController(IMatchService matchService)
@@ -43,6 +45,28 @@ public class MatchesController : ControllerBase
         }
     }
 
+    /// <summary>
+    /// Upsert a batch of matches
+    /// </summary>
+    /// <param name="request">Matches to upsert, at most 1000 per request</param>
+    /// <returns>The outcome of every record, in request order</returns>
+    /// <remarks>
+    /// Records that fail validation are reported individually; the rest of the batch is still saved.
+    /// </remarks>
+    [HttpPost("bulk")]
+    [ProducesResponseType(typeof(BulkUpsertMatchesResultDto), 200)]
+    [ProducesResponseType(400)]
+    public async Task<ActionResult<BulkUpsertMatchesResultDto>> BulkUpsertMatches([FromBody] BulkUpsertMatchesRequestDto request)
+    {
+        if (request.Matches.Count > MaxBulkUpsertSize)
+        {
+            return BadRequest($"At most {MaxBulkUpsertSize} matches can be upserted per request.");
+        }
+
+        var result = await _matchService.BulkUpsertMatchesAsync(request.Matches);
+        return Ok(result);
+    }
+
     /// <summary>
     /// Get matches within a specified bounding box and/or date range
     /// </summary>
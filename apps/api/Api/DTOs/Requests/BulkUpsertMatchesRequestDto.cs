@@ -0,0 +1,6 @@
+namespace Api.DTOs.Requests;
+
+public class BulkUpsertMatchesRequestDto
+{
+    public List<UpsertMatchRequestDto> Matches { get; set; } = [];
+}
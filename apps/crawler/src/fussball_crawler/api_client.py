@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import contextlib
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 import requests
 
@@ -14,6 +16,8 @@ except ImportError:
     ZoneInfo = None
 
 from .logger import get_logger
+from .match_record import MatchRecord
+from .transport import get_api_adapter
 
 logger = get_logger(__name__)
 
@@ -22,6 +26,11 @@ class ApiClient:
     def __init__(self, base_url: str):
         self.base_url = base_url
         self.session = requests.Session()
+        # Short-lived threads get their own client but share the keep-alive
+        # connection pools of one adapter
+        self.adapter = get_api_adapter()
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
         self.session.headers.update(
             {"Content-Type": "application/json", "Accept": "application/json"}
         )
@@ -50,27 +59,124 @@ class ApiClient:
         logger.debug(f"PUT {url} -> {response.status_code}")
         return response
 
+    def _patch(self, endpoint: str, data: dict) -> requests.Response:
+        """Make PATCH request to API endpoint"""
+        url = f"{self.base_url}{endpoint}"
+        response = self.session.patch(url, json=data)
+        logger.debug(f"PATCH {url} -> {response.status_code}")
+        return response
+
+
+class LookupStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LookupCache:
+    """
+    Run-scoped LRU of reference IDs (age groups, competitions, venues, clubs,
+    teams), keyed by kind and natural key. Only IDs the API has confirmed are
+    stored, so a hit can stand in for both the find-or-create and the lookup.
+    """
 
-# Lazily-initialized singleton client (avoid side effects on import)
-_api_client: ApiClient | None = None
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, Any], int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, key: Any) -> int | None:
+        with self._lock:
+            value = self._entries.get((kind, key))
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end((kind, key))
+            return value
+
+    def put(self, kind: str, key: Any, value: Any) -> None:
+        if not isinstance(value, int):
+            return
+        with self._lock:
+            self._entries[(kind, key)] = value
+            self._entries.move_to_end((kind, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, kind: str, key: Any = None) -> None:
+        """Forget one entry, or every entry of a kind if no key is given."""
+        with self._lock:
+            if key is not None:
+                self._entries.pop((kind, key), None)
+                return
+            for entry in [entry for entry in self._entries if entry[0] == kind]:
+                del self._entries[entry]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> LookupStats:
+        with self._lock:
+            return LookupStats(self.hits, self.misses, len(self._entries))
+
+
+lookup_cache = LookupCache()
+
+
+def _response_id(response: requests.Response) -> int | None:
+    with contextlib.suppress(ValueError, AttributeError):
+        return response.json().get("id")
+    return None
+
+
+# Each thread gets its own client (and so its own requests.Session) for the
+# configured base URL; sessions are not safe to share between threads, the
+# connection pools of their adapter are
+_base_url: str | None = None
+_thread_local = threading.local()
 
 
 def get_client(base_url: str) -> ApiClient:
-    global _api_client
-    if _api_client is None or _api_client.base_url != base_url:
-        # Create new client if none exists or if URL is different
-        _api_client = ApiClient(base_url)
-    return _api_client
+    global _base_url
+    if base_url != _base_url:
+        # Cached IDs belong to one API instance
+        lookup_cache.clear()
+    _base_url = base_url
+    return _get_thread_client(base_url)
+
+
+def _get_thread_client(base_url: str) -> ApiClient:
+    client: ApiClient | None = getattr(_thread_local, "client", None)
+    if (
+        client is None
+        or client.base_url != base_url
+        or client.adapter is not get_api_adapter()
+    ):
+        # Create new client if none exists, the URL is different or the
+        # transport was reconfigured
+        client = ApiClient(base_url)
+        _thread_local.client = client
+    return client
 
 
 def _get_initialized_client() -> ApiClient:
     """Get the initialized client. Raises error if not initialized."""
-    global _api_client
-    if _api_client is None:
+    if _base_url is None:
         raise RuntimeError(
             "API client not initialized. Call get_client(base_url) first."
         )
-    return _api_client
+    return _get_thread_client(_base_url)
 
 
 def available() -> bool:
@@ -88,7 +194,7 @@ def available() -> bool:
     return False
 
 
-def insert_club(external_id: str, name: str, post_code: str | None) -> None:
+def insert_club(external_id: str, name: str, post_code: str | None) -> bool:
     """Insert club using API (for compatibility)"""
     try:
         response = _get_initialized_client()._post(
@@ -97,10 +203,13 @@ def insert_club(external_id: str, name: str, post_code: str | None) -> None:
         )
         if response.status_code in [200, 201]:
             logger.debug(f"{external_id} - Club upserted successfully via API")
-        else:
-            logger.error(f"Error upserting club via API: {response.text}")
+            lookup_cache.put("club", external_id, _response_id(response))
+            return True
+        logger.error(f"Error upserting club via API: {response.text}")
     except Exception as error:
         logger.error(f"Error upserting club via API: {error}")
+    lookup_cache.invalidate("club", external_id)
+    return False
 
 
 def insert_venue(address: str, coordinates: tuple | None = None) -> None:
@@ -114,20 +223,46 @@ def insert_venue(address: str, coordinates: tuple | None = None) -> None:
         response = _get_initialized_client()._post("/api/venues/find-or-create", data)
         if response.status_code in [200, 201]:
             logger.debug(f"{address} - Venue upserted successfully via API")
+            lookup_cache.put("venue", address, _response_id(response))
         else:
             logger.error(
                 f"Error upserting venue via API: {response.status_code} - {response.text}"
             )
+            lookup_cache.invalidate("venue", address)
     except Exception as error:
         logger.error(f"Error upserting venue via API: {error}")
+        lookup_cache.invalidate("venue", address)
+
+
+def update_venue_coordinates(venue_id: int, coordinates: tuple[float, float]) -> bool:
+    """Set the coordinates of an existing venue using API"""
+    try:
+        response = _get_initialized_client()._patch(
+            f"/api/venues/{venue_id}",
+            {"latitude": coordinates[0], "longitude": coordinates[1]},
+        )
+        if response.status_code == 200:
+            logger.debug(f"{venue_id} - Venue coordinates updated via API")
+            return True
+        logger.error(
+            f"Error updating venue {venue_id} via API: {response.status_code} - {response.text}"
+        )
+    except Exception as error:
+        logger.error(f"Error updating venue {venue_id} via API: {error}")
+    return False
 
 
 def get_club_id_by_external_id(external_id: str) -> int | None:
     """Get club ID by external ID using API"""
+    cached = lookup_cache.get("club", external_id)
+    if cached is not None:
+        return cached
     try:
         response = _get_initialized_client()._get(f"/api/clubs/find/{external_id}/id")
         if response.status_code == 200:
-            return response.json()
+            club_id = response.json()
+            lookup_cache.put("club", external_id, club_id)
+            return club_id
         return None
     except Exception as error:
         logger.error(f"Error fetching club ID via API: {error}")
@@ -142,7 +277,9 @@ def find_or_create_club(external_id: str, name: str) -> int | None:
         )
         if response.status_code in [200, 201]:
             club_data = response.json()
+            lookup_cache.put("club", external_id, club_data.get("id"))
             return club_data.get("id")
+        lookup_cache.invalidate("club", external_id)
         return None
     except Exception as error:
         logger.error(f"Error finding/creating club via API: {error}")
@@ -151,10 +288,15 @@ def find_or_create_club(external_id: str, name: str) -> int | None:
 
 def get_age_group_id_by_name(name: str) -> int | None:
     """Get age group ID by name using API"""
+    cached = lookup_cache.get("age_group", name)
+    if cached is not None:
+        return cached
     try:
         response = _get_initialized_client()._get(f"/api/age-groups/find/{name}/id")
         if response.status_code == 200:
-            return response.json()
+            age_group_id = response.json()
+            lookup_cache.put("age_group", name, age_group_id)
+            return age_group_id
         return None
     except Exception as error:
         logger.error(f"Error fetching age group ID via API: {error}")
@@ -163,10 +305,15 @@ def get_age_group_id_by_name(name: str) -> int | None:
 
 def get_competition_id_by_name(name: str) -> int | None:
     """Get competition ID by name using API"""
+    cached = lookup_cache.get("competition", name)
+    if cached is not None:
+        return cached
     try:
         response = _get_initialized_client()._get(f"/api/competitions/find/{name}/id")
         if response.status_code == 200:
-            return response.json()
+            competition_id = response.json()
+            lookup_cache.put("competition", name, competition_id)
+            return competition_id
         return None
     except Exception as error:
         logger.error(f"Error fetching competition ID via API: {error}")
@@ -175,12 +322,15 @@ def get_competition_id_by_name(name: str) -> int | None:
 
 def insert_age_group(name: str) -> None:
     """Insert age group using API"""
+    if lookup_cache.get("age_group", name) is not None:
+        return
     try:
         response = _get_initialized_client()._post(
             "/api/age-groups/find-or-create", {"name": name}
         )
         if response.status_code in [200, 201]:
             logger.debug(f"{name} - Age group upserted successfully via API")
+            lookup_cache.put("age_group", name, _response_id(response))
         else:
             logger.error(
                 f"Error upserting age group via API: {response.status_code} - {response.text}"
@@ -191,12 +341,15 @@ def insert_age_group(name: str) -> None:
 
 def insert_competition(name: str) -> None:
     """Insert competition using API"""
+    if lookup_cache.get("competition", name) is not None:
+        return
     try:
         response = _get_initialized_client()._post(
             "/api/competitions/find-or-create", {"name": name}
         )
         if response.status_code in [200, 201]:
             logger.debug(f"{name} - Competition upserted successfully via API")
+            lookup_cache.put("competition", name, _response_id(response))
         else:
             logger.error(
                 f"Error upserting competition via API: {response.status_code} - {response.text}"
@@ -209,6 +362,10 @@ def find_or_create_team(
     team_name: str, club_external_id: str, team_external_id: str | None = None
 ) -> int | None:
     """Find existing team or create new one using API"""
+    key = (team_name, club_external_id, team_external_id)
+    cached = lookup_cache.get("team", key)
+    if cached is not None:
+        return cached
     try:
         response = _get_initialized_client()._post(
             "/api/teams/find-or-create",
@@ -220,6 +377,7 @@ def find_or_create_team(
         )
         if response.status_code in [200, 201]:
             team_data = response.json()
+            lookup_cache.put("team", key, team_data.get("id"))
             return team_data.get("id")
         elif response.status_code == 400:
             logger.error(f"Club with external_id {club_external_id} not found")
@@ -230,47 +388,175 @@ def find_or_create_team(
         return None
 
 
+def format_match_time(time: Any) -> str:
+    """Serialize a match time; naive datetimes are assumed to be Europe/Berlin"""
+    if isinstance(time, datetime):
+        dt = time
+        if dt.tzinfo is None and ZoneInfo is not None:
+            with contextlib.suppress(Exception):
+                dt = dt.replace(tzinfo=ZoneInfo("Europe/Berlin"))
+        return dt.isoformat()
+    return str(time)
+
+
+def match_payload(
+    url: str | MatchRecord,
+    time: Any,
+    home_team_id: int | None,
+    away_team_id: int | None,
+    venue_id: int,
+    age_group_id: int,
+    competition_id: int,
+) -> dict[str, Any]:
+    """Request body of the match upsert endpoint.
+
+    url may be the scraped MatchRecord; its URL and (if time is None) its
+    time are used.
+    """
+    if isinstance(url, MatchRecord):
+        url, time = url.url, url.time if time is None else time
+    return {
+        "url": url,
+        "time": format_match_time(time),
+        "homeTeamId": home_team_id,
+        "awayTeamId": away_team_id,
+        "venueId": venue_id,
+        "ageGroupId": age_group_id,
+        "competitionId": competition_id,
+    }
+
+
 def upsert_match(
-    url: str,
+    url: str | MatchRecord,
     time: Any,
     home_team_id: int | None,
     away_team_id: int | None,
     venue_id: int,
     age_group_id: int,
     competition_id: int,
-) -> None:
-    """Upsert match using API"""
+) -> bool:
+    """Upsert match using API (see match_payload for the arguments)"""
     try:
-        # Normalize time: if datetime and naive, assume Europe/Berlin and attach tz
-        if isinstance(time, datetime):
-            dt = time
-            if dt.tzinfo is None and ZoneInfo is not None:
-                with contextlib.suppress(Exception):
-                    dt = dt.replace(tzinfo=ZoneInfo("Europe/Berlin"))
-            time_str = dt.isoformat()
-        else:
-            time_str = str(time)
-
         response = _get_initialized_client()._post(
             "/api/matches",
-            {
-                "url": url,
-                "time": time_str,
-                "homeTeamId": home_team_id,
-                "awayTeamId": away_team_id,
-                "venueId": venue_id,
-                "ageGroupId": age_group_id,
-                "competitionId": competition_id,
-            },
+            match_payload(
+                url,
+                time,
+                home_team_id,
+                away_team_id,
+                venue_id,
+                age_group_id,
+                competition_id,
+            ),
         )
         if response.status_code in [200, 201]:
             logger.debug("Match inserted successfully via API")
-        else:
-            logger.error(
-                f"Error inserting match via API: {response.status_code} - {response.text}"
-            )
+            return True
+        logger.error(
+            f"Error inserting match via API: {response.status_code} - {response.text}"
+        )
     except Exception as error:
         logger.error(f"Error inserting match via API: {error}")
+    invalidate_match_references()
+    return False
+
+
+class MatchUpsertOutcome(NamedTuple):
+    """Result of one record of a bulk match upsert"""
+
+    url: str
+    success: bool
+    match_id: int | None = None
+    error: str | None = None
+
+
+DEFAULT_MATCH_BATCH_SIZE = 200
+# The bulk endpoint rejects larger requests (MatchesController.MaxBulkUpsertSize)
+MAX_MATCH_BATCH_SIZE = 1000
+
+
+def upsert_matches(
+    records: list[dict[str, Any]], batch_size: int = DEFAULT_MATCH_BATCH_SIZE
+) -> list[MatchUpsertOutcome]:
+    """Upsert match payloads (see match_payload) in batches via the bulk endpoint.
+
+    Returns one outcome per record, in order. Falls back to one request per
+    match if the API has no bulk endpoint. Batches are split at the API's
+    MAX_MATCH_BATCH_SIZE.
+    """
+    batch_size = min(batch_size, MAX_MATCH_BATCH_SIZE)
+    outcomes: list[MatchUpsertOutcome] = []
+    for start in range(0, len(records), batch_size):
+        outcomes.extend(_upsert_match_batch(records[start : start + batch_size]))
+    if not all(outcome.success for outcome in outcomes):
+        invalidate_match_references()
+    return outcomes
+
+
+def _upsert_match_batch(batch: list[dict[str, Any]]) -> list[MatchUpsertOutcome]:
+    try:
+        response = _get_initialized_client()._post(
+            "/api/matches/bulk", {"matches": batch}
+        )
+        if response.status_code in [404, 405]:
+            logger.debug("Bulk match endpoint not available, upserting one by one")
+            return [
+                MatchUpsertOutcome(
+                    record["url"],
+                    upsert_match(
+                        record["url"],
+                        record["time"],
+                        record["homeTeamId"],
+                        record["awayTeamId"],
+                        record["venueId"],
+                        record["ageGroupId"],
+                        record["competitionId"],
+                    ),
+                )
+                for record in batch
+            ]
+        if response.status_code != 200:
+            error = f"{response.status_code} - {response.text}"
+            logger.error(f"Error inserting matches via API: {error}")
+            return [MatchUpsertOutcome(r["url"], False, error=error) for r in batch]
+
+        results = response.json().get("results", [])
+    except Exception as error:
+        logger.error(f"Error inserting matches via API: {error}")
+        return [MatchUpsertOutcome(r["url"], False, error=str(error)) for r in batch]
+    return bulk_upsert_outcomes(batch, results)
+
+
+def bulk_upsert_outcomes(
+    batch: list[dict[str, Any]], results: list[dict[str, Any]]
+) -> list[MatchUpsertOutcome]:
+    """Map the bulk endpoint's results back onto the records of a batch"""
+    outcomes = [
+        MatchUpsertOutcome(record["url"], False, error="No result returned")
+        for record in batch
+    ]
+    for result in results:
+        index = result.get("index")
+        if isinstance(index, int) and 0 <= index < len(batch):
+            outcomes[index] = MatchUpsertOutcome(
+                batch[index]["url"],
+                bool(result.get("success")),
+                result.get("matchId"),
+                result.get("error"),
+            )
+    failed = [outcome for outcome in outcomes if not outcome.success]
+    for outcome in failed:
+        logger.error(f"Error inserting match {outcome.url} via API: {outcome.error}")
+    logger.debug(
+        f"Bulk upserted {len(batch) - len(failed)}/{len(batch)} matches via API"
+    )
+    return outcomes
+
+
+def invalidate_match_references() -> None:
+    """Drop cached IDs a failed match write may have referenced."""
+    for kind in ("venue", "age_group", "competition", "team"):
+        lookup_cache.invalidate(kind)
 
 
 def get_clubs(post_codes: list[str] | None = None) -> list[tuple[Any, ...]]:
@@ -309,12 +595,17 @@ def find_venue_location(address: str) -> int | None:
 
 def get_venue_id_by_address(address: str) -> int | None:
     """Get venue ID by address using API"""
+    cached = lookup_cache.get("venue", address)
+    if cached is not None:
+        return cached
     try:
         response = _get_initialized_client()._get(
             f"/api/venues/find/by-address/{address}/id"
         )
         if response.status_code == 200:
-            return response.json()
+            venue_id = response.json()
+            lookup_cache.put("venue", address, venue_id)
+            return venue_id
         return None
     except Exception as error:
         logger.error(f"Error fetching venue ID via API: {error}")
@@ -0,0 +1,998 @@
+"""
+Asyncio implementation of the crawler's I/O layer.
+
+All requests to fussball.de, the geocoder and the Calcio API go through one
+aiohttp session whose connector pools connections per host, so thousands of
+in-flight requests cost coroutines instead of OS threads. Page parsing reuses
+the synchronous helpers and runs in worker threads.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:
+    aiohttp = None  # type: ignore[assignment]
+
+from . import scraper as fussball_scraper
+from .api_client import (
+    DEFAULT_MATCH_BATCH_SIZE,
+    MAX_MATCH_BATCH_SIZE,
+    MatchUpsertOutcome,
+    bulk_upsert_outcomes,
+    invalidate_match_references,
+    lookup_cache,
+    match_payload,
+)
+from .club_finder import get_clubs as extract_clubs
+from .crawl_state import (
+    Checkpoint,
+    CrawlState,
+    club_list_fingerprint,
+)
+from .deobfuscator import extract_obfuscation_ids, font_url
+from .logger import get_logger
+from .match_finder import (
+    CrawlProgress,
+    coordinates_from_features,
+    finish_crawl,
+    geocoder_features,
+    geocoder_queries,
+    get_geocode_cache,
+    known_window_fingerprints,
+    plan_crawl,
+    save_window_fingerprints,
+)
+from .match_record import MatchRecord
+from .pipeline import PageTask, parse_page
+from .rate_limit import get_limiter
+from .sharding import Shard
+from .transport import (
+    RETRY_STATUSES,
+    TransportConfig,
+    allowed_retries,
+    backoff_delay,
+    get_transport_config,
+    retry_delay,
+)
+
+logger = get_logger(__name__)
+
+_JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+
+def require_aiohttp() -> None:
+    if aiohttp is None:
+        raise RuntimeError(
+            "The async engine requires aiohttp. Install it with: pip install -e .[async]"
+        )
+
+
+class HttpResponse:
+    """Fully read response of an AsyncHttp request."""
+
+    __slots__ = ("status_code", "content", "encoding", "headers")
+
+    def __init__(
+        self,
+        status_code: int,
+        content: bytes,
+        encoding: str | None,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding
+        self.headers = headers or {}
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class AsyncHttp:
+    """
+    Shared aiohttp session with per-host connection pools. Uses the timeouts
+    and retry policy of the sync transport: idempotent methods are retried,
+    waiting at least as long as a Retry-After header asks.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        config: TransportConfig | None = None,
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.config = config or get_transport_config()
+        self.session: Any = None
+
+    async def __aenter__(self) -> "AsyncHttp":
+        require_aiohttp()
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host
+            ),
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=self.config.connect_timeout,
+                sock_read=self.config.read_timeout,
+            ),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.session.close()
+
+    async def request(
+        self, method: str, url: str, encoded: bool = False, **kwargs: Any
+    ) -> HttpResponse:
+        target = URL(url, encoded=True) if encoded else url
+        retries = allowed_retries(self.config, method)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._send(method, url, target, **kwargs)
+            except (aiohttp.ClientError, TimeoutError):
+                if attempt > retries:
+                    raise
+                delay = backoff_delay(self.config, attempt)
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt > retries:
+                    return response
+                delay = retry_delay(self.config, attempt, response.headers)
+            await asyncio.sleep(delay)
+
+    async def _send(
+        self, method: str, url: str, target: Any, **kwargs: Any
+    ) -> HttpResponse:
+        limiter = get_limiter(url)
+        if limiter is not None:
+            while (wait := limiter.try_acquire()) > 0:
+                await asyncio.sleep(wait)
+        started = time.monotonic()
+        status_code = None
+        try:
+            async with self.session.request(method, target, **kwargs) as resp:
+                content = await resp.read()
+                status_code = resp.status
+                return HttpResponse(resp.status, content, resp.charset, resp.headers)
+        finally:
+            if limiter is not None:
+                latency = time.monotonic() - started
+                limiter.release(status_code, latency if method == "GET" else None)
+
+    async def get(self, url: str, **kwargs: Any) -> HttpResponse:
+        return await self.request("GET", url, **kwargs)
+
+
+async def cached_get(
+    http: AsyncHttp, url: str, url_class: str, headers: dict[str, str] | None = None
+) -> HttpResponse:
+    """GET a fussball.de page through the scraper's HTTP cache (if enabled)"""
+    http_cache = fussball_scraper.get_http_cache()
+    if http_cache is None:
+        return await http.get(url, headers=headers)
+
+    entry = http_cache.load(url)
+    if entry is not None and http_cache.is_fresh(entry, url_class):
+        http_cache.count("hits")
+        return HttpResponse(entry.status_code, entry.content, entry.encoding)
+
+    request_headers = dict(headers or {})
+    if entry is not None:
+        request_headers.update(http_cache.conditional_headers(entry))
+    response = await http.get(url, headers=request_headers or None)
+
+    if response.status_code == 304 and entry is not None:
+        http_cache.count("revalidated")
+        entry = http_cache.refresh(url, entry)
+        return HttpResponse(entry.status_code, entry.content, entry.encoding)
+    http_cache.count("misses")
+    if response.status_code == 200:
+        http_cache.store(url, response)
+    return response
+
+
+async def fetch_font(http: AsyncHttp, obfuscation_id: str) -> bytes:
+    r = await http.get(font_url(obfuscation_id))
+    if r.status_code != 200:
+        raise RuntimeError(f"Font {obfuscation_id} not available ({r.status_code})")
+    return r.content
+
+
+async def fetch_club_schedule_matches(
+    http: AsyncHttp,
+    club_external_id: str,
+    from_date: str,
+    to_date: str,
+    known_fingerprint: str | None = None,
+) -> fussball_scraper.ClubSchedule:
+    """Fetch a club's schedule, extracting matches only if its table changed"""
+    r = await cached_get(
+        http,
+        fussball_scraper.club_schedule_url(club_external_id, from_date, to_date),
+        "schedule",
+    )
+    font_cache = fussball_scraper.get_font_cache()
+    missing = [
+        obfuscation_id
+        for obfuscation_id in extract_obfuscation_ids(r.content)
+        if font_cache.get(obfuscation_id) is None
+    ]
+    fonts = await asyncio.gather(*(fetch_font(http, i) for i in missing))
+    task = PageTask(
+        club_external_id,
+        r.content,
+        r.encoding,
+        dict(zip(missing, fonts, strict=True)),
+        known_fingerprint,
+    )
+    return await asyncio.to_thread(parse_page, task)
+
+
+async def fetch_club_windows(
+    http: AsyncHttp,
+    club_external_id: str,
+    from_date: str,
+    to_date: str,
+    window_days: int | None = None,
+    known_fingerprints: dict[tuple[str, str], str] | None = None,
+) -> fussball_scraper.ClubMatches:
+    """Fetch a club's schedule in date windows (concurrently) and merge the matches"""
+    windows = fussball_scraper.date_windows(from_date, to_date, window_days)
+    known = known_fingerprints or {}
+    schedules = await asyncio.gather(
+        *(
+            fetch_club_schedule_matches(
+                http, club_external_id, *window, known.get(window)
+            )
+            for window in windows
+        )
+    )
+    return fussball_scraper.merge_schedules(club_external_id, windows, schedules)
+
+
+async def fetch_club_matches(
+    http: AsyncHttp,
+    club_external_id: str,
+    from_date: str,
+    to_date: str,
+    window_days: int | None = None,
+) -> list[MatchRecord]:
+    """Fetch matches for a specific club from fussball.de"""
+    try:
+        schedule = await fetch_club_windows(
+            http, club_external_id, from_date, to_date, window_days
+        )
+        return schedule.matches or []
+    except Exception as e:
+        logger.error(f"Error fetching matches for club {club_external_id}: {e}")
+        return []
+
+
+async def fetch_club_name_from_team_url(
+    http: AsyncHttp, team_url: str
+) -> dict[str, str] | None:
+    """Fetch club name and ID from a team page."""
+    try:
+        logger.debug(f"Fetching club info from team URL: {team_url}")
+        r = await cached_get(http, team_url, "team")
+
+        if r.status_code != 200:
+            logger.warning(
+                f"Failed to fetch team page: {team_url} (status: {r.status_code})"
+            )
+            return None
+
+        club_info = fussball_scraper.parse_club_info(r.text)
+        if club_info is None:
+            logger.warning(f"Could not find club information in team page: {team_url}")
+        return club_info
+
+    except Exception as e:
+        logger.error(f"Error fetching club info from team URL {team_url}: {e}")
+        return None
+
+
+async def fetch_all_clubs_for_post_code(http: AsyncHttp, postal_code: str) -> str:
+    """Fetch all clubs for a postal code, including load-more results."""
+    url = fussball_scraper.club_search_url(postal_code)
+    logger.debug("Fetching URL: %s", url)
+
+    r = await cached_get(http, url, "club_search")
+    initial_html = r.text
+
+    ajax_url = fussball_scraper.find_load_more_resource(initial_html)
+    if ajax_url is None:
+        return initial_html
+
+    logger.debug("Found load-more for %s, fetching additional results...", postal_code)
+
+    all_html = initial_html
+    offset = fussball_scraper.LOAD_MORE_PAGE_SIZE
+
+    while True:
+        ajax_request_url = fussball_scraper.load_more_url(ajax_url, postal_code, offset)
+
+        try:
+            ajax_response = await cached_get(
+                http,
+                ajax_request_url,
+                "club_search",
+                headers=fussball_scraper.LOAD_MORE_HEADERS,
+            )
+
+            if ajax_response.status_code != 200:
+                break
+
+            merged_html = fussball_scraper.append_load_more_html(
+                all_html, ajax_response.json()
+            )
+            if merged_html is None:
+                break
+            all_html = merged_html
+
+            offset += fussball_scraper.LOAD_MORE_PAGE_SIZE
+            logger.debug(
+                "Loaded %d more results for %s (offset: %d)",
+                fussball_scraper.LOAD_MORE_PAGE_SIZE,
+                postal_code,
+                offset,
+            )
+
+        except (TimeoutError, aiohttp.ClientError, ValueError, KeyError) as e:
+            logger.warning("Failed to load more results for %s: %s", postal_code, e)
+            break
+
+    return all_html
+
+
+async def find_lat_long_online(
+    http: AsyncHttp, geocoder_url: str, location: str
+) -> tuple[float, float] | None:
+    cache = get_geocode_cache()
+    cached = cache.get(location)
+    if cached is not None:
+        return cached.coordinates
+
+    features: list[dict] | None = []
+    for params in geocoder_queries(location):
+        r = await http.get(f"{geocoder_url}?{params}", encoded=True)
+        features = geocoder_features(r.status_code, r.json)
+        if features is None:
+            logger.warning(f"Geocoder failed for {location} ({r.status_code})")
+            return None
+        if features:
+            break
+    coordinates = coordinates_from_features(features, location)
+    cache.put(location, coordinates)
+    return coordinates
+
+
+def _response_id(response: HttpResponse) -> int | None:
+    try:
+        return response.json().get("id")
+    except (ValueError, AttributeError):
+        return None
+
+
+class AsyncApiClient:
+    """Coroutine versions of the api_client functions, sharing its lookup cache."""
+
+    def __init__(self, http: AsyncHttp, base_url: str) -> None:
+        self.http = http
+        self.base_url = base_url
+
+    async def _request(
+        self, method: str, endpoint: str, data: dict | None = None
+    ) -> HttpResponse:
+        url = f"{self.base_url}{endpoint}"
+        response = await self.http.request(
+            method, url, json=data, headers=_JSON_HEADERS
+        )
+        logger.debug(f"{method} {url} -> {response.status_code}")
+        return response
+
+    async def _get_id(self, endpoint: str, kind: str, key: str) -> int | None:
+        cached = lookup_cache.get(kind, key)
+        if cached is not None:
+            return cached
+        what = kind.replace("_", " ")
+        try:
+            response = await self._request("GET", endpoint)
+            if response.status_code == 200:
+                found_id = response.json()
+                lookup_cache.put(kind, key, found_id)
+                return found_id
+            return None
+        except Exception as error:
+            logger.error(f"Error fetching {what} ID via API: {error}")
+            return None
+
+    async def _find_or_create(
+        self, endpoint: str, data: dict, kind: str, key: str
+    ) -> bool:
+        what = kind.replace("_", " ")
+        try:
+            response = await self._request("POST", endpoint, data)
+            if response.status_code in [200, 201]:
+                logger.debug(f"{what} upserted successfully via API")
+                lookup_cache.put(kind, key, _response_id(response))
+                return True
+            logger.error(
+                f"Error upserting {what} via API: {response.status_code} - {response.text}"
+            )
+        except Exception as error:
+            logger.error(f"Error upserting {what} via API: {error}")
+        lookup_cache.invalidate(kind, key)
+        return False
+
+    async def available(self) -> bool:
+        try:
+            response = await self._request("GET", "/")
+            if response.status_code == 200:
+                logger.debug("API connection successful")
+                return True
+            logger.error(f"API connection failed: {response.status_code}")
+        except Exception as error:
+            logger.error(f"Error connecting to API: {error}")
+        return False
+
+    async def insert_club(
+        self, external_id: str, name: str, post_code: str | None
+    ) -> bool:
+        return await self._find_or_create(
+            "/api/clubs/find-or-create",
+            {"externalId": external_id, "name": name, "postCode": post_code},
+            "club",
+            external_id,
+        )
+
+    async def insert_venue(
+        self, address: str, coordinates: tuple | None = None
+    ) -> None:
+        data: dict[str, Any] = {"address": address}
+        if coordinates:
+            data["latitude"] = coordinates[0]
+            data["longitude"] = coordinates[1]
+        await self._find_or_create("/api/venues/find-or-create", data, "venue", address)
+
+    async def insert_age_group(self, name: str) -> None:
+        if lookup_cache.get("age_group", name) is not None:
+            return
+        await self._find_or_create(
+            "/api/age-groups/find-or-create", {"name": name}, "age_group", name
+        )
+
+    async def insert_competition(self, name: str) -> None:
+        if lookup_cache.get("competition", name) is not None:
+            return
+        await self._find_or_create(
+            "/api/competitions/find-or-create", {"name": name}, "competition", name
+        )
+
+    async def update_venue_coordinates(
+        self, venue_id: int, coordinates: tuple[float, float]
+    ) -> bool:
+        try:
+            response = await self._request(
+                "PATCH",
+                f"/api/venues/{venue_id}",
+                {"latitude": coordinates[0], "longitude": coordinates[1]},
+            )
+            if response.status_code == 200:
+                logger.debug(f"{venue_id} - Venue coordinates updated via API")
+                return True
+            logger.error(
+                f"Error updating venue {venue_id} via API: {response.status_code} - {response.text}"
+            )
+        except Exception as error:
+            logger.error(f"Error updating venue {venue_id} via API: {error}")
+        return False
+
+    async def get_club_id_by_external_id(self, external_id: str) -> int | None:
+        return await self._get_id(
+            f"/api/clubs/find/{external_id}/id", "club", external_id
+        )
+
+    async def get_age_group_id_by_name(self, name: str) -> int | None:
+        return await self._get_id(f"/api/age-groups/find/{name}/id", "age_group", name)
+
+    async def get_competition_id_by_name(self, name: str) -> int | None:
+        return await self._get_id(
+            f"/api/competitions/find/{name}/id", "competition", name
+        )
+
+    async def get_venue_id_by_address(self, address: str) -> int | None:
+        return await self._get_id(
+            f"/api/venues/find/by-address/{address}/id", "venue", address
+        )
+
+    async def find_or_create_team(
+        self,
+        team_name: str,
+        club_external_id: str,
+        team_external_id: str | None = None,
+    ) -> int | None:
+        key = (team_name, club_external_id, team_external_id)
+        cached = lookup_cache.get("team", key)
+        if cached is not None:
+            return cached
+        try:
+            response = await self._request(
+                "POST",
+                "/api/teams/find-or-create",
+                {
+                    "name": team_name,
+                    "clubExternalId": club_external_id,
+                    "externalId": team_external_id,
+                },
+            )
+            if response.status_code in [200, 201]:
+                team_id = _response_id(response)
+                lookup_cache.put("team", key, team_id)
+                return team_id
+            if response.status_code == 400:
+                logger.error(f"Club with external_id {club_external_id} not found")
+            return None
+        except Exception as error:
+            logger.error(f"Error finding/creating team via API: {error}")
+            return None
+
+    async def upsert_match(
+        self,
+        url: str | MatchRecord,
+        time: Any,
+        home_team_id: int | None,
+        away_team_id: int | None,
+        venue_id: int,
+        age_group_id: int,
+        competition_id: int,
+    ) -> bool:
+        try:
+            response = await self._request(
+                "POST",
+                "/api/matches",
+                match_payload(
+                    url,
+                    time,
+                    home_team_id,
+                    away_team_id,
+                    venue_id,
+                    age_group_id,
+                    competition_id,
+                ),
+            )
+            if response.status_code in [200, 201]:
+                logger.debug("Match inserted successfully via API")
+                return True
+            logger.error(
+                f"Error inserting match via API: {response.status_code} - {response.text}"
+            )
+        except Exception as error:
+            logger.error(f"Error inserting match via API: {error}")
+        invalidate_match_references()
+        return False
+
+    async def upsert_matches(
+        self,
+        records: list[dict[str, Any]],
+        batch_size: int = DEFAULT_MATCH_BATCH_SIZE,
+    ) -> list[MatchUpsertOutcome]:
+        batch_size = min(batch_size, MAX_MATCH_BATCH_SIZE)
+        outcomes: list[MatchUpsertOutcome] = []
+        for start in range(0, len(records), batch_size):
+            batch = records[start : start + batch_size]
+            outcomes.extend(await self._upsert_match_batch(batch))
+        if not all(outcome.success for outcome in outcomes):
+            invalidate_match_references()
+        return outcomes
+
+    async def _upsert_match_batch(
+        self, batch: list[dict[str, Any]]
+    ) -> list[MatchUpsertOutcome]:
+        try:
+            response = await self._request(
+                "POST", "/api/matches/bulk", {"matches": batch}
+            )
+            if response.status_code in [404, 405]:
+                logger.debug("Bulk match endpoint not available, upserting one by one")
+                return [
+                    MatchUpsertOutcome(
+                        record["url"],
+                        await self.upsert_match(
+                            record["url"],
+                            record["time"],
+                            record["homeTeamId"],
+                            record["awayTeamId"],
+                            record["venueId"],
+                            record["ageGroupId"],
+                            record["competitionId"],
+                        ),
+                    )
+                    for record in batch
+                ]
+            if response.status_code != 200:
+                error = f"{response.status_code} - {response.text}"
+                logger.error(f"Error inserting matches via API: {error}")
+                return [MatchUpsertOutcome(r["url"], False, error=error) for r in batch]
+
+            results = response.json().get("results", [])
+        except Exception as error:
+            logger.error(f"Error inserting matches via API: {error}")
+            return [
+                MatchUpsertOutcome(r["url"], False, error=str(error)) for r in batch
+            ]
+        return bulk_upsert_outcomes(batch, results)
+
+    async def get_clubs(
+        self, post_codes: list[str] | None = None
+    ) -> list[tuple[Any, ...]]:
+        try:
+            endpoint = "/api/clubs"
+            if post_codes:
+                query = "&".join(f"PostCodes={post_code}" for post_code in post_codes)
+                endpoint += f"?{query}"
+            response = await self._request("GET", endpoint)
+            if response.status_code == 200:
+                return [
+                    (club.get("externalId"),)
+                    for club in response.json()
+                    if club.get("externalId")
+                ]
+            logger.error(
+                f"Error fetching clubs via API: {response.status_code} - {response.text}"
+            )
+        except Exception as error:
+            logger.error(f"Error fetching clubs via API: {error}")
+        return []
+
+
+class AsyncDeferredGeocoder:
+    """Async counterpart of geocoding.DeferredGeocoder"""
+
+    def __init__(
+        self, http: AsyncHttp, api: AsyncApiClient, geocoder_url: str, workers: int = 4
+    ) -> None:
+        self.http = http
+        self.api = api
+        self.geocoder_url = geocoder_url
+        self.resolved = 0
+        self._seen: set[str] = set()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._semaphore = asyncio.Semaphore(workers)
+
+    def submit(self, address: str, venue_id: int) -> None:
+        if address in self._seen:
+            return
+        self._seen.add(address)
+        get_geocode_cache().add_pending(address, venue_id)
+        self._tasks.append(asyncio.create_task(self._backfill(address, venue_id)))
+
+    def resume(self) -> int:
+        pending = get_geocode_cache().pending()
+        for address, venue_id in pending:
+            self.submit(address, venue_id)
+        if pending:
+            logger.info(f"Resuming geocoding of {len(pending)} venues")
+        return len(pending)
+
+    async def _backfill(self, address: str, venue_id: int) -> None:
+        async with self._semaphore:
+            try:
+                coordinates = await find_lat_long_online(
+                    self.http, self.geocoder_url, address
+                )
+            except Exception as e:
+                logger.error(f"Error geocoding {address}: {e}")
+                return
+            cache = get_geocode_cache()
+            if coordinates is None:
+                if cache.get(address) is not None:
+                    cache.remove_pending(address)
+            elif await self.api.update_venue_coordinates(venue_id, coordinates):
+                cache.remove_pending(address)
+                self.resolved += 1
+
+    async def finish(self) -> None:
+        await asyncio.gather(*self._tasks)
+        if self._tasks:
+            logger.info(
+                f"Geocoded {self.resolved} of {len(self._tasks)} new venues"
+                f" ({len(self._tasks) - self.resolved} without coordinates)"
+            )
+
+
+async def _create_venue(
+    http: AsyncHttp,
+    api: AsyncApiClient,
+    address: str,
+    geocoder_url: str,
+    geocoder: AsyncDeferredGeocoder | None,
+) -> int | None:
+    if geocoder is None:
+        coordinates = await find_lat_long_online(http, geocoder_url, address)
+        await api.insert_venue(address, coordinates=coordinates)
+        return await api.get_venue_id_by_address(address)
+
+    # Create the venue right away; unknown coordinates are backfilled later
+    cached = get_geocode_cache().get(address)
+    coordinates = cached.coordinates if cached is not None else None
+    await api.insert_venue(address, coordinates=coordinates)
+    venue_id = await api.get_venue_id_by_address(address)
+    if cached is None and isinstance(venue_id, int):
+        geocoder.submit(address, venue_id)
+    return venue_id
+
+
+async def _resolve_team(
+    http: AsyncHttp,
+    api: AsyncApiClient,
+    name: str,
+    club_id: str | None,
+    team_url: str | None,
+    team_external_id: str | None,
+) -> int | None:
+    if not club_id:
+        return None
+    # Check if the club exists, if not, fetch club info from team URL
+    if not await api.get_club_id_by_external_id(club_id) and team_url:
+        club_info = await fetch_club_name_from_team_url(http, team_url)
+        if club_info:
+            await api.insert_club(club_info["club_id"], club_info["club_name"], None)
+            club_id = club_info["club_id"]
+    return await api.find_or_create_team(name, club_id, team_external_id)
+
+
+async def process_match(
+    http: AsyncHttp,
+    api: AsyncApiClient,
+    match: Mapping[str, Any],
+    club_external_id: str,
+    geocoder_url: str,
+) -> None:
+    """Resolve all foreign keys of a scraped match and upsert it"""
+    record = await resolve_match(http, api, match, club_external_id, geocoder_url)
+    if record is not None:
+        await api.upsert_matches([record])
+
+
+async def resolve_match(
+    http: AsyncHttp,
+    api: AsyncApiClient,
+    match: Mapping[str, Any],
+    club_external_id: str,
+    geocoder_url: str,
+    geocoder: AsyncDeferredGeocoder | None = None,
+) -> dict[str, Any] | None:
+    """Resolve all foreign keys of a scraped match into an upsert payload"""
+    venue_id = await api.get_venue_id_by_address(match["address"])
+    if venue_id is None:
+        venue_id = await _create_venue(
+            http, api, match["address"], geocoder_url, geocoder
+        )
+
+    await api.insert_age_group(match["age_group"])
+    age_group_id = await api.get_age_group_id_by_name(match["age_group"])
+
+    await api.insert_competition(match["league"])
+    competition_id = await api.get_competition_id_by_name(match["league"])
+
+    home_team_id, away_team_id = await asyncio.gather(
+        _resolve_team(
+            http,
+            api,
+            match["home"],
+            match.get("home_club_id", club_external_id),
+            match.get("home_team_url"),
+            match.get("home_team_id"),
+        ),
+        _resolve_team(
+            http,
+            api,
+            match["away"],
+            match.get("away_club_id", club_external_id),
+            match.get("away_team_url"),
+            match.get("away_team_id"),
+        ),
+    )
+
+    if (
+        isinstance(venue_id, int)
+        and isinstance(age_group_id, int)
+        and isinstance(competition_id, int)
+    ):
+        return match_payload(
+            match["url"],
+            match["time"],
+            home_team_id,
+            away_team_id,
+            venue_id,
+            age_group_id,
+            competition_id,
+        )
+    return None
+
+
+async def find_matches(
+    from_date: str,
+    to_date: str,
+    geocoder_url: str,
+    calio_api_url: str,
+    post_codes: list[str] | None = None,
+    concurrency: int = 100,
+    batch_size: int = DEFAULT_MATCH_BATCH_SIZE,
+    defer_geocoding: bool = False,
+    geocoder_workers: int = 4,
+    state: CrawlState | None = None,
+    checkpoint: Checkpoint | None = None,
+    shard: Shard | None = None,
+    prioritize: bool = False,
+    max_clubs: int | None = None,
+    time_budget: float | None = None,
+    window_days: int | None = None,
+) -> None:
+    """Async counterpart of match_finder.main"""
+    lookup_cache.clear()
+    async with AsyncHttp(
+        limit=max(100, concurrency), limit_per_host=concurrency
+    ) as http:
+        api = AsyncApiClient(http, calio_api_url)
+        if not await api.available():
+            return
+
+        clubs = await api.get_clubs(post_codes=post_codes)
+        logger.info("Found " + str(len(clubs)) + " clubs...")
+        clubs = plan_crawl(clubs, shard, checkpoint, state, prioritize, max_clubs)
+        deadline = time.monotonic() + time_budget if time_budget else None
+        progress = CrawlProgress(len(clubs), checkpoint, deadline)
+        semaphore = asyncio.Semaphore(concurrency)
+        geocoder = None
+        if defer_geocoding:
+            geocoder = AsyncDeferredGeocoder(
+                http, api, geocoder_url, workers=geocoder_workers
+            )
+            geocoder.resume()
+
+        async def crawl(club_external_id: str) -> None:
+            async with semaphore:
+                if progress.out_of_time():
+                    progress.defer()
+                    return
+                failed = False
+                unsaved = 0
+                try:
+                    known = (
+                        known_window_fingerprints(
+                            state, club_external_id, from_date, to_date, window_days
+                        )
+                        if state is not None
+                        else None
+                    )
+                    schedule = await fetch_club_windows(
+                        http, club_external_id, from_date, to_date, window_days, known
+                    )
+                    if schedule.matches is None and state is not None:
+                        state.count_skipped()
+                        state.record_crawl(club_external_id, schedule.fingerprint, None)
+                        progress.advance(item=club_external_id)
+                        return
+                    matches = schedule.matches or []
+                    records = []
+                    for match in matches:
+                        record = await resolve_match(
+                            http, api, match, club_external_id, geocoder_url, geocoder
+                        )
+                        if record is not None:
+                            records.append(record)
+                    outcomes = await api.upsert_matches(records, batch_size)
+                    failed_records = sum(not outcome.success for outcome in outcomes)
+                    if failed_records:
+                        logger.warning(
+                            f"{failed_records} of {len(records)} matches of club {club_external_id} were not saved"
+                        )
+                    unsaved = len(matches) - len(records) + failed_records
+                    if state is not None:
+                        if not unsaved:
+                            save_window_fingerprints(
+                                state, club_external_id, schedule.fingerprints
+                            )
+                        state.record_crawl(
+                            club_external_id, schedule.fingerprint, len(matches)
+                        )
+                except Exception as e:
+                    logger.error(f"Error processing club {club_external_id}: {e}")
+                    failed = True
+                progress.advance(
+                    failed=failed, item=club_external_id, complete=not unsaved
+                )
+
+        try:
+            await asyncio.gather(*(crawl(club[0]) for club in clubs))
+        finally:
+            if checkpoint is not None:
+                checkpoint.flush()
+        if geocoder is not None:
+            await geocoder.finish()
+    finish_crawl(progress, checkpoint, state)
+    logger.info("Finished processing all clubs.")
+
+
+async def find_clubs(
+    postal_codes: Iterable[str],
+    calio_api_url: str,
+    concurrency: int = 20,
+    state: CrawlState | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> tuple[int, int]:
+    """Async counterpart of club_finder.main for many postal codes; returns (processed, errors)
+
+    Postal codes are consumed as they are crawled, at most twice the
+    concurrency ahead of the finished ones.
+    """
+    async with AsyncHttp(
+        limit=max(100, concurrency), limit_per_host=concurrency
+    ) as http:
+        api = AsyncApiClient(http, calio_api_url)
+        if not await api.available():
+            return 0, sum(1 for _ in postal_codes)
+
+        semaphore = asyncio.Semaphore(concurrency)
+        processed = 0
+        errors = 0
+
+        async def crawl(postal_code: str) -> None:
+            nonlocal processed, errors
+            async with semaphore:
+                try:
+                    logger.info(f"Finding clubs for postal code: {postal_code}")
+                    html = await fetch_all_clubs_for_post_code(http, postal_code)
+                    clubs = await asyncio.to_thread(extract_clubs, html, postal_code)
+                    club_fingerprint = club_list_fingerprint(clubs)
+                    if (
+                        state is not None
+                        and state.known_fingerprint("clubs", postal_code)
+                        == club_fingerprint
+                    ):
+                        logger.info(f"Club list of {postal_code} unchanged")
+                        state.count_skipped()
+                    else:
+                        saved = await asyncio.gather(
+                            *(
+                                api.insert_club(external_id, club_name, postal_code)
+                                for external_id, club_name in clubs
+                            )
+                        )
+                        if state is not None and all(saved):
+                            state.put("clubs", postal_code, club_fingerprint)
+                    processed += 1
+                    if checkpoint is not None:
+                        checkpoint.mark(postal_code)
+                except Exception as e:
+                    logger.error(f"Error during club search for {postal_code}: {e}")
+                    errors += 1
+
+        tasks: set[asyncio.Task[None]] = set()
+        try:
+            for postal_code in postal_codes:
+                if len(tasks) >= 2 * concurrency:
+                    _, tasks = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                tasks.add(asyncio.create_task(crawl(postal_code)))
+            if tasks:
+                await asyncio.wait(tasks)
+        finally:
+            if checkpoint is not None:
+                checkpoint.flush()
+    return processed, errors
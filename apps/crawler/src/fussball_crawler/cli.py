@@ -5,14 +5,27 @@ Provides a user-friendly command-line interface for finding clubs by postal code
 """
 
 import argparse
+import asyncio
+import itertools
 import os
 import re
 import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import date
+from typing import TextIO
 
+from . import api_client
+from .api_client import DEFAULT_MATCH_BATCH_SIZE, MAX_MATCH_BATCH_SIZE
 from .club_finder import main as find_clubs_main
+from .crawl_state import Checkpoint, CrawlState, default_state_path
 from .logger import get_logger, setup_logging
 from .match_finder import main as find_matches_main
+from .parsers import PARSER_CHOICES, PARSER_ENV_VAR, configure_parser
+from .rate_limit import configure_rate_limits
+from .scraper import configure_http_cache
+from .sharding import Shard, parse_shard
+from .transport import TransportConfig, configure_transport
 
 
 def validate_postal_code(postal_code: str) -> bool:
@@ -20,64 +33,300 @@ def validate_postal_code(postal_code: str) -> bool:
     return bool(re.match(r"^\d{5}$", postal_code))
 
 
+def positive_int(value: str) -> int:
+    """argparse type for options that need a count of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
+
+
+def batch_size(value: str) -> int:
+    """argparse type for --batch-size, capped at the bulk endpoint's limit."""
+    number = positive_int(value)
+    if number > MAX_MATCH_BATCH_SIZE:
+        raise argparse.ArgumentTypeError(
+            f"must be at most {MAX_MATCH_BATCH_SIZE}: {value}"
+        )
+    return number
+
+
+def state_path(args: argparse.Namespace) -> str:
+    return getattr(args, "state_file", None) or default_state_path()
+
+
+def open_crawl_state(args: argparse.Namespace) -> CrawlState | None:
+    """
+    The crawl state of an --incremental or prioritized run, or None. Only
+    --incremental skips unchanged content; both record crawl history.
+    """
+    incremental = getattr(args, "incremental", False)
+    prioritized = getattr(args, "prioritize", False) or getattr(args, "max_clubs", None)
+    if not incremental and not prioritized:
+        return None
+    return CrawlState(state_path(args), skip_unchanged=incremental)
+
+
+def open_checkpoint(args: argparse.Namespace, run: str) -> Checkpoint | None:
+    """
+    The checkpoint of a run with --resume or --state-file, or None; starts it
+    over unless --resume was given.
+    """
+    if not getattr(args, "resume", False) and not getattr(args, "state_file", None):
+        return None
+    checkpoint = Checkpoint(state_path(args), run)
+    if not getattr(args, "resume", False):
+        checkpoint.reset()
+    return checkpoint
+
+
+def close_state(state: CrawlState | None, checkpoint: Checkpoint | None) -> None:
+    """Close the crawl state and checkpoint a command opened."""
+    if checkpoint is not None:
+        checkpoint.close()
+    if state is not None:
+        state.close()
+
+
+def non_negative_int(value: str) -> int:
+    """argparse type for counts that may be zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative: {value}")
+    return number
+
+
+def positive_float(value: str) -> float:
+    """argparse type for durations in seconds."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: {value}") from None
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0: {value}")
+    return number
+
+
+def shard_spec(value: str) -> Shard:
+    """argparse type for --shard K/N."""
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def run_key(args: argparse.Namespace, run: str) -> str:
+    """Checkpoint key of a run; shards of one run are checkpointed separately."""
+    return f"{run}/shard {args.shard}" if args.shard else run
+
+
+def read_postal_codes(lines: TextIO) -> Iterator[str]:
+    """Postal codes from lines of text as they are read, skipping empty lines"""
+    for line in lines:
+        postal_code = line.strip()
+        if postal_code:
+            yield postal_code
+
+
+def skip_completed_codes(
+    postal_codes: Iterable[str], completed: set[str]
+) -> Iterator[str]:
+    """The postal codes a previous run of the checkpoint did not complete"""
+    skipped = 0
+    for postal_code in postal_codes:
+        if postal_code in completed:
+            skipped += 1
+            continue
+        yield postal_code
+    if skipped:
+        get_logger(__name__).info(f"Resuming: {skipped} postal codes already completed")
+
+
 def find_clubs_command(args: argparse.Namespace) -> int:
     """Handle the find-clubs command."""
     logger = get_logger(__name__)
 
-    postal_codes = []
-
+    postal_codes: Iterator[str]
     if args.postal_code:
-        postal_codes = [args.postal_code]
+        postal_codes = iter([args.postal_code])
     else:
-        # Read postal codes from stdin
+        # Stream postal codes from stdin
+        postal_codes = read_postal_codes(sys.stdin)
         try:
-            import sys
-
-            for line in sys.stdin:
-                postal_code = line.strip()
-                if postal_code:  # Skip empty lines
-                    postal_codes.append(postal_code)
+            first = next(postal_codes, None)
         except KeyboardInterrupt:
             logger.info("Operation cancelled by user")
             return 130
 
-        if not postal_codes:
+        if first is None:
             logger.error("No postal codes provided via argument or stdin")
             return 1
+        postal_codes = itertools.chain([first], postal_codes)
+
+    if args.shard:
+        logger.info(f"Shard {args.shard}: processing its share of the postal codes")
+        postal_codes = (code for code in postal_codes if args.shard.owns(code))
+
+    state = open_crawl_state(args)
+    checkpoint = open_checkpoint(args, run_key(args, "find-clubs"))
+    completed = checkpoint.completed() if checkpoint is not None else set()
+    if completed:
+        postal_codes = skip_completed_codes(postal_codes, completed)
+    try:
+        return _find_clubs(args, postal_codes, state, checkpoint)
+    finally:
+        close_state(state, checkpoint)
+
+
+def _check_postal_code(postal_code: str) -> bool:
+    """Validate a postal code, logging an error for an invalid one."""
+    if validate_postal_code(postal_code):
+        return True
+    get_logger(__name__).error(
+        f"Invalid postal code format: {postal_code}. Expected 5 digits (e.g., 01099)"
+    )
+    return False
+
+
+def _find_clubs(
+    args: argparse.Namespace,
+    postal_codes: Iterable[str],
+    state: CrawlState | None,
+    checkpoint: Checkpoint | None,
+) -> int:
+    logger = get_logger(__name__)
 
     # Process each postal code
     total_processed = 0
     total_errors = 0
 
-    for postal_code in postal_codes:
-        # Validate postal code format
-        if not validate_postal_code(postal_code):
-            logger.error(
-                f"Invalid postal code format: {postal_code}. Expected 5 digits (e.g., 01099)"
-            )
-            total_errors += 1
-            continue
+    # One connection per worker; the API is checked once, not per postal code.
+    # Without it the codes are only validated, whichever engine was chosen
+    configure_transport(pool_size=args.workers)
+    api_client.get_client(args.api_url)
+    if not api_client.available():
+        logger.error("Calcio API not available; postal codes are only validated")
+        try:
+            for postal_code in postal_codes:
+                if _check_postal_code(postal_code):
+                    total_processed += 1
+                else:
+                    total_errors += 1
+        except KeyboardInterrupt:
+            logger.info("Operation cancelled by user")
+            return 130
+        logger.info(
+            f"Completed processing {total_processed} postal codes ({total_errors} errors)"
+        )
+        return 1 if total_errors > 0 else 0
+
+    if args.engine == "async":
+        invalid = 0
+
+        def valid_codes() -> Iterator[str]:
+            nonlocal invalid
+            for postal_code in postal_codes:
+                if _check_postal_code(postal_code):
+                    yield postal_code
+                else:
+                    invalid += 1
 
         try:
-            logger.info(f"Finding clubs for postal code: {postal_code}")
-            find_clubs_main(
-                postal_code=postal_code,
-                calio_api_url=args.api_url,
+            from .async_engine import find_clubs
+
+            processed, errors = asyncio.run(
+                find_clubs(
+                    valid_codes(),
+                    args.api_url,
+                    concurrency=args.workers,
+                    state=state,
+                    checkpoint=checkpoint,
+                )
             )
-            total_processed += 1
         except KeyboardInterrupt:
             logger.info("Operation cancelled by user")
             return 130
-        except Exception as e:
-            logger.error(f"Error during club search for {postal_code}: {e}")
-            total_errors += 1
+        except RuntimeError as e:
+            logger.error(str(e))
+            return 1
+        total_processed += processed
+        total_errors += errors + invalid
+    else:
+
+        def find_clubs_for(postal_code: str) -> bool:
+            if not _check_postal_code(postal_code):
+                return False
+            try:
+                logger.info(f"Finding clubs for postal code: {postal_code}")
+                find_clubs_main(
+                    postal_code=postal_code,
+                    calio_api_url=args.api_url,
+                    state=state,
+                    check_api=False,
+                )
+            except Exception as e:
+                logger.error(f"Error during club search for {postal_code}: {e}")
+                return False
+            if checkpoint is not None:
+                checkpoint.mark(postal_code)
+            return True
+
+        try:
+            for succeeded in map_in_parallel(
+                find_clubs_for, postal_codes, args.workers
+            ):
+                if succeeded:
+                    total_processed += 1
+                else:
+                    total_errors += 1
+        except KeyboardInterrupt:
+            logger.info("Operation cancelled by user")
+            return 130
 
     logger.info(
         f"Completed processing {total_processed} postal codes ({total_errors} errors)"
     )
+    if state is not None:
+        logger.info(f"Skipped {state.skipped} postal codes with unchanged club lists")
+    if total_errors == 0 and checkpoint is not None:
+        checkpoint.reset()
     return 1 if total_errors > 0 else 0
 
 
+def map_in_parallel(
+    function: Callable[[str], bool], items: Iterable[str], workers: int
+) -> Iterator[bool]:
+    """
+    Results of function for every item, in completion order, computed by a
+    pool of workers. Items are consumed as workers become free, so at most
+    twice as many as there are workers are in memory at once.
+    """
+    if workers <= 1:
+        yield from map(function, items)
+        return
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="postal-code")
+    pending: set[Future[bool]] = set()
+    try:
+        for item in items:
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+            pending.add(executor.submit(function, item))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
 def find_matches_command(args: argparse.Namespace) -> int:
     """Handle the find-matches command."""
     logger = get_logger(__name__)
@@ -94,6 +343,8 @@ def find_matches_command(args: argparse.Namespace) -> int:
         from_date = args.from_date
         to_date = args.to_date
 
+    state = None
+    checkpoint = None
     try:
         logger.info(f"Finding matches for all clubs from {from_date} to {to_date}...")
         # Collect post codes filter if provided
@@ -130,13 +381,55 @@ def find_matches_command(args: argparse.Namespace) -> int:
             except Exception as e:
                 logger.error(f"Error reading postal codes file {args.post_codes}: {e}")
                 return 1
-        find_matches_main(
-            from_date,
-            to_date,
-            args.geocoder_url,
-            args.api_url,
-            post_codes,
+        state = open_crawl_state(args)
+        checkpoint = open_checkpoint(
+            args, run_key(args, f"find-matches/{from_date}/{to_date}")
         )
+        time_budget = args.time_budget * 60 if args.time_budget else None
+        if args.engine == "async":
+            from .async_engine import find_matches
+
+            asyncio.run(
+                find_matches(
+                    from_date,
+                    to_date,
+                    args.geocoder_url,
+                    args.api_url,
+                    post_codes,
+                    concurrency=args.workers,
+                    batch_size=args.batch_size,
+                    defer_geocoding=args.defer_geocoding,
+                    geocoder_workers=args.geocoder_workers,
+                    state=state,
+                    checkpoint=checkpoint,
+                    shard=args.shard,
+                    prioritize=args.prioritize,
+                    max_clubs=args.max_clubs,
+                    time_budget=time_budget,
+                    window_days=args.window_days,
+                )
+            )
+        else:
+            find_matches_main(
+                from_date,
+                to_date,
+                args.geocoder_url,
+                args.api_url,
+                post_codes,
+                workers=args.workers,
+                processes=args.processes,
+                queue_size=args.queue_size,
+                batch_size=args.batch_size,
+                defer_geocoding=args.defer_geocoding,
+                geocoder_workers=args.geocoder_workers,
+                state=state,
+                checkpoint=checkpoint,
+                shard=args.shard,
+                prioritize=args.prioritize,
+                max_clubs=args.max_clubs,
+                time_budget=time_budget,
+                window_days=args.window_days,
+            )
         logger.info("Match finding completed successfully")
         return 0
     except KeyboardInterrupt:
@@ -145,6 +438,92 @@ def find_matches_command(args: argparse.Namespace) -> int:
     except Exception as e:
         logger.error(f"Error during match finding: {e}")
         return 1
+    finally:
+        close_state(state, checkpoint)
+
+
+def add_parser_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the HTML parser backend option to a subcommand."""
+    parser.add_argument(
+        "--parser",
+        choices=PARSER_CHOICES,
+        help=f"HTML parser backend (default: ${PARSER_ENV_VAR} or auto, which prefers lxml if installed)",
+    )
+
+
+def add_http_cache_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the option to bypass the on-disk HTTP cache to a subcommand."""
+    parser.add_argument(
+        "--no-http-cache",
+        action="store_true",
+        help="Always download fussball.de pages instead of using the on-disk HTTP cache",
+    )
+
+
+def add_transport_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add timeout and retry options of the HTTP transport to a subcommand."""
+    defaults = TransportConfig()
+    parser.add_argument(
+        "--connect-timeout",
+        type=positive_float,
+        default=defaults.connect_timeout,
+        help=f"Seconds to wait for a connection (default: {defaults.connect_timeout:g})",
+    )
+    parser.add_argument(
+        "--read-timeout",
+        type=positive_float,
+        default=defaults.read_timeout,
+        help=f"Seconds to wait for response data (default: {defaults.read_timeout:g})",
+    )
+    parser.add_argument(
+        "--retries",
+        type=non_negative_int,
+        default=defaults.retries,
+        help=f"Retries with jittered backoff on connection errors, 429 and 5xx (default: {defaults.retries})",
+    )
+    parser.add_argument(
+        "--no-rate-limit",
+        action="store_true",
+        help="Disable the adaptive per-host request rate and concurrency limits",
+    )
+
+
+def add_shard_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the option to crawl only one shard of the work to a subcommand."""
+    parser.add_argument(
+        "--shard",
+        type=shard_spec,
+        metavar="K/N",
+        help="Only process shard K of N (1 <= K <= N), split by a stable hash of postal code or club ID",
+    )
+
+
+def add_state_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that use the crawl state file to a subcommand."""
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip pages whose content is unchanged since the last fully saved run",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip work an interrupted run of the same command (and dates) completed",
+    )
+    parser.add_argument(
+        "--state-file",
+        help="SQLite file for --incremental fingerprints and run checkpoints (default: state.sqlite3 in the cache dir)",
+    )
+
+
+def add_engine_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the I/O engine option to a subcommand."""
+    parser.add_argument(
+        "--engine",
+        choices=("sync", "async"),
+        default="sync",
+        help="I/O engine: threads with requests (sync) or asyncio with aiohttp (async, needs the async extra); default: sync",
+    )
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -172,8 +551,18 @@ Examples:
   %(prog)s find-matches                   # Find matches for all clubs (today's date)
   %(prog)s find-matches --verbose         # Find matches with verbose logging
   %(prog)s find-matches --from-date 2025-08-01 --to-date 2025-08-31  # Custom date range
+  %(prog)s find-matches --workers 8       # Crawl 8 clubs in parallel
+  %(prog)s find-matches --workers 16 --processes 8  # Parse pages on 8 processes
+  %(prog)s find-matches --engine async --workers 200  # 200 clubs in flight on asyncio
+  %(prog)s find-matches --workers 8 --defer-geocoding  # Geocode new venues in the background
+  %(prog)s find-matches --incremental     # Skip clubs whose schedule did not change
+  %(prog)s find-matches --resume          # Continue an interrupted run
+  %(prog)s find-matches --shard 2/4       # Crawl the second quarter of all clubs
+  %(prog)s find-matches --max-clubs 500 --time-budget 30  # Refresh the 500 likeliest changed clubs within 30 minutes
+  %(prog)s find-matches --from-date 2025-07-01 --to-date 2026-06-30 --window-days 7  # A whole season, week by week
   %(prog)s find-matches --geocoder-url http://localhost:2322/api --api-url http://localhost:5149/api  # Use custom API endpoints
   cat postcodes.csv | %(prog)s find-clubs # Process multiple postal codes from stdin
+  cat postcodes.csv | %(prog)s find-clubs --workers 8  # Search 8 postal codes in parallel
         """,
     )
 
@@ -201,6 +590,18 @@ Examples:
         default="http://localhost:5149",
         help="Calcio api endpoint",
     )
+    find_clubs_parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=1,
+        help="Number of postal codes to search in parallel (default: 1)",
+    )
+    add_engine_argument(find_clubs_parser)
+    add_state_arguments(find_clubs_parser)
+    add_shard_argument(find_clubs_parser)
+    add_transport_arguments(find_clubs_parser)
+    add_http_cache_argument(find_clubs_parser)
+    add_parser_argument(find_clubs_parser)
     find_clubs_parser.set_defaults(func=find_clubs_command)
 
     # find-matches subcommand - inherits from parent parser
@@ -234,6 +635,68 @@ Examples:
         "--post-codes",
         help="Optional file containing postal codes (one per line) to filter clubs",
     )
+    find_matches_parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=1,
+        help="Number of clubs to crawl in parallel; with --engine async, the number of clubs in flight (default: 1)",
+    )
+    find_matches_parser.add_argument(
+        "--processes",
+        type=non_negative_int,
+        default=0,
+        help="Run as a pipeline with this many parse processes; --workers then sets the download/write threads (default: 0, no pipeline)",
+    )
+    find_matches_parser.add_argument(
+        "--queue-size",
+        type=positive_int,
+        default=32,
+        help="Capacity of the queues between pipeline stages (default: 32)",
+    )
+    find_matches_parser.add_argument(
+        "--batch-size",
+        type=batch_size,
+        default=DEFAULT_MATCH_BATCH_SIZE,
+        help=f"Number of matches per bulk upsert request, at most {MAX_MATCH_BATCH_SIZE} (default: {DEFAULT_MATCH_BATCH_SIZE})",
+    )
+    find_matches_parser.add_argument(
+        "--defer-geocoding",
+        action="store_true",
+        help="Create new venues without coordinates and geocode them in the background",
+    )
+    find_matches_parser.add_argument(
+        "--geocoder-workers",
+        type=positive_int,
+        default=4,
+        help="Concurrent geocoder requests with --defer-geocoding (default: 4)",
+    )
+    find_matches_parser.add_argument(
+        "--window-days",
+        type=positive_int,
+        help="Fetch each club's date range in windows of this many days, in parallel; a page holds at most 999 matches",
+    )
+    add_engine_argument(find_matches_parser)
+    add_state_arguments(find_matches_parser)
+    find_matches_parser.add_argument(
+        "--prioritize",
+        action="store_true",
+        help="Crawl clubs whose schedules change most often, have most matches and were crawled longest ago first (history kept in the state file)",
+    )
+    find_matches_parser.add_argument(
+        "--max-clubs",
+        type=positive_int,
+        help="Crawl at most this many clubs, by priority (implies --prioritize)",
+    )
+    find_matches_parser.add_argument(
+        "--time-budget",
+        type=positive_float,
+        metavar="MINUTES",
+        help="Start no new clubs after this many minutes; combine with --resume to continue later",
+    )
+    add_shard_argument(find_matches_parser)
+    add_transport_arguments(find_matches_parser)
+    add_http_cache_argument(find_matches_parser)
+    add_parser_argument(find_matches_parser)
     find_matches_parser.set_defaults(func=find_matches_command)
 
     return parser
@@ -263,6 +726,15 @@ def main() -> int:
         os.environ["LOG_LEVEL"] = "INFO"
 
     setup_logging()
+    configure_parser(getattr(args, "parser", None))
+    configure_http_cache(not getattr(args, "no_http_cache", False))
+    if hasattr(args, "retries"):
+        configure_transport(
+            connect_timeout=args.connect_timeout,
+            read_timeout=args.read_timeout,
+            retries=args.retries,
+        )
+        configure_rate_limits(not args.no_rate_limit)
 
     # Handle case where no subcommand is provided
     if not hasattr(args, "func"):
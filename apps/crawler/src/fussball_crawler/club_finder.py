@@ -1,40 +1,34 @@
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from . import api_client
+from .crawl_state import CrawlState, club_list_fingerprint
 from .logger import get_logger, setup_logging
+from .parsers import make_soup
 from .scraper import fetch_all_clubs_for_post_code
 
 
-def main(postal_code: str, calio_api_url: str) -> None:
-    setup_logging()
+def get_clubs(text: str, postal_code: str) -> list[tuple[str, str]]:
+    """Extract (external_id, name) of every club in a club search page"""
     logger = get_logger(__name__)
-
-    api_client.get_client(calio_api_url)
-
-    api_available = api_client.available()
-    if not api_available:
-        return
-
-    # Use the new function that handles load-more
-    text = fetch_all_clubs_for_post_code(postal_code)
-    soup = BeautifulSoup(text, "html.parser")
+    soup = make_soup(text)
 
     # Get club list
     club_list = soup.find_all(id="clublist")
     if len(club_list) == 0:
-        return
+        return []
 
     # Check if first element is a Tag and has ul attribute
     if not club_list or not isinstance(club_list[0], Tag):
         logger.warning(f"Club list element is not a Tag for postal code: {postal_code}")
-        return
+        return []
 
     ul_element = club_list[0].find("ul")  # type: ignore[union-attr]
     if not ul_element or not isinstance(ul_element, Tag):
         logger.warning(f"UL element not found for postal code: {postal_code}")
-        return
+        return []
 
     # Get link and name of every club
+    clubs = []
     for club in ul_element.find_all("li"):  # type: ignore[union-attr]
         if not isinstance(club, Tag):
             continue
@@ -54,4 +48,42 @@ def main(postal_code: str, calio_api_url: str) -> None:
         if not club_name:
             logger.error("Club name is empty for external_id: %s", external_id)
             continue
+        clubs.append((external_id, club_name))
+    return clubs
+
+
+def main(
+    postal_code: str,
+    calio_api_url: str,
+    state: CrawlState | None = None,
+    check_api: bool = True,
+) -> None:
+    """Upsert the clubs of a postal code; with a crawl state, skip an unchanged list.
+
+    Callers that checked the API once for many postal codes pass check_api=False.
+    """
+    setup_logging()
+
+    api_client.get_client(calio_api_url)
+
+    if check_api and not api_client.available():
+        return
+
+    # Use the new function that handles load-more
+    text = fetch_all_clubs_for_post_code(postal_code)
+    clubs = get_clubs(text, postal_code)
+    club_fingerprint = club_list_fingerprint(clubs)
+    if (
+        state is not None
+        and state.known_fingerprint("clubs", postal_code) == club_fingerprint
+    ):
+        get_logger(__name__).info(f"Club list of {postal_code} unchanged")
+        state.count_skipped()
+        return
+
+    saved = [
         api_client.insert_club(external_id, club_name, postal_code)
+        for external_id, club_name in clubs
+    ]
+    if state is not None and all(saved):
+        state.put("clubs", postal_code, club_fingerprint)
@@ -0,0 +1,227 @@
+"""Local state that lets repeated crawls skip work that did not change."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import NamedTuple
+
+from .font_cache import default_cache_dir
+
+
+def fingerprint(text: str) -> str:
+    """Stable digest of page content."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def club_list_fingerprint(clubs: list[tuple[str, str]]) -> str:
+    """Digest of a postal code's clubs, independent of their order on the page."""
+    return fingerprint("\n".join(f"{i}\t{name}" for i, name in sorted(clubs)))
+
+
+def schedule_key(club_external_id: str, from_date: str, to_date: str) -> str:
+    """State key of a club's schedule for one date window."""
+    return f"{club_external_id}/{from_date}/{to_date}"
+
+
+class ClubHistory(NamedTuple):
+    """How a club's schedule behaved over past crawls."""
+
+    crawls: int
+    changes: int
+    matches: int
+    crawled_at: float
+
+
+class CrawlState:
+    """
+    SQLite store of content fingerprints, grouped into scopes ("schedule" per
+    club and date window, "clubs" per postal code). A fingerprint is only
+    recorded once its content was fully written to the API, so anything that
+    failed is retried on the next run. Also keeps each club's crawl history
+    for the scheduler. Without a path the store lives in memory.
+
+    With skip_unchanged=False fingerprints are still recorded, but
+    known_fingerprint() never reports one, so nothing is skipped.
+    """
+
+    def __init__(self, path: str | None = None, skip_unchanged: bool = True) -> None:
+        self.logger = logging.getLogger("CrawlState")
+        self.path = path
+        self.skip_unchanged = skip_unchanged
+        self.skipped = 0
+        self._lock = threading.Lock()
+        if path is not None:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints ("
+                "scope TEXT NOT NULL, key TEXT NOT NULL, fingerprint TEXT NOT NULL, "
+                "updated_at REAL NOT NULL, PRIMARY KEY (scope, key))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS club_history ("
+                "club TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, "
+                "crawls INTEGER NOT NULL, changes INTEGER NOT NULL, "
+                "matches INTEGER NOT NULL, crawled_at REAL NOT NULL)"
+            )
+
+    def get(self, scope: str, key: str) -> str | None:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT fingerprint FROM fingerprints WHERE scope = ? AND key = ?",
+                    (scope, key),
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning("Failed to read crawl state: %s", e)
+            return None
+        return row[0] if row else None
+
+    def known_fingerprint(self, scope: str, key: str) -> str | None:
+        """The fingerprint to compare new content against, if skipping is on."""
+        return self.get(scope, key) if self.skip_unchanged else None
+
+    def put(self, scope: str, key: str, value: str) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO fingerprints "
+                    "(scope, key, fingerprint, updated_at) VALUES (?, ?, ?, ?)",
+                    (scope, key, value, time.time()),
+                )
+        except sqlite3.Error as e:
+            self.logger.warning("Failed to persist crawl state for %s: %s", key, e)
+
+    def forget(self, scope: str, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM fingerprints WHERE scope = ? AND key = ?", (scope, key)
+            )
+
+    def record_crawl(
+        self, club_external_id: str, schedule_fingerprint: str, matches: int | None
+    ) -> None:
+        """Add a crawl to a club's history; matches is None if it was not parsed."""
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT fingerprint, crawls, changes, matches FROM club_history "
+                    "WHERE club = ?",
+                    (club_external_id,),
+                ).fetchone()
+                crawls, changes, previous_matches = row[1:] if row else (0, 0, 0)
+                changed = row is not None and row[0] != schedule_fingerprint
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO club_history "
+                    "(club, fingerprint, crawls, changes, matches, crawled_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        club_external_id,
+                        schedule_fingerprint,
+                        crawls + 1,
+                        changes + changed,
+                        previous_matches if matches is None else matches,
+                        time.time(),
+                    ),
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(
+                "Failed to record crawl of club %s: %s", club_external_id, e
+            )
+
+    def histories(self) -> dict[str, ClubHistory]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT club, crawls, changes, matches, crawled_at FROM club_history"
+            ).fetchall()
+        return {row[0]: ClubHistory(*row[1:]) for row in rows}
+
+    def count_skipped(self) -> None:
+        with self._lock:
+            self.skipped += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def default_state_path() -> str:
+    return os.path.join(default_cache_dir(), "state.sqlite3")
+
+
+class Checkpoint:
+    """
+    Completed work items (postal codes or club IDs) of one run, so an
+    interrupted run can be resumed. Items are buffered and written in
+    batches; call flush() before exiting.
+    """
+
+    def __init__(
+        self,
+        path: str | None,
+        run: str,
+        flush_every: int = 50,
+        flush_interval: float = 10.0,
+    ) -> None:
+        self.logger = logging.getLogger("Checkpoint")
+        self.run = run
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._pending: list[str] = []
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+        if path is not None:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                "run TEXT NOT NULL, item TEXT NOT NULL, PRIMARY KEY (run, item))"
+            )
+
+    def completed(self) -> set[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item FROM checkpoints WHERE run = ?", (self.run,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def reset(self) -> None:
+        """Forget the run's completed items, e.g. when starting it over."""
+        with self._lock, self._conn:
+            self._pending.clear()
+            self._conn.execute("DELETE FROM checkpoints WHERE run = ?", (self.run,))
+
+    def mark(self, item: str) -> None:
+        with self._lock:
+            self._pending.append(item)
+            due = (
+                len(self._pending) >= self.flush_every
+                or time.monotonic() - self._flushed_at >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._flushed_at = time.monotonic()
+            if not pending:
+                return
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO checkpoints (run, item) VALUES (?, ?)",
+                        [(self.run, item) for item in pending],
+                    )
+            except sqlite3.Error as e:
+                self.logger.warning("Failed to write checkpoint of %s: %s", self.run, e)
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._conn.close()
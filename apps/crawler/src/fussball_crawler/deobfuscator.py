@@ -1,36 +1,267 @@
+import hashlib
+import html as html_lib
+import io
 import logging
+import mmap
 import os
-import tempfile
-from collections.abc import Callable
-from typing import Any
+import re
+from collections.abc import Callable, Iterator
+from typing import Any, Literal
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 from fontTools.ttLib import TTFont  # type: ignore[import-untyped]
 
-FontFetchResult = tuple[str, bool]  # (path_to_font_file, remove_after_use)
-FontFetcher = Callable[[str], FontFetchResult]
+from .font_cache import FontMappingCache
+from .parsers import get_parser, resolve_parser
+from .translation import CharTranslator
+from .transport import get_session
 
+_GLYPH_TO_CHAR = {
+    # Numbers
+    "zero": "0",
+    "one": "1",
+    "two": "2",
+    "three": "3",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9",
+    # Punctuation
+    "comma": ",",
+    "period": ".",
+    "colon": ":",
+    "space": " ",
+    "hyphen": "-",
+    "minus": "-",
+    "bar": "|",
+    "pipe": "|",
+    # German characters
+    "germandbls": "ß",
+    "adieresis": "ä",
+    "odieresis": "ö",
+    "udieresis": "ü",
+    "Adieresis": "Ä",
+    "Odieresis": "Ö",
+    "Udieresis": "Ü",
+    # Accented characters - lowercase
+    "aacute": "á",
+    "agrave": "à",
+    "acircumflex": "â",
+    "atilde": "ã",
+    "aring": "å",
+    "eacute": "é",
+    "egrave": "è",
+    "ecircumflex": "ê",
+    "edieresis": "ë",
+    "iacute": "í",
+    "igrave": "ì",
+    "icircumflex": "î",
+    "idieresis": "ï",
+    "oacute": "ó",
+    "ograve": "ò",
+    "ocircumflex": "ô",
+    "otilde": "õ",
+    "oslash": "ø",
+    "uacute": "ú",
+    "ugrave": "ù",
+    "ucircumflex": "û",
+    "yacute": "ý",
+    "ydieresis": "ÿ",
+    "ccedilla": "ç",
+    "ntilde": "ñ",
+    "ae": "æ",
+    "oe": "œ",
+    # Accented characters - uppercase
+    "Aacute": "Á",
+    "Agrave": "À",
+    "Acircumflex": "Â",
+    "Atilde": "Ã",
+    "Aring": "Å",
+    "Eacute": "É",
+    "Egrave": "È",
+    "Ecircumflex": "Ê",
+    "Edieresis": "Ë",
+    "Iacute": "Í",
+    "Igrave": "Ì",
+    "Icircumflex": "Î",
+    "Idieresis": "Ï",
+    "Oacute": "Ó",
+    "Ograve": "Ò",
+    "Ocircumflex": "Ô",
+    "Otilde": "Õ",
+    "Oslash": "Ø",
+    "Uacute": "Ú",
+    "Ugrave": "Ù",
+    "Ucircumflex": "Û",
+    "Yacute": "Ý",
+    "Ydieresis": "Ÿ",
+    "Ccedilla": "Ç",
+    "Ntilde": "Ñ",
+    "AE": "Æ",
+    "OE": "Œ",
+    # Eastern European characters
+    "scaron": "š",
+    "Scaron": "Š",
+    "zcaron": "ž",
+    "Zcaron": "Ž",
+    "cacute": "ć",
+    "Cacute": "Ć",
+    "ccaron": "č",
+    "Ccaron": "Č",
+    "dcaron": "ď",
+    "Dcaron": "Ď",
+    "ecaron": "ě",
+    "Ecaron": "Ě",
+    "lacute": "ĺ",
+    "Lacute": "Ĺ",
+    "lcaron": "ľ",
+    "Lcaron": "Ľ",
+    "nacute": "ń",
+    "Nacute": "Ń",
+    "ncaron": "ň",
+    "Ncaron": "Ň",
+    "racute": "ŕ",
+    "Racute": "Ŕ",
+    "rcaron": "ř",
+    "Rcaron": "Ř",
+    "sacute": "ś",
+    "Sacute": "Ś",
+    "tcaron": "ť",
+    "Tcaron": "Ť",
+    "uring": "ů",
+    "Uring": "Ů",
+    "zacute": "ź",
+    "Zacute": "Ź",
+    "zdotaccent": "ż",
+    "Zdotaccent": "Ż",
+    # Common letters (fallback)
+    "a": "a",
+    "b": "b",
+    "c": "c",
+    "d": "d",
+    "e": "e",
+    "f": "f",
+    "g": "g",
+    "h": "h",
+    "i": "i",
+    "j": "j",
+    "k": "k",
+    "l": "l",
+    "m": "m",
+    "n": "n",
+    "o": "o",
+    "p": "p",
+    "q": "q",
+    "r": "r",
+    "s": "s",
+    "t": "t",
+    "u": "u",
+    "v": "v",
+    "w": "w",
+    "x": "x",
+    "y": "y",
+    "z": "z",
+    "A": "A",
+    "B": "B",
+    "C": "C",
+    "D": "D",
+    "E": "E",
+    "F": "F",
+    "G": "G",
+    "H": "H",
+    "I": "I",
+    "J": "J",
+    "K": "K",
+    "L": "L",
+    "M": "M",
+    "N": "N",
+    "O": "O",
+    "P": "P",
+    "Q": "Q",
+    "R": "R",
+    "S": "S",
+    "T": "T",
+    "U": "U",
+    "V": "V",
+    "W": "W",
+    "X": "X",
+    "Y": "Y",
+    "Z": "Z",
+}
 
-def _network_font_fetcher(obfuscation_id: str) -> FontFetchResult:
-    font_url = f"https://www.fussball.de/export.fontface/-/format/woff/id/{obfuscation_id}/type/font"
-    resp = requests.get(font_url, timeout=10)
+# Tokens used by the streaming engine: comments and start/end tags
+_TAG_RE = re.compile(
+    r"<!--.*?-->|<(/?)([a-zA-Z][^\s/>]*)((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>", re.S
+)
+_OBFUSCATION_ATTR_RE = re.compile(
+    r"""(?:^|\s)data-obfuscation(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?""",
+    re.I,
+)
+_OBFUSCATION_ID_RE = re.compile(rb"""data-obfuscation\s*=\s*["']?([^"'\s>]+)""", re.I)
+_RAW_TEXT_ELEMENTS = frozenset({"script", "style"})
+_VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+DeobfuscationMode = Literal["tree", "stream"]
+
+# Fetchers return the font as an in-memory buffer. The legacy contract of
+# (path_to_font_file, remove_after_use) is still accepted.
+FontData = bytes | bytearray | memoryview | mmap.mmap
+FontFetchResult = tuple[str, bool]
+FontFetcher = Callable[[str], FontData | FontFetchResult]
+
+
+def extract_obfuscation_ids(content: bytes | str) -> list[str]:
+    """Cheaply list the distinct obfuscation IDs of a raw page without parsing it."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    ids = dict.fromkeys(
+        m.decode("ascii", "replace") for m in _OBFUSCATION_ID_RE.findall(content)
+    )
+    return list(ids)
+
+
+def font_url(obfuscation_id: str) -> str:
+    return f"https://www.fussball.de/export.fontface/-/format/woff/id/{obfuscation_id}/type/font"
+
+
+def network_font_fetcher(obfuscation_id: str) -> FontData:
+    resp = get_session().get(font_url(obfuscation_id))
     resp.raise_for_status()
-    content = resp.content
-    fd, tmp_path = tempfile.mkstemp(prefix=f"font_{obfuscation_id}_", suffix=".woff")
-    with os.fdopen(fd, "wb") as f:  # noqa: PTH123
-        f.write(content)
-    return tmp_path, True
+    return resp.content
 
 
 def _local_dir_font_fetcher_factory(font_dir: str) -> FontFetcher:
-    def _fetch(obfuscation_id: str) -> FontFetchResult:
+    def _fetch(obfuscation_id: str) -> FontData:
         candidate = os.path.join(font_dir, obfuscation_id)
         if not os.path.exists(candidate):  # noqa: PTH110
             raise FileNotFoundError(
                 f"Local font '{candidate}' not found for id '{obfuscation_id}'"
             )
-        return candidate, False
+        with open(candidate, "rb") as f:  # noqa: PTH123
+            try:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return f.read()
 
     return _fetch
 
@@ -40,209 +271,95 @@ class Deobfuscator:
         self,
         font_dir: str | None = None,
         font_fetcher: FontFetcher | None = None,
+        cache: FontMappingCache | None = None,
+        mode: DeobfuscationMode = "tree",
+        parser: str | None = None,
     ) -> None:
         self.logger = logging.getLogger("Deobfuscator")
+        self.cache = cache if cache is not None else FontMappingCache()
+        if mode not in ("tree", "stream"):
+            raise ValueError(f"Unknown deobfuscation mode: {mode}")
+        self.mode = mode
+        # None follows the configured backend (--parser or $FUSSBALL_CRAWLER_PARSER)
+        self._parser = resolve_parser(parser) if parser is not None else None
         if font_fetcher is not None:
             self.font_fetcher = font_fetcher
         elif font_dir is not None:
             self.font_fetcher = _local_dir_font_fetcher_factory(font_dir)
         else:
-            self.font_fetcher = _network_font_fetcher
-
-    def build_char_mapping(self, font_filename: str) -> dict[str, str]:
-        glyph_to_char = {
-            # Numbers
-            "zero": "0",
-            "one": "1",
-            "two": "2",
-            "three": "3",
-            "four": "4",
-            "five": "5",
-            "six": "6",
-            "seven": "7",
-            "eight": "8",
-            "nine": "9",
-            # Punctuation
-            "comma": ",",
-            "period": ".",
-            "colon": ":",
-            "space": " ",
-            "hyphen": "-",
-            "minus": "-",
-            "bar": "|",
-            "pipe": "|",
-            # German characters
-            "germandbls": "ß",
-            "adieresis": "ä",
-            "odieresis": "ö",
-            "udieresis": "ü",
-            "Adieresis": "Ä",
-            "Odieresis": "Ö",
-            "Udieresis": "Ü",
-            # Accented characters - lowercase
-            "aacute": "á",
-            "agrave": "à",
-            "acircumflex": "â",
-            "atilde": "ã",
-            "aring": "å",
-            "eacute": "é",
-            "egrave": "è",
-            "ecircumflex": "ê",
-            "edieresis": "ë",
-            "iacute": "í",
-            "igrave": "ì",
-            "icircumflex": "î",
-            "idieresis": "ï",
-            "oacute": "ó",
-            "ograve": "ò",
-            "ocircumflex": "ô",
-            "otilde": "õ",
-            "oslash": "ø",
-            "uacute": "ú",
-            "ugrave": "ù",
-            "ucircumflex": "û",
-            "yacute": "ý",
-            "ydieresis": "ÿ",
-            "ccedilla": "ç",
-            "ntilde": "ñ",
-            "ae": "æ",
-            "oe": "œ",
-            # Accented characters - uppercase
-            "Aacute": "Á",
-            "Agrave": "À",
-            "Acircumflex": "Â",
-            "Atilde": "Ã",
-            "Aring": "Å",
-            "Eacute": "É",
-            "Egrave": "È",
-            "Ecircumflex": "Ê",
-            "Edieresis": "Ë",
-            "Iacute": "Í",
-            "Igrave": "Ì",
-            "Icircumflex": "Î",
-            "Idieresis": "Ï",
-            "Oacute": "Ó",
-            "Ograve": "Ò",
-            "Ocircumflex": "Ô",
-            "Otilde": "Õ",
-            "Oslash": "Ø",
-            "Uacute": "Ú",
-            "Ugrave": "Ù",
-            "Ucircumflex": "Û",
-            "Yacute": "Ý",
-            "Ydieresis": "Ÿ",
-            "Ccedilla": "Ç",
-            "Ntilde": "Ñ",
-            "AE": "Æ",
-            "OE": "Œ",
-            # Eastern European characters
-            "scaron": "š",
-            "Scaron": "Š",
-            "zcaron": "ž",
-            "Zcaron": "Ž",
-            "cacute": "ć",
-            "Cacute": "Ć",
-            "ccaron": "č",
-            "Ccaron": "Č",
-            "dcaron": "ď",
-            "Dcaron": "Ď",
-            "ecaron": "ě",
-            "Ecaron": "Ě",
-            "lacute": "ĺ",
-            "Lacute": "Ĺ",
-            "lcaron": "ľ",
-            "Lcaron": "Ľ",
-            "nacute": "ń",
-            "Nacute": "Ń",
-            "ncaron": "ň",
-            "Ncaron": "Ň",
-            "racute": "ŕ",
-            "Racute": "Ŕ",
-            "rcaron": "ř",
-            "Rcaron": "Ř",
-            "sacute": "ś",
-            "Sacute": "Ś",
-            "tcaron": "ť",
-            "Tcaron": "Ť",
-            "uring": "ů",
-            "Uring": "Ů",
-            "zacute": "ź",
-            "Zacute": "Ź",
-            "zdotaccent": "ż",
-            "Zdotaccent": "Ż",
-            # Common letters (fallback)
-            "a": "a",
-            "b": "b",
-            "c": "c",
-            "d": "d",
-            "e": "e",
-            "f": "f",
-            "g": "g",
-            "h": "h",
-            "i": "i",
-            "j": "j",
-            "k": "k",
-            "l": "l",
-            "m": "m",
-            "n": "n",
-            "o": "o",
-            "p": "p",
-            "q": "q",
-            "r": "r",
-            "s": "s",
-            "t": "t",
-            "u": "u",
-            "v": "v",
-            "w": "w",
-            "x": "x",
-            "y": "y",
-            "z": "z",
-            "A": "A",
-            "B": "B",
-            "C": "C",
-            "D": "D",
-            "E": "E",
-            "F": "F",
-            "G": "G",
-            "H": "H",
-            "I": "I",
-            "J": "J",
-            "K": "K",
-            "L": "L",
-            "M": "M",
-            "N": "N",
-            "O": "O",
-            "P": "P",
-            "Q": "Q",
-            "R": "R",
-            "S": "S",
-            "T": "T",
-            "U": "U",
-            "V": "V",
-            "W": "W",
-            "X": "X",
-            "Y": "Y",
-            "Z": "Z",
-        }
+            self.font_fetcher = network_font_fetcher
+
+    @property
+    def parser(self) -> str:
+        return self._parser if self._parser is not None else get_parser()
+
+    def build_char_mapping(self, font: str | FontData) -> dict[str, str]:
         char_mapping = {}
-        with TTFont(font_filename) as f:
+        source = font if isinstance(font, str | mmap.mmap) else io.BytesIO(font)
+        with TTFont(source) as f:
             cmap = f.getBestCmap()
             if cmap:
                 for unicode_codepoint, glyph_name in cmap.items():
                     unicode_char = chr(unicode_codepoint)
-                    char_mapping[unicode_char] = glyph_to_char.get(
+                    char_mapping[unicode_char] = _GLYPH_TO_CHAR.get(
                         glyph_name, glyph_name
                     )
         return char_mapping
 
+    def get_translator(self, obfuscation_id: str) -> CharTranslator:
+        """Return the compiled translator for an obfuscation ID, fetching the font only on a cache miss."""
+        translator = self.cache.get(obfuscation_id)
+        if translator is not None:
+            return translator
+
+        fetched = self.font_fetcher(obfuscation_id)
+        if isinstance(fetched, tuple):
+            font_data: FontData = self._read_font_file(*fetched)
+        else:
+            font_data = fetched
+        try:
+            digest = hashlib.sha256(font_data).hexdigest()
+            translator = self.cache.get_by_digest(digest)
+            if translator is None:
+                translator = CharTranslator(self.build_char_mapping(font_data))
+            self.cache.put(obfuscation_id, digest, translator)
+        finally:
+            if isinstance(font_data, mmap.mmap) and not font_data.closed:
+                font_data.close()
+        return translator
+
+    def get_char_mapping(self, obfuscation_id: str) -> dict[str, str]:
+        """Return the raw char mapping for an obfuscation ID."""
+        return self.get_translator(obfuscation_id).mapping
+
+    def _read_font_file(self, font_filename: str, remove_after: bool) -> bytes:
+        try:
+            with open(font_filename, "rb") as f:  # noqa: PTH123
+                return f.read()
+        finally:
+            if remove_after and os.path.exists(font_filename):  # noqa: PTH110
+                try:
+                    os.remove(font_filename)  # noqa: PTH116
+                except OSError:
+                    self.logger.debug(
+                        "Failed to remove temp font file %s", font_filename
+                    )
+
     def deobfuscate_html(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
+        if self.mode == "stream":
+            return "".join(self.iter_deobfuscated_html(html))
+        soup = BeautifulSoup(html, self.parser)
+        if not self.deobfuscate_soup(soup):
+            return html
+        return str(soup)
+
+    def deobfuscate_soup(self, soup: BeautifulSoup | Tag) -> int:
+        """Deobfuscate all obfuscated spans of a parsed page in place and return their count."""
         all_obfuscated_spans = soup.find_all("span", {"data-obfuscation": True})
         if not all_obfuscated_spans:
             self.logger.debug("No obfuscated spans found")
-            return html
+            return 0
         spans_by_id: dict[Any, list[Any]] = {}
-        from bs4.element import Tag
 
         for span in all_obfuscated_spans:
             if isinstance(span, Tag):
@@ -251,55 +368,107 @@ class Deobfuscator:
                     spans_by_id[span_id] = []
                 spans_by_id[span_id].append(span)
         for obfuscation_id, spans in spans_by_id.items():
-            font_filename, remove_after = self.font_fetcher(obfuscation_id)
-            char_mapping = self.build_char_mapping(font_filename)
-            try:
-                for span in spans:
-                    if span.string:
-                        deobfuscated_text = self._replace_chars(
-                            span.string, char_mapping
-                        )
-                        span.string.replace_with(deobfuscated_text)
-                    else:
-                        new_contents = []
-                        for content in span.contents:
-                            if isinstance(content, str):
-                                deobfuscated_text = self._replace_chars(
-                                    content, char_mapping
-                                )
-                                new_contents.append(deobfuscated_text)
-                            else:
-                                new_contents.append(content)
-                        span.clear()
-                        for new_content in new_contents:
-                            span.append(new_content)
-            finally:
-                if remove_after and os.path.exists(font_filename):  # noqa: PTH110
-                    try:
-                        os.remove(font_filename)  # noqa: PTH116
-                    except OSError:
-                        self.logger.debug(
-                            "Failed to remove temp font file %s", font_filename
-                        )
-        return str(soup)
+            translator = self.get_translator(obfuscation_id)
+            for span in spans:
+                if span.string:
+                    deobfuscated_text = translator.translate(span.string)
+                    span.string.replace_with(deobfuscated_text)
+                else:
+                    new_contents = []
+                    for content in span.contents:
+                        if isinstance(content, str):
+                            new_contents.append(translator.translate(content))
+                        else:
+                            new_contents.append(content)
+                    span.clear()
+                    for new_content in new_contents:
+                        span.append(new_content)
+        return len(all_obfuscated_spans)
+
+    def iter_deobfuscated_html(self, html: str) -> Iterator[str]:
+        """
+        Scan the raw HTML once and yield it in chunks, rewriting only the text
+        of obfuscated spans. No DOM is built, and markup outside those spans
+        is passed through untouched.
+        """
+        emitted = 0
+        pos = 0
+        while True:
+            tag = _TAG_RE.search(html, pos)
+            if tag is None:
+                break
+            pos = tag.end()
+            closing, name, attrs = tag.groups()
+            if name is None or closing:
+                continue
+            name = name.lower()
+            if name in _RAW_TEXT_ELEMENTS:
+                end_tag = re.compile(rf"</{name}\s*>", re.I).search(html, pos)
+                pos = end_tag.end() if end_tag else len(html)
+                continue
+            if name != "span" or attrs.rstrip().endswith("/"):
+                continue
+            attr = _OBFUSCATION_ATTR_RE.search(attrs)
+            if attr is None:
+                continue
+
+            obfuscation_id = next((g for g in attr.groups() if g is not None), "")
+            content_end = self._find_span_end(html, pos)
+            translator = self.get_translator(html_lib.unescape(obfuscation_id))
+            yield html[emitted:pos]
+            yield self._rewrite_span_content(html[pos:content_end], translator)
+            emitted = pos = content_end
+        yield html[emitted:]
+
+    @staticmethod
+    def _find_span_end(html: str, start: int) -> int:
+        depth = 1
+        for tag in _TAG_RE.finditer(html, start):
+            closing, name, attrs = tag.groups()
+            if name is None or name.lower() != "span":
+                continue
+            if closing:
+                depth -= 1
+                if depth == 0:
+                    return tag.start()
+            elif not attrs.rstrip().endswith("/"):
+                depth += 1
+        return len(html)
+
+    @staticmethod
+    def _rewrite_span_content(content: str, translator: CharTranslator) -> str:
+        # Split into (depth, chunk) pieces; depth is None for markup
+        pieces: list[tuple[int | None, str]] = []
+        depth = 0
+        children = 0
+        last = 0
+        for tag in _TAG_RE.finditer(content):
+            if tag.start() > last:
+                pieces.append((depth, content[last : tag.start()]))
+            pieces.append((None, tag.group(0)))
+            closing, name, attrs = tag.groups()
+            if name is not None and name.lower() not in _VOID_ELEMENTS:
+                if closing:
+                    depth = max(depth - 1, 0)
+                elif not attrs.rstrip().endswith("/"):
+                    if depth == 0:
+                        children += 1
+                    depth += 1
+            last = tag.end()
+        if last < len(content):
+            pieces.append((depth, content[last:]))
+
+        texts = [i for i, (d, _) in enumerate(pieces) if d is not None]
+        if any(pieces[i][0] == 0 for i in texts):
+            # Direct text children are rewritten, nested elements are kept
+            targets = [i for i in texts if pieces[i][0] == 0]
+        elif children == 1 and len(texts) == 1 and pieces[texts[0]][0] == 1:
+            # Like Tag.string: a lone child element with a single text node
+            targets = texts
+        else:
+            targets = []
 
-    def _replace_chars(self, text: str, char_mapping: dict[str, str]) -> str:
-        for obfuscated_char, real_char in char_mapping.items():
-            text = text.replace(obfuscated_char, real_char)
-        # Post-processing cleanup for common patterns
-        cleanup_patterns = {
-            "germandbls": "ß",
-            "udieresis": "ü",
-            "adieresis": "ä",
-            "odieresis": "ö",
-            "Udieresis": "Ü",
-            "Adieresis": "Ä",
-            "Odieresis": "Ö",
-            "bar": "|",
-            " bar ": " | ",
-            "k.A. bar k.A. bar k.A.": "k.A. | k.A. | k.A.",
-        }
-        for pattern, replacement in cleanup_patterns.items():
-            text = text.replace(pattern, replacement)
-        text = text.replace("\xa0", " ")
-        return text
+        for i in targets:
+            text = translator.translate(html_lib.unescape(pieces[i][1]))
+            pieces[i] = (pieces[i][0], html_lib.escape(text, quote=False))
+        return "".join(chunk for _, chunk in pieces)
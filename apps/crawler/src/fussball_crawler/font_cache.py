@@ -0,0 +1,151 @@
+"""Two-level cache for char mappings built from fussball.de obfuscation fonts."""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .translation import CharTranslator
+
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def default_cache_dir() -> str:
+    """Root directory for the crawler's persistent caches."""
+    cache_dir = os.getenv("FUSSBALL_CRAWLER_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    xdg_cache = os.getenv("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(xdg_cache, "fussball-crawler")
+
+
+def _write_atomic(path: str, data: str) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:  # noqa: PTH123
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):  # noqa: PTH110
+            os.remove(tmp_path)  # noqa: PTH116
+        raise
+
+
+class FontMappingCache:
+    """
+    Keeps compiled char translators in memory (LRU) and, if a cache directory
+    is given, their char mappings on disk. The disk store is content-addressed
+    by the SHA-256 of the font bytes, with a small index from obfuscation ID
+    to digest so repeated IDs never touch the network or fontTools again.
+    """
+
+    def __init__(self, cache_dir: str | None = None, max_entries: int = 256) -> None:
+        self.logger = logging.getLogger("FontMappingCache")
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._by_id: OrderedDict[str, CharTranslator] = OrderedDict()
+        self._by_digest: OrderedDict[str, CharTranslator] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, obfuscation_id: str) -> CharTranslator | None:
+        """Look up a translator by obfuscation ID in memory, then on disk."""
+        with self._lock:
+            translator = self._by_id.get(obfuscation_id)
+            if translator is not None:
+                self._by_id.move_to_end(obfuscation_id)
+                return translator
+
+        digest = self._read_id_index(obfuscation_id)
+        if digest is None:
+            return None
+        translator = self.get_by_digest(digest)
+        if translator is not None:
+            with self._lock:
+                self._remember(self._by_id, obfuscation_id, translator)
+        return translator
+
+    def get_by_digest(self, digest: str) -> CharTranslator | None:
+        """Look up a translator by the SHA-256 hex digest of its font bytes."""
+        with self._lock:
+            translator = self._by_digest.get(digest)
+            if translator is not None:
+                self._by_digest.move_to_end(digest)
+                return translator
+
+        mapping = self._read_mapping(digest)
+        if mapping is None:
+            return None
+        translator = CharTranslator(mapping)
+        with self._lock:
+            self._remember(self._by_digest, digest, translator)
+        return translator
+
+    def put(self, obfuscation_id: str, digest: str, translator: CharTranslator) -> None:
+        """Store a translator under both its obfuscation ID and font digest."""
+        with self._lock:
+            self._remember(self._by_id, obfuscation_id, translator)
+            self._remember(self._by_digest, digest, translator)
+
+        if self.cache_dir is None:
+            return
+        try:
+            mapping_path = self._mapping_path(digest)
+            if not os.path.exists(mapping_path):  # noqa: PTH110
+                _write_atomic(mapping_path, json.dumps(translator.mapping))
+            if _SAFE_ID.match(obfuscation_id):
+                _write_atomic(self._id_path(obfuscation_id), digest)
+        except OSError as e:
+            self.logger.warning("Failed to persist font mapping %s: %s", digest, e)
+
+    def clear(self) -> None:
+        """Drop the in-memory tier (the disk store is left untouched)."""
+        with self._lock:
+            self._by_id.clear()
+            self._by_digest.clear()
+
+    def _remember(
+        self, store: OrderedDict[str, CharTranslator], key: str, value: CharTranslator
+    ) -> None:
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
+
+    def _mapping_path(self, digest: str) -> str:
+        assert self.cache_dir is not None
+        return os.path.join(self.cache_dir, "mappings", digest + ".json")
+
+    def _id_path(self, obfuscation_id: str) -> str:
+        assert self.cache_dir is not None
+        return os.path.join(self.cache_dir, "ids", obfuscation_id)
+
+    def _read_id_index(self, obfuscation_id: str) -> str | None:
+        if self.cache_dir is None or not _SAFE_ID.match(obfuscation_id):
+            return None
+        try:
+            with open(self._id_path(obfuscation_id), encoding="utf-8") as f:  # noqa: PTH123
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.debug("Failed to read font index for %s: %s", obfuscation_id, e)
+            return None
+
+    def _read_mapping(self, digest: str) -> dict[str, str] | None:
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._mapping_path(digest), encoding="utf-8") as f:  # noqa: PTH123
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable font mapping %s: %s", digest, e)
+            return None
@@ -0,0 +1,131 @@
+"""Persistent cache of geocoder results, keyed by venue address."""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import NamedTuple
+
+# Venues rarely move; unresolvable addresses are retried sooner in case the
+# geocoder's data improves
+DEFAULT_TTL = 90 * 24 * 3600
+DEFAULT_NEGATIVE_TTL = 7 * 24 * 3600
+
+
+class GeocodeLookup(NamedTuple):
+    """A cache hit; coordinates is None for a cached negative result."""
+
+    coordinates: tuple[float, float] | None
+
+
+class GeocodeCache:
+    """
+    SQLite-backed address -> (latitude, longitude) cache. Addresses the
+    geocoder could not resolve are stored too, with their own TTL. Venues
+    queued for deferred geocoding are kept until they are backfilled, so a run
+    that stops early leaves them for the next one. Without a path the
+    database lives in memory.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+    ) -> None:
+        self.logger = logging.getLogger("GeocodeCache")
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        if path is not None:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS geocodes ("
+                "address TEXT PRIMARY KEY, latitude REAL, longitude REAL, "
+                "expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pending_venues ("
+                "address TEXT PRIMARY KEY, venue_id INTEGER NOT NULL)"
+            )
+
+    def get(self, address: str) -> GeocodeLookup | None:
+        """The cached result for an address, or None if unknown or expired."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT latitude, longitude, expires_at FROM geocodes "
+                    "WHERE address = ?",
+                    (address,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning("Failed to read geocode cache: %s", e)
+            return None
+        if row is None or row[2] < time.time():
+            return None
+        if row[0] is None or row[1] is None:
+            return GeocodeLookup(None)
+        return GeocodeLookup((row[0], row[1]))
+
+    def put(self, address: str, coordinates: tuple[float, float] | None) -> None:
+        """Store a geocoder result; None records the address as unresolvable."""
+        ttl = self.ttl if coordinates is not None else self.negative_ttl
+        latitude, longitude = coordinates if coordinates is not None else (None, None)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO geocodes "
+                    "(address, latitude, longitude, expires_at) VALUES (?, ?, ?, ?)",
+                    (address, latitude, longitude, time.time() + ttl),
+                )
+        except sqlite3.Error as e:
+            self.logger.warning("Failed to persist geocode for %s: %s", address, e)
+
+    def add_pending(self, address: str, venue_id: int) -> None:
+        """Remember a venue that still needs its coordinates backfilled."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pending_venues (address, venue_id) "
+                    "VALUES (?, ?)",
+                    (address, venue_id),
+                )
+        except sqlite3.Error as e:
+            self.logger.warning("Failed to persist pending venue %s: %s", address, e)
+
+    def remove_pending(self, address: str) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM pending_venues WHERE address = ?", (address,)
+                )
+        except sqlite3.Error as e:
+            self.logger.warning("Failed to clear pending venue %s: %s", address, e)
+
+    def pending(self) -> list[tuple[str, int]]:
+        """Venues queued by earlier runs whose coordinates are still missing."""
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT address, venue_id FROM pending_venues"
+                ).fetchall()
+        except sqlite3.Error as e:
+            self.logger.warning("Failed to read pending venues: %s", e)
+            return []
+        return [(address, venue_id) for address, venue_id in rows]
+
+    def purge_expired(self) -> int:
+        """Delete expired entries; returns how many were removed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM geocodes WHERE expires_at < ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
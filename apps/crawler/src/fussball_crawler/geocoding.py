@@ -0,0 +1,97 @@
+"""Geocoding of new venues in the background of match ingestion."""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+from . import api_client
+from .geocode_cache import GeocodeCache
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+Geocode = Callable[[str], tuple[float, float] | None]
+
+
+class DeferredGeocoder:
+    """
+    Geocodes venue addresses on a small thread pool and backfills the
+    coordinates through the venues API, so match ingestion never waits on the
+    geocoder. Every address is geocoded at most once per run. With a cache,
+    queued venues are persisted until backfilled and resume() picks up those
+    an earlier run left behind.
+    """
+
+    def __init__(
+        self, geocode: Geocode, workers: int = 4, cache: GeocodeCache | None = None
+    ) -> None:
+        self.geocode = geocode
+        self.workers = workers
+        self.cache = cache
+        self.resolved = 0
+        self.unresolved = 0
+        self._seen: set[str] = set()
+        self._futures: list[Future[None]] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="geocode"
+        )
+
+    def submit(self, address: str, venue_id: int) -> None:
+        """Queue a venue for geocoding unless its address was seen before."""
+        with self._lock:
+            if address in self._seen:
+                return
+            self._seen.add(address)
+            if self.cache is not None:
+                self.cache.add_pending(address, venue_id)
+            self._futures.append(
+                self._executor.submit(self._backfill, address, venue_id)
+            )
+
+    def _backfill(self, address: str, venue_id: int) -> None:
+        try:
+            coordinates = self.geocode(address)
+        except Exception as e:
+            logger.error(f"Error geocoding {address}: {e}")
+            coordinates = None
+        updated = coordinates is not None and api_client.update_venue_coordinates(
+            venue_id, coordinates
+        )
+        # Keep failed lookups pending; a cached negative result means the
+        # geocoder answered and the address is simply unknown to it
+        if self.cache is not None and (
+            updated or (coordinates is None and self.cache.get(address) is not None)
+        ):
+            self.cache.remove_pending(address)
+        with self._lock:
+            if updated:
+                self.resolved += 1
+            else:
+                self.unresolved += 1
+
+    def resume(self) -> int:
+        """Queue the venues earlier runs left without coordinates."""
+        if self.cache is None:
+            return 0
+        pending = self.cache.pending()
+        for address, venue_id in pending:
+            self.submit(address, venue_id)
+        if pending:
+            logger.info(f"Resuming geocoding of {len(pending)} venues")
+        return len(pending)
+
+    def finish(self) -> None:
+        """Wait for all queued venues and log how many were resolved."""
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures)
+        self._executor.shutdown()
+        if futures:
+            logger.info(
+                f"Geocoded {self.resolved} of {len(futures)} new venues"
+                f" ({self.unresolved} without coordinates)"
+            )
+
+    def cancel(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
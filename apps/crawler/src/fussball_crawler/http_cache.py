@@ -0,0 +1,179 @@
+"""On-disk cache of fussball.de responses with ETag/Last-Modified revalidation."""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, NamedTuple
+
+import requests
+
+# Seconds a stored response is served without asking the server again. Club
+# schedules change with every rescheduled match; club lists and team pages
+# hardly ever do
+DEFAULT_TTLS = {
+    "schedule": 3600,
+    "club_search": 7 * 24 * 3600,
+    "team": 30 * 24 * 3600,
+}
+
+# Response headers kept with an entry
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class CacheEntry(NamedTuple):
+    status_code: int
+    headers: dict[str, str]
+    encoding: str | None
+    stored_at: float
+    content: bytes
+
+
+def cache_key(url: str) -> str:
+    # The fragment never reaches the server
+    return hashlib.sha256(url.split("#", 1)[0].encode("utf-8")).hexdigest()
+
+
+def to_response(url: str, entry: CacheEntry) -> requests.Response:
+    """Rebuild a requests.Response from a cache entry."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = entry.status_code
+    response.headers.update(entry.headers)
+    response.encoding = entry.encoding
+    response._content = entry.content
+    return response
+
+
+class HttpCache:
+    """
+    Stores successful GET responses gzip-compressed under ``cache_dir``, one
+    file per URL. Entries younger than the TTL of their URL class are served
+    directly; older ones are revalidated with If-None-Match/If-Modified-Since
+    and refreshed on a 304.
+    """
+
+    def __init__(self, cache_dir: str, ttls: dict[str, float] | None = None) -> None:
+        self.logger = logging.getLogger("HttpCache")
+        self.cache_dir = cache_dir
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> str:
+        key = cache_key(url)
+        return os.path.join(self.cache_dir, key[:2], key + ".gz")
+
+    def load(self, url: str) -> CacheEntry | None:
+        try:
+            with gzip.open(self._path(url), "rb") as f:
+                header, _, content = f.read().partition(b"\n")
+            meta = json.loads(header)
+            return CacheEntry(
+                meta["status_code"],
+                meta["headers"],
+                meta["encoding"],
+                meta["stored_at"],
+                content,
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning("Ignoring unreadable cache entry for %s: %s", url, e)
+            return None
+
+    def store(self, url: str, response: Any) -> CacheEntry:
+        """Persist a response (requests.Response or anything shaped like it)."""
+        headers = {
+            name: response.headers[name]
+            for name in _STORED_HEADERS
+            if response.headers.get(name)
+        }
+        entry = CacheEntry(
+            response.status_code,
+            headers,
+            response.encoding,
+            time.time(),
+            response.content,
+        )
+        self._write(url, entry)
+        return entry
+
+    def refresh(self, url: str, entry: CacheEntry) -> CacheEntry:
+        """Restart an entry's TTL after the server confirmed it is unchanged."""
+        entry = entry._replace(stored_at=time.time())
+        self._write(url, entry)
+        return entry
+
+    def is_fresh(self, entry: CacheEntry, url_class: str) -> bool:
+        return time.time() - entry.stored_at < self.ttls.get(url_class, 0)
+
+    @staticmethod
+    def conditional_headers(entry: CacheEntry) -> dict[str, str]:
+        headers = {}
+        if "ETag" in entry.headers:
+            headers["If-None-Match"] = entry.headers["ETag"]
+        if "Last-Modified" in entry.headers:
+            headers["If-Modified-Since"] = entry.headers["Last-Modified"]
+        return headers
+
+    def get(
+        self,
+        session: requests.Session,
+        url: str,
+        url_class: str,
+        headers: dict[str, str] | None = None,
+    ) -> requests.Response:
+        """GET a URL through the cache."""
+        entry = self.load(url)
+        if entry is not None and self.is_fresh(entry, url_class):
+            self.count("hits")
+            return to_response(url, entry)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(self.conditional_headers(entry))
+        response = session.get(url, headers=request_headers or None)
+
+        if response.status_code == 304 and entry is not None:
+            self.count("revalidated")
+            return to_response(url, self.refresh(url, entry))
+        self.count("misses")
+        if response.status_code == 200:
+            self.store(url, response)
+        return response
+
+    def count(self, outcome: str) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def _write(self, url: str, entry: CacheEntry) -> None:
+        path = self._path(url)
+        meta = {
+            "url": url,
+            "status_code": entry.status_code,
+            "headers": entry.headers,
+            "encoding": entry.encoding,
+            "stored_at": entry.stored_at,
+        }
+        data = json.dumps(meta).encode("utf-8") + b"\n" + entry.content
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_")
+            try:
+                with os.fdopen(fd, "wb") as f:  # noqa: PTH123
+                    f.write(gzip.compress(data, mtime=0))
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):  # noqa: PTH110
+                    os.remove(tmp_path)  # noqa: PTH116
+                raise
+        except OSError as e:
+            self.logger.warning("Failed to persist cache entry for %s: %s", url, e)
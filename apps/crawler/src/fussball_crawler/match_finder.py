@@ -1,28 +1,56 @@
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any
 from urllib.parse import quote, urlencode
 
-import requests
-
 from . import api_client
 from . import scraper as fussball_scraper
+from .crawl_state import Checkpoint, CrawlState, schedule_key
+from .font_cache import default_cache_dir
+from .geocode_cache import GeocodeCache
+from .geocoding import DeferredGeocoder
 from .logger import get_logger, setup_logging
+from .rate_limit import log_rate_limits
+from .scheduler import prioritize_clubs
+from .sharding import Shard, select_shard
+from .transport import configure_transport, get_session
 
+# Matches buffered between a club's parser and its writer
+WRITE_QUEUE_SIZE = 256
 
-def find_lat_long_online(
-    geocoder_url: str, location: str
-) -> tuple[float, float] | None:
-    logger = get_logger(__name__)
+_DONE = None  # Queue sentinel
+
+_geocode_cache: GeocodeCache | None = None
+_geocode_cache_lock = threading.Lock()
+
+
+def get_geocode_cache() -> GeocodeCache:
+    global _geocode_cache
+    with _geocode_cache_lock:
+        if _geocode_cache is None:
+            _geocode_cache = GeocodeCache(
+                os.path.join(default_cache_dir(), "geocode.sqlite3")
+            )
+    return _geocode_cache
 
-    def _fetch(params_dict: dict) -> list[dict]:
-        params = urlencode(params_dict, quote_via=quote)
-        resp = requests.get(geocoder_url, params=params)
-        try:
-            data = resp.json()
-        except ValueError:
-            return []
-        return data.get("features", [])
 
-    # First try with osm_tag filter, then fallback
-    features = _fetch({"q": location, "osm_tag": "leisure"}) or _fetch({"q": location})
+def geocoder_queries(location: str) -> list[str]:
+    """Query strings to try in order: first with osm_tag filter, then fallback"""
+    return [
+        urlencode({"q": location, "osm_tag": "leisure"}, quote_via=quote),
+        urlencode({"q": location}, quote_via=quote),
+    ]
+
+
+def coordinates_from_features(
+    features: list[dict], location: str
+) -> tuple[float, float] | None:
+    """(latitude, longitude) of the best geocoder feature"""
+    logger = get_logger(__name__)
     if not features:
         logger.info("Location not found: " + location)
         return None
@@ -34,13 +62,598 @@ def find_lat_long_online(
     return (coords[1], coords[0])
 
 
+def geocoder_features(
+    status_code: int, read_json: Callable[[], Any]
+) -> list[dict] | None:
+    """Features of a geocoder response; None unless it is a 200 with valid JSON"""
+    if status_code != 200:
+        return None
+    try:
+        data = read_json()
+    except ValueError:
+        return None
+    features = data.get("features") if isinstance(data, dict) else None
+    return features if isinstance(features, list) else None
+
+
+def find_lat_long_online(
+    geocoder_url: str, location: str
+) -> tuple[float, float] | None:
+    """
+    Coordinates of an address. Only answers of the geocoder are cached; a
+    failed lookup is retried on the next call.
+    """
+    cache = get_geocode_cache()
+    cached = cache.get(location)
+    if cached is not None:
+        return cached.coordinates
+
+    features: list[dict] | None = []
+    for params in geocoder_queries(location):
+        resp = get_session().get(geocoder_url, params=params)
+        features = geocoder_features(resp.status_code, resp.json)
+        if features is None:
+            get_logger(__name__).warning(
+                f"Geocoder failed for {location} ({resp.status_code})"
+            )
+            return None
+        if features:
+            break
+    coordinates = coordinates_from_features(features, location)
+    cache.put(location, coordinates)
+    return coordinates
+
+
+def log_lookup_stats() -> None:
+    stats = api_client.lookup_cache.stats()
+    get_logger(__name__).info(
+        f"API lookup cache: {stats.hits} hits, {stats.misses} misses"
+        f" ({stats.hit_rate:.0%} hit rate, {stats.size} entries)"
+    )
+
+
+class CrawlProgress:
+    """Thread-safe progress counter for the club loop.
+
+    With a checkpoint, every item that completed without failing and with all
+    of its matches saved is recorded.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        checkpoint: Checkpoint | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        self.total = total
+        self.done = 0
+        self.errors = 0
+        self.deferred = 0
+        self.checkpoint = checkpoint
+        self.deadline = deadline
+        self._lock = threading.Lock()
+
+    def out_of_time(self) -> bool:
+        """Whether the run's time budget (a time.monotonic() deadline) is spent."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def defer(self) -> None:
+        """Count a club left for the next run because the time budget is spent."""
+        with self._lock:
+            self.deferred += 1
+
+    def advance(
+        self, failed: bool = False, item: str | None = None, complete: bool = True
+    ) -> None:
+        with self._lock:
+            self.done += 1
+            if failed:
+                self.errors += 1
+            done = self.done
+        if self.checkpoint is not None and item is not None and not failed and complete:
+            self.checkpoint.mark(item)
+        get_logger(__name__).info(
+            "Progress: "
+            + str(done)
+            + "/"
+            + str(self.total)
+            + " (progress: "
+            + str(done / self.total * 100)
+            + "%)"
+        )
+
+
+def process_match(
+    match: Mapping[str, Any], club_external_id: str, geocoder_url: str
+) -> None:
+    """Resolve all foreign keys of a scraped match and upsert it"""
+    record = resolve_match(match, club_external_id, geocoder_url)
+    if record is not None:
+        api_client.upsert_matches([record])
+
+
+def resolve_match(
+    match: Mapping[str, Any],
+    club_external_id: str,
+    geocoder_url: str,
+    geocoder: DeferredGeocoder | None = None,
+) -> dict[str, Any] | None:
+    """Resolve all foreign keys of a scraped match into an upsert payload"""
+    venue_id = api_client.find_venue_location(match["address"])
+    if venue_id is None:
+        venue_id = _create_venue(match["address"], geocoder_url, geocoder)
+
+    api_client.insert_age_group(match["age_group"])
+    age_group_id = api_client.get_age_group_id_by_name(match["age_group"])
+
+    api_client.insert_competition(match["league"])
+    competition_id = api_client.get_competition_id_by_name(match["league"])
+
+    # Find or create teams using the new external IDs and URLs
+    # For home team: use home_club_id if available, otherwise fallback to current club
+    home_club_id = match.get("home_club_id", club_external_id)
+
+    if home_club_id:
+        # Check if home club exists, if not, fetch club info from team URL
+        if not api_client.get_club_id_by_external_id(home_club_id) and match.get(
+            "home_team_url"
+        ):
+            club_info = fussball_scraper.fetch_club_name_from_team_url(
+                match["home_team_url"]
+            )
+            if club_info:
+                # Create the club with the info from the team page
+                api_client.insert_club(
+                    club_info["club_id"], club_info["club_name"], None
+                )
+                home_club_id = club_info["club_id"]  # Use the correct club ID
+
+        home_team_id = api_client.find_or_create_team(
+            match["home"], home_club_id, match.get("home_team_id")
+        )
+    else:
+        home_team_id = None
+
+    # For away team: use away_club_id if available, otherwise fallback to current club
+    away_club_id = match.get("away_club_id", club_external_id)
+
+    if away_club_id:
+        # Check if away club exists, if not, fetch club info from team URL
+        if not api_client.get_club_id_by_external_id(away_club_id) and match.get(
+            "away_team_url"
+        ):
+            club_info = fussball_scraper.fetch_club_name_from_team_url(
+                match["away_team_url"]
+            )
+            if club_info:
+                # Create the club with the info from the team page
+                api_client.insert_club(
+                    club_info["club_id"], club_info["club_name"], None
+                )
+                away_club_id = club_info["club_id"]  # Use the correct club ID
+
+        away_team_id = api_client.find_or_create_team(
+            match["away"], away_club_id, match.get("away_team_id")
+        )
+    else:
+        away_team_id = None
+
+    # Insert match with proper foreign keys
+    if all(
+        [
+            isinstance(home_team_id, int | None),
+            isinstance(away_team_id, int | None),
+            isinstance(venue_id, int),
+            isinstance(age_group_id, int),
+            isinstance(competition_id, int),
+        ]
+    ):
+        # Type assertions since we've verified they're integers above
+        home_id: int | None = home_team_id  # type: ignore
+        away_id: int | None = away_team_id  # type: ignore
+        v_id: int = venue_id  # type: ignore
+        age_id: int = age_group_id  # type: ignore
+        comp_id: int = competition_id  # type: ignore
+
+        return api_client.match_payload(
+            match["url"], match["time"], home_id, away_id, v_id, age_id, comp_id
+        )
+    return None
+
+
+def _create_venue(
+    address: str, geocoder_url: str, geocoder: DeferredGeocoder | None
+) -> int | None:
+    if geocoder is None:
+        coordinates = find_lat_long_online(geocoder_url, address)
+        api_client.insert_venue(address, coordinates=coordinates)
+        return api_client.get_venue_id_by_address(address)
+
+    # Create the venue right away; unknown coordinates are backfilled later
+    cached = get_geocode_cache().get(address)
+    coordinates = cached.coordinates if cached is not None else None
+    api_client.insert_venue(address, coordinates=coordinates)
+    venue_id = api_client.get_venue_id_by_address(address)
+    if cached is None and isinstance(venue_id, int):
+        geocoder.submit(address, venue_id)
+    return venue_id
+
+
+def upsert_club_matches(
+    matches: Iterable[Mapping[str, Any]],
+    club_external_id: str,
+    geocoder_url: str,
+    batch_size: int = api_client.DEFAULT_MATCH_BATCH_SIZE,
+    geocoder: DeferredGeocoder | None = None,
+) -> int:
+    """Resolve a club's scraped matches and upsert each batch as soon as it is full.
+
+    Returns how many matches could not be resolved or saved.
+    """
+    unresolved = written = failed = 0
+    batch: list[dict[str, Any]] = []
+    for match in matches:
+        record = resolve_match(match, club_external_id, geocoder_url, geocoder)
+        if record is None:
+            unresolved += 1
+            continue
+        batch.append(record)
+        if len(batch) >= batch_size:
+            failed += _upsert_batch(batch, batch_size)
+            written += len(batch)
+            batch = []
+    if batch:
+        failed += _upsert_batch(batch, batch_size)
+        written += len(batch)
+    if failed:
+        get_logger(__name__).warning(
+            f"{failed} of {written} matches of club {club_external_id} were not saved"
+        )
+    return unresolved + failed
+
+
+def _upsert_batch(records: list[dict[str, Any]], batch_size: int) -> int:
+    outcomes = api_client.upsert_matches(records, batch_size=batch_size)
+    return sum(not outcome.success for outcome in outcomes)
+
+
+def write_club_matches(
+    matches: Iterable[Mapping[str, Any]],
+    club_external_id: str,
+    geocoder_url: str,
+    batch_size: int = api_client.DEFAULT_MATCH_BATCH_SIZE,
+    geocoder: DeferredGeocoder | None = None,
+    queue_size: int = WRITE_QUEUE_SIZE,
+) -> tuple[int, int]:
+    """Upsert matches on a writer thread while they are still being extracted.
+
+    The writer reads from a bounded queue, so extraction waits for a slow API
+    instead of piling up matches. Returns the number of matches and how many
+    of them were not saved.
+    """
+    iterator = iter(matches)
+    first = next(iterator, _DONE)
+    if first is _DONE:
+        return 0, 0
+    pending: queue.Queue[Mapping[str, Any] | None] = queue.Queue(maxsize=queue_size)
+
+    def consume() -> Iterator[Mapping[str, Any]]:
+        while (match := pending.get()) is not _DONE:
+            yield match
+
+    count = 0
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="write") as executor:
+        writer = executor.submit(
+            upsert_club_matches,
+            consume(),
+            club_external_id,
+            geocoder_url,
+            batch_size,
+            geocoder,
+        )
+        try:
+            match: Mapping[str, Any] | None = first
+            while match is not _DONE and _offer(pending, match, writer):
+                count += 1
+                match = next(iterator, _DONE)
+        finally:
+            _offer(pending, _DONE, writer)
+        return count, writer.result()
+
+
+def _offer(
+    pending: queue.Queue[Mapping[str, Any] | None],
+    item: Mapping[str, Any] | None,
+    writer: Future[int],
+) -> bool:
+    """Put an item on the write queue unless the writer has stopped"""
+    while not writer.done():
+        try:
+            pending.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def process_club(
+    club_external_id: str,
+    from_date: str,
+    to_date: str,
+    geocoder_url: str,
+    batch_size: int = api_client.DEFAULT_MATCH_BATCH_SIZE,
+    geocoder: DeferredGeocoder | None = None,
+    state: CrawlState | None = None,
+    window_days: int | None = None,
+) -> tuple[int, int]:
+    """Fetch a club's schedule and ingest its matches.
+
+    Returns the number of matches and how many of them were not saved.
+
+    With window_days, the date range is fetched in windows of that many days.
+    Matches are written while the schedule is still being parsed. With a crawl
+    state, a window whose match table is unchanged since the last fully saved
+    crawl is neither parsed nor written again.
+    """
+    known = None
+    if state is not None:
+        known = known_window_fingerprints(
+            state, club_external_id, from_date, to_date, window_days
+        )
+    matches = fussball_scraper.ClubMatchStream(
+        club_external_id, from_date, to_date, window_days, known
+    )
+    count, unsaved = write_club_matches(
+        matches, club_external_id, geocoder_url, batch_size, geocoder
+    )
+    if state is None:
+        return count, unsaved
+
+    assert matches.fingerprint is not None
+    if not matches.fingerprints:
+        state.count_skipped()
+        state.record_crawl(club_external_id, matches.fingerprint, None)
+        get_logger(__name__).debug(f"Schedule of club {club_external_id} unchanged")
+        return 0, 0
+    if not unsaved:
+        save_window_fingerprints(state, club_external_id, matches.fingerprints)
+    state.record_crawl(club_external_id, matches.fingerprint, count)
+    return count, unsaved
+
+
+def known_window_fingerprints(
+    state: CrawlState,
+    club_external_id: str,
+    from_date: str,
+    to_date: str,
+    window_days: int | None,
+) -> dict[tuple[str, str], str]:
+    """Fingerprints of a club's date windows from its last fully saved crawl"""
+    known = {}
+    for window in fussball_scraper.date_windows(from_date, to_date, window_days):
+        value = state.known_fingerprint(
+            "schedule", schedule_key(club_external_id, *window)
+        )
+        if value is not None:
+            known[window] = value
+    return known
+
+
+def save_window_fingerprints(
+    state: CrawlState,
+    club_external_id: str,
+    fingerprints: dict[tuple[str, str], str],
+) -> None:
+    for window, value in fingerprints.items():
+        state.put("schedule", schedule_key(club_external_id, *window), value)
+
+
+def _process_club_safely(
+    club_external_id: str,
+    from_date: str,
+    to_date: str,
+    geocoder_url: str,
+    progress: CrawlProgress,
+    batch_size: int = api_client.DEFAULT_MATCH_BATCH_SIZE,
+    geocoder: DeferredGeocoder | None = None,
+    state: CrawlState | None = None,
+    window_days: int | None = None,
+) -> None:
+    if progress.out_of_time():
+        progress.defer()
+        return
+    logger = get_logger(__name__)
+    failed = False
+    unsaved = 0
+    try:
+        count, unsaved = process_club(
+            club_external_id,
+            from_date,
+            to_date,
+            geocoder_url,
+            batch_size,
+            geocoder,
+            state,
+            window_days,
+        )
+        logger.debug(f"Processed {count} matches for club {club_external_id}")
+    except Exception as e:
+        logger.error(f"Error processing club {club_external_id}: {e}")
+        failed = True
+    # A club with unsaved matches is crawled again on --resume
+    progress.advance(failed=failed, item=club_external_id, complete=not unsaved)
+
+
+def _crawl_clubs(
+    clubs: list[tuple[Any, ...]],
+    from_date: str,
+    to_date: str,
+    geocoder_url: str,
+    progress: CrawlProgress,
+    workers: int,
+    processes: int,
+    queue_size: int,
+    batch_size: int,
+    geocoder: DeferredGeocoder | None,
+    state: CrawlState | None = None,
+    window_days: int | None = None,
+) -> None:
+    logger = get_logger(__name__)
+    if processes > 0:
+        from .pipeline import run_pipeline
+
+        run_pipeline(
+            [club[0] for club in clubs],
+            from_date,
+            to_date,
+            geocoder_url,
+            progress,
+            io_workers=workers,
+            processes=processes,
+            queue_size=queue_size,
+            batch_size=batch_size,
+            geocoder=geocoder,
+            state=state,
+            window_days=window_days,
+        )
+    elif workers <= 1:
+        for club in clubs:
+            _process_club_safely(
+                club[0],
+                from_date,
+                to_date,
+                geocoder_url,
+                progress,
+                batch_size,
+                geocoder,
+                state,
+                window_days,
+            )
+    else:
+        logger.info(f"Crawling clubs with {workers} workers")
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="club")
+        try:
+            futures = [
+                executor.submit(
+                    _process_club_safely,
+                    club[0],
+                    from_date,
+                    to_date,
+                    geocoder_url,
+                    progress,
+                    batch_size,
+                    geocoder,
+                    state,
+                    window_days,
+                )
+                for club in clubs
+            ]
+            for future in as_completed(futures):
+                future.result()
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+
+def shard_clubs(
+    clubs: list[tuple[Any, ...]], shard: Shard | None
+) -> list[tuple[Any, ...]]:
+    """Keep the clubs owned by this machine's shard."""
+    if shard is None:
+        return clubs
+    selected = select_shard(clubs, shard, key=lambda club: str(club[0]))
+    get_logger(__name__).info(
+        f"Shard {shard}: crawling {len(selected)} of {len(clubs)} clubs"
+    )
+    return selected
+
+
+def skip_completed(
+    clubs: list[tuple[Any, ...]], checkpoint: Checkpoint | None
+) -> list[tuple[Any, ...]]:
+    """Drop clubs an interrupted run already completed."""
+    if checkpoint is None:
+        return clubs
+    completed = checkpoint.completed()
+    remaining = [club for club in clubs if club[0] not in completed]
+    if len(remaining) < len(clubs):
+        get_logger(__name__).info(
+            f"Resuming: {len(clubs) - len(remaining)} clubs already completed"
+        )
+    return remaining
+
+
+def plan_crawl(
+    clubs: list[tuple[Any, ...]],
+    shard: Shard | None = None,
+    checkpoint: Checkpoint | None = None,
+    state: CrawlState | None = None,
+    prioritize: bool = False,
+    max_clubs: int | None = None,
+) -> list[tuple[Any, ...]]:
+    """The clubs of this run, in crawl order."""
+    clubs = skip_completed(shard_clubs(clubs, shard), checkpoint)
+    if prioritize or max_clubs is not None:
+        histories = state.histories() if state is not None else {}
+        clubs = prioritize_clubs(clubs, histories, max_clubs)
+        get_logger(__name__).info(f"Crawling {len(clubs)} clubs by priority")
+    return clubs
+
+
+def finish_crawl(
+    progress: CrawlProgress,
+    checkpoint: Checkpoint | None = None,
+    state: CrawlState | None = None,
+) -> None:
+    """Clear the checkpoint of a complete run and log the run's outcome."""
+    logger = get_logger(__name__)
+    if checkpoint is not None and not progress.errors and not progress.deferred:
+        checkpoint.reset()
+
+    if progress.errors:
+        logger.warning(f"{progress.errors} clubs failed to process")
+    if progress.deferred:
+        logger.warning(
+            f"Time budget spent; {progress.deferred} clubs left for the next run"
+        )
+    if state is not None:
+        logger.info(f"Skipped {state.skipped} clubs with unchanged schedules")
+    log_lookup_stats()
+    log_rate_limits()
+
+
 def main(
     from_date: str,
     to_date: str,
     geocoder_url: str,
     calio_api_url: str,
     post_codes: list[str] | None = None,
+    workers: int = 1,
+    processes: int = 0,
+    queue_size: int = 32,
+    batch_size: int = api_client.DEFAULT_MATCH_BATCH_SIZE,
+    defer_geocoding: bool = False,
+    geocoder_workers: int = 4,
+    state: CrawlState | None = None,
+    checkpoint: Checkpoint | None = None,
+    shard: Shard | None = None,
+    prioritize: bool = False,
+    max_clubs: int | None = None,
+    time_budget: float | None = None,
+    window_days: int | None = None,
 ) -> None:
+    """
+    Crawl the schedules of all (or the given postal codes') clubs, or only
+    those owned by a shard. With a checkpoint, completed clubs are recorded as
+    the run goes and clubs a previous run of the checkpoint completed are
+    skipped; the checkpoint is cleared once a run finishes without errors.
+
+    prioritize (implied by max_clubs) crawls the clubs with the most likely
+    changes first, based on the crawl history in state. After time_budget
+    seconds no further clubs are started. window_days splits each club's
+    date range into windows that are fetched in parallel.
+    """
     logger = get_logger(__name__)
     setup_logging()
 
@@ -50,106 +663,55 @@ def main(
     if not api_available:
         return
 
+    # One keep-alive connection per thread that talks to the same host
+    window_workers = fussball_scraper.WINDOW_WORKERS if window_days else 1
+    configure_transport(
+        pool_size=max(
+            workers * window_workers, geocoder_workers if defer_geocoding else 1
+        )
+    )
+
     clubs = api_client.get_clubs(post_codes=post_codes)
     if clubs is None:
         logger.info("No clubs found...")
         clubs = []
     else:
         logger.info("Found " + str(len(clubs)) + " clubs...")
+    clubs = plan_crawl(clubs, shard, checkpoint, state, prioritize, max_clubs)
 
-    for progress, club in enumerate(clubs):
-        logger.info(
-            "Progress: "
-            + str(progress + 1)
-            + "/"
-            + str(len(clubs))
-            + " (progress: "
-            + str((progress + 1) / len(clubs) * 100)
-            + "%)"
+    deadline = time.monotonic() + time_budget if time_budget else None
+    progress = CrawlProgress(len(clubs), checkpoint, deadline)
+    geocoder = None
+    if defer_geocoding:
+        geocoder = DeferredGeocoder(
+            lambda address: find_lat_long_online(geocoder_url, address),
+            workers=geocoder_workers,
+            cache=get_geocode_cache(),
         )
-
-        matches = fussball_scraper.fetch_club_matches(club[0], from_date, to_date)
-
-        for match in matches:
-            venue_id = api_client.find_venue_location(match["address"])
-            if venue_id is None:
-                coordinates = find_lat_long_online(geocoder_url, match["address"])
-                api_client.insert_venue(match["address"], coordinates=coordinates)
-                venue_id = api_client.get_venue_id_by_address(match["address"])
-
-            api_client.insert_age_group(match["age_group"])
-            age_group_id = api_client.get_age_group_id_by_name(match["age_group"])
-
-            api_client.insert_competition(match["league"])
-            competition_id = api_client.get_competition_id_by_name(match["league"])
-
-            # Find or create teams using the new external IDs and URLs
-            # For home team: use home_club_id if available, otherwise fallback to current club
-            home_club_id = match.get("home_club_id", club[0])
-
-            if home_club_id:
-                # Check if home club exists, if not, fetch club info from team URL
-                if not api_client.get_club_id_by_external_id(
-                    home_club_id
-                ) and match.get("home_team_url"):
-                    club_info = fussball_scraper.fetch_club_name_from_team_url(
-                        match["home_team_url"]
-                    )
-                    if club_info:
-                        # Create the club with the info from the team page
-                        api_client.insert_club(
-                            club_info["club_id"], club_info["club_name"], None
-                        )
-                        home_club_id = club_info["club_id"]  # Use the correct club ID
-
-                home_team_id = api_client.find_or_create_team(
-                    match["home"], home_club_id, match.get("home_team_id")
-                )
-            else:
-                home_team_id = None
-
-            # For away team: use away_club_id if available, otherwise fallback to current club
-            away_club_id = match.get("away_club_id", club[0])
-
-            if away_club_id:
-                # Check if away club exists, if not, fetch club info from team URL
-                if not api_client.get_club_id_by_external_id(
-                    away_club_id
-                ) and match.get("away_team_url"):
-                    club_info = fussball_scraper.fetch_club_name_from_team_url(
-                        match["away_team_url"]
-                    )
-                    if club_info:
-                        # Create the club with the info from the team page
-                        api_client.insert_club(
-                            club_info["club_id"], club_info["club_name"], None
-                        )
-                        away_club_id = club_info["club_id"]  # Use the correct club ID
-
-                away_team_id = api_client.find_or_create_team(
-                    match["away"], away_club_id, match.get("away_team_id")
-                )
-            else:
-                away_team_id = None
-
-            # Insert match with proper foreign keys
-            if all(
-                [
-                    isinstance(home_team_id, int | None),
-                    isinstance(away_team_id, int | None),
-                    isinstance(venue_id, int),
-                    isinstance(age_group_id, int),
-                    isinstance(competition_id, int),
-                ]
-            ):
-                # Type assertions since we've verified they're integers above
-                home_id: int | None = home_team_id  # type: ignore
-                away_id: int | None = away_team_id  # type: ignore
-                v_id: int = venue_id  # type: ignore
-                age_id: int = age_group_id  # type: ignore
-                comp_id: int = competition_id  # type: ignore
-
-                api_client.upsert_match(
-                    match["url"], match["time"], home_id, away_id, v_id, age_id, comp_id
-                )
+        geocoder.resume()
+    try:
+        _crawl_clubs(
+            clubs,
+            from_date,
+            to_date,
+            geocoder_url,
+            progress,
+            workers,
+            processes,
+            queue_size,
+            batch_size,
+            geocoder,
+            state,
+            window_days,
+        )
+    except KeyboardInterrupt:
+        if geocoder is not None:
+            geocoder.cancel()
+        raise
+    finally:
+        if checkpoint is not None:
+            checkpoint.flush()
+    if geocoder is not None:
+        geocoder.finish()
+    finish_crawl(progress, checkpoint, state)
     logger.info("Finished processing all clubs.")
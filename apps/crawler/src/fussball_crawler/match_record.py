@@ -0,0 +1,125 @@
+"""Compact record of a scraped match."""
+
+import sys
+from collections.abc import Iterator, Mapping
+from datetime import datetime
+from typing import Any
+
+BASE_URL = "https://www.fussball.de"
+
+# Keys of the dict view, in the order the scraper used to build match dicts
+KEYS = (
+    "time",
+    "home",
+    "away",
+    "home_club_id",
+    "away_club_id",
+    "home_team_id",
+    "away_team_id",
+    "home_team_url",
+    "away_team_url",
+    "age_group",
+    "league",
+    "address",
+    "url",
+)
+
+
+def _intern(value: str | None) -> str | None:
+    return None if value is None else sys.intern(value)
+
+
+def _team_path(url: str | None) -> str | None:
+    if url is not None and url.startswith(BASE_URL):
+        url = url[len(BASE_URL) :]
+    return _intern(url)
+
+
+def _team_url(path: str | None) -> str | None:
+    if path is None or path.startswith("http"):
+        return path
+    return BASE_URL + path
+
+
+class MatchRecord(Mapping[str, Any]):
+    """
+    A match scraped from a schedule page.
+
+    Fields are slots; names, IDs, age groups, leagues and addresses repeat
+    across a club's matches and are interned, and team URLs are stored
+    without the fussball.de prefix. The read-only mapping interface is the
+    dict view older callers use (record["url"], record.get(...), dict(record)).
+    """
+
+    __slots__ = (
+        "time",
+        "home",
+        "away",
+        "home_club_id",
+        "away_club_id",
+        "home_team_id",
+        "away_team_id",
+        "home_team_path",
+        "away_team_path",
+        "age_group",
+        "league",
+        "address",
+        "url",
+    )
+
+    def __init__(
+        self,
+        time: datetime,
+        home: str,
+        away: str,
+        home_club_id: str | None,
+        away_club_id: str | None,
+        home_team_id: str | None,
+        away_team_id: str | None,
+        home_team_url: str | None,
+        away_team_url: str | None,
+        age_group: str,
+        league: str,
+        address: str,
+        url: str,
+    ) -> None:
+        self.time = time
+        self.home = sys.intern(home)
+        self.away = sys.intern(away)
+        self.home_club_id = _intern(home_club_id)
+        self.away_club_id = _intern(away_club_id)
+        self.home_team_id = _intern(home_team_id)
+        self.away_team_id = _intern(away_team_id)
+        self.home_team_path = _team_path(home_team_url)
+        self.away_team_path = _team_path(away_team_url)
+        self.age_group = sys.intern(age_group)
+        self.league = sys.intern(league)
+        self.address = sys.intern(address)
+        self.url = url
+
+    @property
+    def home_team_url(self) -> str | None:
+        return _team_url(self.home_team_path)
+
+    @property
+    def away_team_url(self) -> str | None:
+        return _team_url(self.away_team_path)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(KEYS)
+
+    def __len__(self) -> int:
+        return len(KEYS)
+
+    def __reduce__(self) -> tuple[type["MatchRecord"], tuple[Any, ...]]:
+        # Positional fields pickle smaller and faster than a slot state dict,
+        # and unpickling interns the strings again
+        return MatchRecord, tuple(self[key] for key in KEYS)
+
+    def __repr__(self) -> str:
+        return f"MatchRecord({dict(self)!r})"
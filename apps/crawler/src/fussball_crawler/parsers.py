@@ -0,0 +1,64 @@
+"""Selection of the HTML parser backend used to build BeautifulSoup trees."""
+
+import os
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+PARSER_ENV_VAR = "FUSSBALL_CRAWLER_PARSER"
+
+# Fastest first; "auto" picks the first one that is installed
+PARSER_BACKENDS = ("lxml", "html.parser")
+PARSER_CHOICES = ("auto", *PARSER_BACKENDS)
+
+_parser: str | None = None
+
+
+def is_available(backend: str) -> bool:
+    """Check whether BeautifulSoup can use a parser backend."""
+    return builder_registry.lookup(backend) is not None
+
+
+def available_parsers() -> list[str]:
+    """All installed parser backends, fastest first."""
+    return [backend for backend in PARSER_BACKENDS if is_available(backend)]
+
+
+def resolve_parser(name: str) -> str:
+    """Map a configured parser name to an installed backend."""
+    if name not in PARSER_CHOICES:
+        raise ValueError(
+            f"Unknown parser backend: {name} (expected one of {', '.join(PARSER_CHOICES)})"
+        )
+    if name == "auto":
+        return available_parsers()[0]
+    if not is_available(name):
+        logger.warning(f"Parser backend {name} is not installed, using html.parser")
+        return "html.parser"
+    return name
+
+
+def configure_parser(name: str | None = None) -> str:
+    """Set the parser backend (default: $FUSSBALL_CRAWLER_PARSER or auto)."""
+    global _parser
+    _parser = resolve_parser(name or os.getenv(PARSER_ENV_VAR) or "auto")
+    logger.debug(f"Using HTML parser backend: {_parser}")
+    return _parser
+
+
+def get_parser() -> str:
+    """The configured parser backend, resolving the default on first use."""
+    if _parser is None:
+        return configure_parser()
+    return _parser
+
+
+def make_soup(markup: str | bytes, from_encoding: str | None = None) -> BeautifulSoup:
+    """Parse markup with the configured backend."""
+    if isinstance(markup, bytes):
+        return BeautifulSoup(markup, get_parser(), from_encoding=from_encoding)
+    return BeautifulSoup(markup, get_parser())
@@ -0,0 +1,242 @@
+"""
+Staged find-matches pipeline.
+
+I/O threads download schedule pages (one per date window of a club) and the
+fonts they reference, a process pool runs deobfuscation and match extraction
+off the GIL, and writer threads push the resulting match records to the API.
+The stages are connected by bounded queues, so a slow stage throttles the
+ones before it.
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, NamedTuple
+
+from . import parsers
+from . import scraper as fussball_scraper
+from .api_client import DEFAULT_MATCH_BATCH_SIZE
+from .crawl_state import CrawlState
+from .deobfuscator import (
+    Deobfuscator,
+    FontData,
+    extract_obfuscation_ids,
+    network_font_fetcher,
+)
+from .geocoding import DeferredGeocoder
+from .logger import get_logger, setup_logging
+from .match_finder import (
+    CrawlProgress,
+    known_window_fingerprints,
+    save_window_fingerprints,
+    upsert_club_matches,
+)
+
+logger = get_logger(__name__)
+
+_DONE = None  # Queue sentinel
+
+
+class ClubPages(NamedTuple):
+    """The downloaded schedule pages of a club's date windows."""
+
+    club_external_id: str
+    windows: list[tuple[str, str]]
+    tasks: list["PageTask"]
+
+
+class PageTask(NamedTuple):
+    """A downloaded schedule page plus the fonts the workers will need."""
+
+    club_external_id: str
+    content: bytes
+    encoding: str | None
+    fonts: dict[str, bytes]
+    known_fingerprint: str | None = None
+
+
+def download_page(
+    club_external_id: str,
+    from_date: str,
+    to_date: str,
+    known_fingerprint: str | None = None,
+) -> PageTask:
+    """Fetch a club's schedule and every font that is not cached yet."""
+    r = fussball_scraper.fetch_club_schedule(club_external_id, from_date, to_date)
+    font_cache = fussball_scraper.get_font_cache()
+    fonts = {}
+    for obfuscation_id in extract_obfuscation_ids(r.content):
+        if font_cache.get(obfuscation_id) is None:
+            fonts[obfuscation_id] = bytes(network_font_fetcher(obfuscation_id))
+    return PageTask(club_external_id, r.content, r.encoding, fonts, known_fingerprint)
+
+
+def parse_page(task: PageTask) -> fussball_scraper.ClubSchedule:
+    """Deobfuscate a downloaded page and extract its matches (runs in a worker process)."""
+
+    def fetch_font(obfuscation_id: str) -> FontData:
+        font = task.fonts.get(obfuscation_id)
+        return font if font is not None else network_font_fetcher(obfuscation_id)
+
+    deobfuscator = Deobfuscator(
+        font_fetcher=fetch_font, cache=fussball_scraper.get_font_cache()
+    )
+    return fussball_scraper.parse_club_schedule(
+        task.content,
+        task.club_external_id,
+        task.encoding,
+        deobfuscator,
+        task.known_fingerprint,
+    )
+
+
+def _init_worker(parser: str, log_level: str) -> None:
+    os.environ["LOG_LEVEL"] = log_level
+    setup_logging()
+    parsers.configure_parser(parser)
+
+
+def run_pipeline(
+    club_external_ids: list[str],
+    from_date: str,
+    to_date: str,
+    geocoder_url: str,
+    progress: CrawlProgress,
+    io_workers: int = 4,
+    processes: int | None = None,
+    queue_size: int = 32,
+    batch_size: int = DEFAULT_MATCH_BATCH_SIZE,
+    geocoder: DeferredGeocoder | None = None,
+    state: CrawlState | None = None,
+    window_days: int | None = None,
+) -> None:
+    """Crawl clubs with separate download, parse and write stages.
+
+    With window_days, every club's date range is downloaded in windows of that
+    many days, parsed in parallel and merged. With a crawl state, unchanged
+    windows are dropped after parsing.
+    """
+    processes = processes or os.cpu_count() or 1
+    pending: queue.Queue[str] = queue.Queue()
+    for club_external_id in club_external_ids:
+        pending.put(club_external_id)
+    pages: queue.Queue[ClubPages | None] = queue.Queue(maxsize=queue_size)
+    results: queue.Queue[tuple[str, fussball_scraper.ClubMatches] | None] = queue.Queue(
+        maxsize=queue_size
+    )
+    stop = threading.Event()
+
+    pool = ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_init_worker,
+        initargs=(parsers.get_parser(), os.getenv("LOG_LEVEL", "INFO")),
+    )
+
+    def download() -> None:
+        while not stop.is_set():
+            try:
+                club_external_id = pending.get_nowait()
+            except queue.Empty:
+                return
+            if progress.out_of_time():
+                progress.defer()
+                continue
+            windows = fussball_scraper.date_windows(from_date, to_date, window_days)
+            known = {}
+            if state is not None:
+                known = known_window_fingerprints(
+                    state, club_external_id, from_date, to_date, window_days
+                )
+            try:
+                tasks = [
+                    download_page(club_external_id, *window, known.get(window))
+                    for window in windows
+                ]
+            except Exception as e:
+                logger.error(f"Error fetching matches for club {club_external_id}: {e}")
+                progress.advance(failed=True)
+                continue
+            pages.put(ClubPages(club_external_id, windows, tasks))
+
+    def parse() -> None:
+        while (club := pages.get()) is not _DONE:
+            try:
+                futures = [pool.submit(parse_page, task) for task in club.tasks]
+                schedule = fussball_scraper.merge_schedules(
+                    club.club_external_id,
+                    club.windows,
+                    [future.result() for future in futures],
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error parsing matches for club {club.club_external_id}: {e}"
+                )
+                progress.advance(failed=True)
+                continue
+            if schedule.matches is None and state is not None:
+                state.count_skipped()
+                state.record_crawl(club.club_external_id, schedule.fingerprint, None)
+                progress.advance(item=club.club_external_id)
+                continue
+            results.put((club.club_external_id, schedule))
+
+    def write() -> None:
+        while (item := results.get()) is not _DONE:
+            club_external_id, schedule = item
+            failed = False
+            unsaved = 0
+            try:
+                unsaved = upsert_club_matches(
+                    schedule.matches or [],
+                    club_external_id,
+                    geocoder_url,
+                    batch_size,
+                    geocoder,
+                )
+                if state is not None:
+                    if not unsaved:
+                        save_window_fingerprints(
+                            state, club_external_id, schedule.fingerprints
+                        )
+                    state.record_crawl(
+                        club_external_id,
+                        schedule.fingerprint,
+                        len(schedule.matches or []),
+                    )
+            except Exception as e:
+                logger.error(f"Error processing club {club_external_id}: {e}")
+                failed = True
+            progress.advance(failed=failed, item=club_external_id, complete=not unsaved)
+
+    def start(target: Any, count: int, name: str) -> list[threading.Thread]:
+        threads = [
+            threading.Thread(target=target, name=f"{name}-{i}", daemon=True)
+            for i in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    logger.info(
+        f"Pipeline: {io_workers} download/write threads, {processes} parse processes"
+    )
+    download_threads = start(download, io_workers, "download")
+    parse_threads = start(parse, processes, "parse")
+    write_threads = start(write, io_workers, "write")
+    try:
+        for thread in download_threads:
+            thread.join()
+        for _ in parse_threads:
+            pages.put(_DONE)
+        for thread in parse_threads:
+            thread.join()
+        for _ in write_threads:
+            results.put(_DONE)
+        for thread in write_threads:
+            thread.join()
+    except KeyboardInterrupt:
+        stop.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
@@ -0,0 +1,182 @@
+"""Per-host request rate limiting with adaptive concurrency."""
+
+import threading
+import time
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Responses that mean the host wants us to slow down
+THROTTLE_STATUSES = (429, 503)
+
+# Seconds between two "effective rate" log lines of a host
+LOG_INTERVAL = 30.0
+
+
+class HostPolicy(NamedTuple):
+    """Start values and bounds of a host's request rate (req/s) and concurrency."""
+
+    rate: float = 50.0
+    min_rate: float = 0.5
+    max_rate: float = 1000.0
+    concurrency: float = 16.0
+    max_concurrency: float = 256.0
+    # Latencies below this never count as a spike
+    min_spike_latency: float = 0.5
+
+
+# fussball.de throttles aggressive crawlers, so start carefully there; the
+# geocoder and the calcio API are usually local
+HOST_POLICIES = {
+    "www.fussball.de": HostPolicy(rate=5.0, max_rate=50.0, concurrency=4.0),
+}
+
+
+class AdaptiveLimiter:
+    """
+    Token bucket plus concurrency window for one host, adjusted AIMD-style:
+    every completed request raises rate and window a little, a 429/503, a
+    failed request or a latency spike halves them (at most once per second,
+    so a burst of failures from requests already in flight counts once).
+    """
+
+    def __init__(
+        self, host: str, policy: HostPolicy | None = None, spike_factor: float = 3.0
+    ) -> None:
+        self.host = host
+        self.policy = policy or HostPolicy()
+        self.rate = self.policy.rate
+        self.concurrency = self.policy.concurrency
+        self.spike_factor = spike_factor
+        self.in_flight = 0
+        self.completed = 0
+        self.throttled = 0
+        self._tokens = max(1.0, self.rate)
+        self._refilled_at = time.monotonic()
+        self._latency: float | None = None
+        self._last_decrease = 0.0
+        self._logged_at = time.monotonic()
+        self._logged_completed = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take a slot and a token; returns 0 on success, else seconds to wait."""
+        with self._lock:
+            if self.in_flight >= int(self.concurrency):
+                return 0.05
+            now = time.monotonic()
+            capacity = max(1.0, self.rate)
+            self._tokens = min(
+                capacity, self._tokens + (now - self._refilled_at) * self.rate
+            )
+            self._refilled_at = now
+            if self._tokens < 1.0:
+                return (1.0 - self._tokens) / self.rate
+            self._tokens -= 1.0
+            self.in_flight += 1
+            return 0.0
+
+    def acquire(self) -> None:
+        while (wait := self.try_acquire()) > 0:
+            time.sleep(wait)
+
+    def release(self, status_code: int | None, latency: float | None) -> None:
+        """
+        Return a slot. status_code is None if the request failed outright;
+        latency is None for requests whose duration says nothing about the
+        host's load (e.g. bulk writes).
+        """
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+            spike = (
+                latency is not None
+                and self._latency is not None
+                and latency > self.policy.min_spike_latency
+                and latency > self.spike_factor * self._latency
+            )
+            if status_code is None or status_code in THROTTLE_STATUSES or spike:
+                self.throttled += 1
+                self._decrease()
+            else:
+                self._increase()
+                if latency is not None:
+                    self._latency = (
+                        latency
+                        if self._latency is None
+                        else 0.8 * self._latency + 0.2 * latency
+                    )
+        self._maybe_log()
+
+    def _increase(self) -> None:
+        policy = self.policy
+        self.rate = min(policy.max_rate, self.rate + 1.0 / max(1.0, self.rate))
+        self.concurrency = min(
+            policy.max_concurrency, self.concurrency + 1.0 / self.concurrency
+        )
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < 1.0:
+            return
+        self._last_decrease = now
+        self.rate = max(self.policy.min_rate, self.rate / 2)
+        self.concurrency = max(1.0, self.concurrency / 2)
+        self._tokens = min(self._tokens, 1.0)
+
+    def effective_rate(self) -> float:
+        """Completed requests per second since the last log line."""
+        elapsed = time.monotonic() - self._logged_at
+        return (self.completed - self._logged_completed) / elapsed if elapsed else 0.0
+
+    def _maybe_log(self) -> None:
+        if time.monotonic() - self._logged_at < LOG_INTERVAL:
+            return
+        with self._lock:
+            if time.monotonic() - self._logged_at < LOG_INTERVAL:
+                return
+            self.log()
+
+    def log(self) -> None:
+        logger.info(
+            f"{self.host}: {self.effective_rate():.1f} req/s"
+            f" (limit {self.rate:.1f} req/s, concurrency {int(self.concurrency)},"
+            f" {self.throttled} throttled)"
+        )
+        self._logged_at = time.monotonic()
+        self._logged_completed = self.completed
+
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+_enabled = True
+
+
+def configure_rate_limits(enabled: bool = True) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+def get_limiter(url: str) -> AdaptiveLimiter | None:
+    """The limiter of a URL's host, or None if rate limiting is disabled."""
+    if not _enabled:
+        return None
+    host = urlsplit(url).netloc
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = AdaptiveLimiter(host, HOST_POLICIES.get(host))
+            _limiters[host] = limiter
+    return limiter
+
+
+def log_rate_limits() -> None:
+    """Log the current rate of every host contacted so far."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    for limiter in limiters:
+        with limiter._lock:
+            limiter.log()
@@ -0,0 +1,35 @@
+"""Orders clubs by how likely their schedule has new data."""
+
+import math
+import time
+from typing import Any
+
+from .crawl_state import ClubHistory
+
+
+def club_priority(history: ClubHistory | None, now: float) -> float:
+    """
+    Expected value of crawling a club now: how often its schedule changed
+    (smoothed, so a few crawls don't pin it to 0 or 1), weighted by how many
+    matches it has and by the hours since its last crawl. Clubs that were
+    never crawled come first.
+    """
+    if history is None:
+        return math.inf
+    change_rate = (history.changes + 1) / (history.crawls + 2)
+    hours_since_crawl = max(0.0, now - history.crawled_at) / 3600
+    return change_rate * (1 + math.log1p(history.matches)) * (1 + hours_since_crawl)
+
+
+def prioritize_clubs(
+    clubs: list[tuple[Any, ...]],
+    histories: dict[str, ClubHistory],
+    max_clubs: int | None = None,
+    now: float | None = None,
+) -> list[tuple[Any, ...]]:
+    """Clubs by descending priority, at most max_clubs of them."""
+    now = time.time() if now is None else now
+    ordered = sorted(
+        clubs, key=lambda club: -club_priority(histories.get(str(club[0])), now)
+    )
+    return ordered if max_clubs is None else ordered[:max_clubs]
@@ -1,27 +1,85 @@
+import functools
 import json
-import locale
+import os
 import re
-from datetime import datetime
-from typing import Any
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Any, NamedTuple
 
 import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
+from .crawl_state import fingerprint
 from .deobfuscator import Deobfuscator
+from .font_cache import FontMappingCache, default_cache_dir
+from .http_cache import HttpCache
 from .logger import get_logger, setup_logging
+from .match_record import MatchRecord
+from .parsers import make_soup
+from .transport import get_session
 
 # Setup centralized logging
 setup_logging()
 logger = get_logger(__name__)
 
+# Font mappings are shared by every page of a run and persisted across runs
+_font_cache: FontMappingCache | None = None
 
-def get_matches(table: Tag) -> list[dict[str, Any]]:
+
+def get_font_cache() -> FontMappingCache:
+    global _font_cache
+    if _font_cache is None:
+        _font_cache = FontMappingCache(os.path.join(default_cache_dir(), "fonts"))
+    return _font_cache
+
+
+# Responses of fussball.de pages, revalidated across runs
+_http_cache: HttpCache | None = None
+_http_cache_enabled = True
+
+
+def configure_http_cache(enabled: bool = True) -> None:
+    global _http_cache_enabled
+    _http_cache_enabled = enabled
+
+
+def get_http_cache() -> HttpCache | None:
+    global _http_cache
+    if not _http_cache_enabled:
+        return None
+    if _http_cache is None:
+        _http_cache = HttpCache(os.path.join(default_cache_dir(), "http"))
+    return _http_cache
+
+
+def cached_get(
+    url: str, url_class: str, headers: dict[str, str] | None = None
+) -> requests.Response:
+    """GET a fussball.de page through the HTTP cache (if enabled)"""
+    http_cache = get_http_cache()
+    if http_cache is None:
+        return get_session().get(url, headers=headers)
+    return http_cache.get(get_session(), url, url_class, headers)
+
+
+# Table rows of one match, after the table's header row
+ROWS_PER_MATCH = 4
+
+
+def get_matches(table: Tag) -> list[MatchRecord]:
     """Extract matches from the fussball.de table"""
-    matches = []
+    return list(iter_matches(table))
+
+
+def iter_matches(table: Tag) -> Iterator[MatchRecord]:
+    """Yield the matches of a fussball.de table as its rows are parsed"""
     rows = table.find_all("tr")
     current_date = None  # Store the current date for time-only entries
 
-    for i in range(0, len(rows) - 1, 4):
+    for i in range(0, len(rows) - 1, ROWS_PER_MATCH):
         headline_row = rows[i + 1]
         if not isinstance(headline_row, Tag):
             logger.warning(f"Row at index {i + 1} is not a Tag: {type(headline_row)}")
@@ -260,102 +318,380 @@ def get_matches(table: Tag) -> list[dict[str, Any]]:
         # name = venue_split[0].strip()
         address = venue_split[1].strip()
         city = venue_split[2].strip()
-        matches.append(
-            {
-                "time": datetime_obj,
-                "home": home_name,
-                "away": away_name,
-                "home_club_id": home_club_id,
-                "away_club_id": away_club_id,
-                "home_team_id": home_team_id,
-                "away_team_id": away_team_id,
-                "home_team_url": home_team_url,
-                "away_team_url": away_team_url,
-                "age_group": age_group,
-                "league": league,
-                "address": address + ", " + city,
-                "url": url,
-            }
+        yield MatchRecord(
+            time=datetime_obj,
+            home=home_name,
+            away=away_name,
+            home_club_id=home_club_id,
+            away_club_id=away_club_id,
+            home_team_id=home_team_id,
+            away_team_id=away_team_id,
+            home_team_url=home_team_url,
+            away_team_url=away_team_url,
+            age_group=age_group,
+            league=league,
+            address=address + ", " + city,
+            url=str(url),
         )
-    return matches
 
 
 def de_obfuscate(r: requests.Response) -> str:
     """De-obfuscate all spans with any obfuscation ID using their respective font files"""
-    deobfuscator = Deobfuscator()
+    deobfuscator = Deobfuscator(cache=get_font_cache())
     return deobfuscator.deobfuscate_html(r.text)
 
 
+# German weekday names and their abbreviations, Monday first
+GERMAN_WEEKDAYS = (
+    "Montag",
+    "Dienstag",
+    "Mittwoch",
+    "Donnerstag",
+    "Freitag",
+    "Samstag",
+    "Sonntag",
+)
+GERMAN_WEEKDAY_ABBREVIATIONS = ("Mo", "Di", "Mi", "Do", "Fr", "Sa", "So")
+_WEEKDAYS = {
+    name.lower()
+    for names in (GERMAN_WEEKDAYS, GERMAN_WEEKDAY_ABBREVIATIONS)
+    for name in names
+}
+
+# "Fr, 25.07.25" or "Sonntag, 15.06.2025", then "19:30" with an optional "Uhr"
+_DATE_TIME = re.compile(
+    r"\s*(?:(?P<weekday>\w+)\.?,\s*)?"
+    r"(?P<day>\d{1,2})\.(?P<month>\d{1,2})\.(?P<year>\d{4}|\d{2})"
+    r"\s+(?P<hour>\d{1,2}):(?P<minute>\d{2})(?:\s*Uhr)?\s*"
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_date_time(date: str, time: str) -> datetime | None:
-    """Parse German date and time format from fussball.de"""
-    try:
-        locale.setlocale(locale.LC_TIME, "de_DE.UTF-8")
-    except locale.Error:
-        logger.warning("Locale de_DE.UTF8 not found")
-        pass
+    """Parse German date and time format from fussball.de.
 
-    # Handle different date formats
+    Independent of the installed locales; a club's matches share few distinct
+    dates and kick-off times, so results are memoized.
+    """
+    match = _DATE_TIME.fullmatch(f"{date} {time}")
+    weekday = match["weekday"] if match else None
+    if match is None or (weekday is not None and weekday.lower() not in _WEEKDAYS):
+        logger.warning(f"Error parsing date: {date} {time}")
+        return None
+    year = int(match["year"])
+    if len(match["year"]) == 2:
+        # Like strptime's %y
+        year += 2000 if year < 69 else 1900
     try:
-        # Try new short format: "Fr, 25.07.25"
-        if len(date.split(".")) == 3 and len(date.split(".")[-1]) == 2:
-            # Short year format like "Fr, 25.07.25"
-            date_format = "%a, %d.%m.%y %H:%M"
-            parsed_date = datetime.strptime(date + " " + time, date_format)
-            return parsed_date
-        else:
-            # Try old long format: "Sonntag, 15.06.2025"
-            date_format = "%A, %d.%m.%Y %H:%M Uhr"
-            parsed_date = datetime.strptime(date + " " + time, date_format)
-            return parsed_date
+        return datetime(
+            year,
+            int(match["month"]),
+            int(match["day"]),
+            int(match["hour"]),
+            int(match["minute"]),
+        )
     except ValueError as e:
-        # If both fail, try without "Uhr" suffix
-        try:
-            date_format = "%A, %d.%m.%Y %H:%M"
-            parsed_date = datetime.strptime(date + " " + time, date_format)
-            return parsed_date
-        except ValueError:
-            logger.warning(f"Error parsing date: {date} {time} - {e}")
-            return None
+        logger.warning(f"Error parsing date: {date} {time} - {e}")
+        return None
 
 
-def fetch_club_matches(
-    club_external_id: str, from_date: str, to_date: str
-) -> list[dict[str, Any]]:
-    """Fetch matches for a specific club from fussball.de"""
-    url = (
+# Matches of a print schedule page; fussball.de silently drops everything beyond
+MAX_SCHEDULE_MATCHES = 999
+
+# Date windows of one club fetched at the same time
+WINDOW_WORKERS = 4
+
+
+def club_schedule_url(club_external_id: str, from_date: str, to_date: str) -> str:
+    """URL of a club's print schedule page for a date range"""
+    return (
         "https://www.fussball.de/vereinsspielplan.druck/-/datum-bis/"
         + to_date
         + "/datum-von/"
         + from_date
         + "/id/"
         + club_external_id
-        + "/match-type/-1/max/999/mode/PRINT/show-venues/true#!/"
+        + f"/match-type/-1/max/{MAX_SCHEDULE_MATCHES}/mode/PRINT/show-venues/true#!/"
     )
 
-    try:
-        r = requests.get(url)
-        soup = BeautifulSoup(r.text, "html.parser")
-        html_content = de_obfuscate(r)
-        soup = BeautifulSoup(html_content, "html.parser")
-        table = soup.find("table", {"class": "table table-striped table-full-width"})
-
-        if table is None or not isinstance(table, Tag):
-            if "Kein Spielbetrieb" in soup.text:
-                logger.debug(
-                    f"No matches found for club {club_external_id} - No Spielbetrieb"
-                )
-                return []
-            logger.warning(f"No valid table found for club {club_external_id}")
-            return []
 
-        matches = get_matches(table)
-        return matches
+def date_windows(
+    from_date: str, to_date: str, days: int | None = None
+) -> list[tuple[str, str]]:
+    """Split an inclusive YYYY-MM-DD range into windows of at most `days` days"""
+    if not days:
+        return [(from_date, to_date)]
+    start, end = date.fromisoformat(from_date), date.fromisoformat(to_date)
+    windows = []
+    while start <= end:
+        stop = min(end, start + timedelta(days=days - 1))
+        windows.append((start.isoformat(), stop.isoformat()))
+        start = stop + timedelta(days=1)
+    return windows or [(from_date, to_date)]
+
+
+def fetch_club_schedule(
+    club_external_id: str, from_date: str, to_date: str
+) -> requests.Response:
+    """Download the raw print schedule page of a club from fussball.de"""
+    return cached_get(
+        club_schedule_url(club_external_id, from_date, to_date), "schedule"
+    )
 
+
+def fetch_club_matches(
+    club_external_id: str, from_date: str, to_date: str, window_days: int | None = None
+) -> list[MatchRecord]:
+    """Fetch matches for a specific club from fussball.de"""
+    try:
+        if window_days:
+            club_matches = fetch_club_windows(
+                club_external_id, from_date, to_date, window_days
+            )
+            return club_matches.matches or []
+        r = fetch_club_schedule(club_external_id, from_date, to_date)
+        return parse_club_matches(r.content, club_external_id, encoding=r.encoding)
     except Exception as e:
         logger.error(f"Error fetching matches for club {club_external_id}: {e}")
         return []
 
 
+def fetch_club_schedule_matches(
+    club_external_id: str,
+    from_date: str,
+    to_date: str,
+    known_fingerprint: str | None = None,
+    lazy: bool = False,
+) -> "ClubSchedule":
+    """Fetch a club's schedule, extracting matches only if its table changed"""
+    r = fetch_club_schedule(club_external_id, from_date, to_date)
+    return parse_club_schedule(
+        r.content,
+        club_external_id,
+        encoding=r.encoding,
+        known_fingerprint=known_fingerprint,
+        lazy=lazy,
+    )
+
+
+def fetch_club_windows(
+    club_external_id: str,
+    from_date: str,
+    to_date: str,
+    window_days: int | None = None,
+    known_fingerprints: dict[tuple[str, str], str] | None = None,
+) -> "ClubMatches":
+    """Fetch a club's schedule in date windows (in parallel) and merge the matches"""
+    windows = date_windows(from_date, to_date, window_days)
+    known = known_fingerprints or {}
+
+    def fetch(window: tuple[str, str]) -> ClubSchedule:
+        return fetch_club_schedule_matches(
+            club_external_id, window[0], window[1], known.get(window)
+        )
+
+    if len(windows) == 1:
+        schedules = [fetch(windows[0])]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(len(windows), WINDOW_WORKERS),
+            thread_name_prefix="window",
+        ) as executor:
+            schedules = list(executor.map(fetch, windows))
+    return merge_schedules(club_external_id, windows, schedules)
+
+
+class ClubSchedule(NamedTuple):
+    """Fingerprint of a club's deobfuscated match table and its matches.
+
+    matches is None if the fingerprint equals the one the caller already knew,
+    and an iterator that extracts them on demand if the page was parsed lazily.
+    rows counts the table's <tr> rows, extracted or not, to detect truncated
+    pages.
+    """
+
+    fingerprint: str
+    matches: Iterable[MatchRecord] | None
+    rows: int = 0
+
+
+class ClubMatches(NamedTuple):
+    """A club's matches, merged from the schedules of its date windows."""
+
+    # Matches of the windows that changed; None if none did
+    matches: list[MatchRecord] | None
+    # Fingerprints of the windows that changed
+    fingerprints: dict[tuple[str, str], str]
+    # Fingerprint of all windows together
+    fingerprint: str
+    # Whether every window was parsed
+    complete: bool
+
+
+def merge_schedules(
+    club_external_id: str,
+    windows: list[tuple[str, str]],
+    schedules: list[ClubSchedule],
+) -> ClubMatches:
+    """Merge the schedules of a club's date windows, dropping duplicate matches"""
+    changed = {}
+    matches: list[MatchRecord] = []
+    seen_urls: set[str] = set()
+    for window, schedule in zip(windows, schedules, strict=True):
+        if schedule.matches is None:
+            continue
+        changed[window] = schedule.fingerprint
+        warn_if_truncated(club_external_id, window, schedule)
+        matches.extend(unique_matches(schedule.matches, seen_urls))
+    return ClubMatches(
+        matches if changed else None,
+        changed,
+        fingerprint("\n".join(schedule.fingerprint for schedule in schedules)),
+        len(changed) == len(schedules),
+    )
+
+
+def unique_matches(
+    matches: Iterable[MatchRecord], seen_urls: set[str]
+) -> Iterator[MatchRecord]:
+    """Yield the matches whose URL was not seen yet"""
+    for match in matches:
+        url = match.get("url")
+        if url is not None:
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+        yield match
+
+
+def warn_if_truncated(
+    club_external_id: str, window: tuple[str, str], schedule: ClubSchedule
+) -> None:
+    """Warn if a window's table reached the match cap of a schedule page"""
+    # A header row, then one block of rows per match
+    if (schedule.rows - 1) // ROWS_PER_MATCH >= MAX_SCHEDULE_MATCHES:
+        logger.warning(
+            f"Schedule of club {club_external_id} from {window[0]} to {window[1]}"
+            f" reached the {MAX_SCHEDULE_MATCHES} match cap; matches may be missing,"
+            " use smaller date windows"
+        )
+
+
+class ClubMatchStream:
+    """A club's matches across its date windows, extracted as they are consumed.
+
+    Up to WINDOW_WORKERS pages are fetched and deobfuscated ahead of the
+    consumer, so memory does not grow with the date range. Once iterated,
+    fingerprints and fingerprint are set as in ClubMatches.
+    """
+
+    def __init__(
+        self,
+        club_external_id: str,
+        from_date: str,
+        to_date: str,
+        window_days: int | None = None,
+        known_fingerprints: dict[tuple[str, str], str] | None = None,
+    ) -> None:
+        self.club_external_id = club_external_id
+        self.windows = date_windows(from_date, to_date, window_days)
+        self.known_fingerprints = known_fingerprints or {}
+        self.fingerprints: dict[tuple[str, str], str] = {}
+        self.fingerprint: str | None = None
+
+    def __iter__(self) -> Iterator[MatchRecord]:
+        seen_urls: set[str] = set()
+        window_fingerprints = []
+        windows = iter(self.windows)
+        pending: deque[tuple[tuple[str, str], Future[ClubSchedule]]] = deque()
+        with ThreadPoolExecutor(
+            max_workers=min(len(self.windows), WINDOW_WORKERS),
+            thread_name_prefix="window",
+        ) as executor:
+            while True:
+                for window in islice(windows, WINDOW_WORKERS - len(pending)):
+                    future = executor.submit(
+                        fetch_club_schedule_matches,
+                        self.club_external_id,
+                        window[0],
+                        window[1],
+                        self.known_fingerprints.get(window),
+                        lazy=True,
+                    )
+                    pending.append((window, future))
+                if not pending:
+                    break
+                window, future = pending.popleft()
+                schedule = future.result()
+                window_fingerprints.append(schedule.fingerprint)
+                if schedule.matches is None:
+                    continue
+                self.fingerprints[window] = schedule.fingerprint
+                warn_if_truncated(self.club_external_id, window, schedule)
+                yield from unique_matches(schedule.matches, seen_urls)
+        self.fingerprint = fingerprint("\n".join(window_fingerprints))
+
+
+def parse_club_matches(
+    content: bytes | str,
+    club_external_id: str,
+    encoding: str | None = None,
+    deobfuscator: Deobfuscator | None = None,
+) -> list[MatchRecord]:
+    """Parse a club's print schedule once, deobfuscate it in place and extract its matches"""
+    return list(iter_club_matches(content, club_external_id, encoding, deobfuscator))
+
+
+def iter_club_matches(
+    content: bytes | str,
+    club_external_id: str,
+    encoding: str | None = None,
+    deobfuscator: Deobfuscator | None = None,
+) -> Iterator[MatchRecord]:
+    """Generator form of parse_club_matches"""
+    schedule = parse_club_schedule(
+        content, club_external_id, encoding, deobfuscator, lazy=True
+    )
+    yield from schedule.matches or []
+
+
+def parse_club_schedule(
+    content: bytes | str,
+    club_external_id: str,
+    encoding: str | None = None,
+    deobfuscator: Deobfuscator | None = None,
+    known_fingerprint: str | None = None,
+    lazy: bool = False,
+) -> ClubSchedule:
+    """Like parse_club_matches, but skips match extraction for an unchanged table.
+
+    With lazy, matches are extracted only as the returned iterator is consumed.
+    """
+    soup = make_soup(content, from_encoding=encoding)
+    if deobfuscator is None:
+        deobfuscator = Deobfuscator(cache=get_font_cache())
+    deobfuscator.deobfuscate_soup(soup)
+    table = soup.find("table", {"class": "table table-striped table-full-width"})
+
+    if table is None or not isinstance(table, Tag):
+        if "Kein Spielbetrieb" in soup.text:
+            logger.debug(
+                f"No matches found for club {club_external_id} - No Spielbetrieb"
+            )
+        else:
+            logger.warning(f"No valid table found for club {club_external_id}")
+        return ClubSchedule(fingerprint(""), [])
+
+    table_fingerprint = fingerprint(str(table))
+    if table_fingerprint == known_fingerprint:
+        return ClubSchedule(table_fingerprint, None)
+    return ClubSchedule(
+        table_fingerprint,
+        iter_matches(table) if lazy else get_matches(table),
+        len(table.find_all("tr")),
+    )
+
+
 def fetch_club_name_from_team_url(team_url: str) -> dict[str, str] | None:
     """
     Fetch club name and ID from a team page by parsing JavaScript variables.
@@ -363,7 +699,7 @@ def fetch_club_name_from_team_url(team_url: str) -> dict[str, str] | None:
     """
     try:
         logger.debug(f"Fetching club info from team URL: {team_url}")
-        r = requests.get(team_url)
+        r = cached_get(team_url, "team")
 
         if r.status_code != 200:
             logger.warning(
@@ -371,85 +707,115 @@ def fetch_club_name_from_team_url(team_url: str) -> dict[str, str] | None:
             )
             return None
 
-        # Look for the JavaScript variables in the page content
-        # Pattern to match edVereinId='...' and edVereinName='...'
-        club_id_match = re.search(r"edVereinId='([^']+)'", r.text)
-        club_name_match = re.search(r"edVereinName='([^']+)'", r.text)
-
-        if club_id_match and club_name_match:
-            club_id = club_id_match.group(1)
-            club_name = club_name_match.group(1)
-
-            logger.debug(f"Found club info: {club_name} (ID: {club_id})")
-            return {"club_id": club_id, "club_name": club_name}
-        else:
+        club_info = parse_club_info(r.text)
+        if club_info is None:
             logger.warning(f"Could not find club information in team page: {team_url}")
-            return None
+        return club_info
 
     except Exception as e:
         logger.error(f"Error fetching club info from team URL {team_url}: {e}")
         return None
 
 
-def fetch_all_clubs_for_post_code(postal_code: str) -> str:
-    """Fetch all clubs for a postal code, including load-more results."""
-    # Get the initial page
-    url = "https://www.fussball.de/suche.verein/-/plz/" + postal_code + "#!/"
-    logger.debug("Fetching URL: %s", url)
+def parse_club_info(text: str) -> dict[str, str] | None:
+    """Extract club ID and name from the JavaScript variables of a team page."""
+    # Pattern to match edVereinId='...' and edVereinName='...'
+    club_id_match = re.search(r"edVereinId='([^']+)'", text)
+    club_name_match = re.search(r"edVereinName='([^']+)'", text)
 
-    r = requests.get(url)
-    initial_html = r.text
+    if club_id_match and club_name_match:
+        club_id = club_id_match.group(1)
+        club_name = club_name_match.group(1)
 
-    # Parse to check if there's a load-more button
-    soup = BeautifulSoup(initial_html, "html.parser")
+        logger.debug(f"Found club info: {club_name} (ID: {club_id})")
+        return {"club_id": club_id, "club_name": club_name}
+    return None
+
+
+# Page size of the club search's load-more requests
+LOAD_MORE_PAGE_SIZE = 20
+LOAD_MORE_HEADERS = {
+    "Accept": "application/json",
+    "X-Requested-With": "XMLHttpRequest",
+}
+
+
+def club_search_url(postal_code: str) -> str:
+    """URL of the club search page for a postal code"""
+    return "https://www.fussball.de/suche.verein/-/plz/" + postal_code + "#!/"
+
+
+def find_load_more_resource(html: str) -> str | None:
+    """AJAX URL of the club search's load-more form, if the page has one"""
+    soup = make_soup(html)
     load_more_form = soup.find("form", {"data-ajax-resource": True})
     if not load_more_form or not isinstance(load_more_form, Tag):
-        return initial_html
+        return None
 
-    # Extract AJAX URL and parameters
     ajax_url = load_more_form.get("data-ajax-resource")
     if not ajax_url or not isinstance(ajax_url, str):
+        return None
+    return ajax_url
+
+
+def load_more_url(ajax_url: str, postal_code: str, offset: int) -> str:
+    """URL of one page of additional club search results"""
+    return ajax_url.replace(
+        f"/plz/{postal_code}",
+        f"/plz/{postal_code}/offset/{offset}/max/{LOAD_MORE_PAGE_SIZE}",
+    )
+
+
+def append_load_more_html(all_html: str, json_data: Any) -> str | None:
+    """Merge a load-more response into the page, or None when there are no more results"""
+    # Check if we got more results
+    if "html" not in json_data or not json_data["html"].strip():
+        return None
+
+    # Append new results to our HTML
+    return all_html.replace("</ul>", json_data["html"] + "</ul>")
+
+
+def fetch_all_clubs_for_post_code(postal_code: str) -> str:
+    """Fetch all clubs for a postal code, including load-more results."""
+    # Get the initial page
+    url = club_search_url(postal_code)
+    logger.debug("Fetching URL: %s", url)
+
+    r = cached_get(url, "club_search")
+    initial_html = r.text
+
+    # Check if there's a load-more button
+    ajax_url = find_load_more_resource(initial_html)
+    if ajax_url is None:
         return initial_html
 
     logger.debug("Found load-more for %s, fetching additional results...", postal_code)
 
     # Fetch additional results via AJAX
     all_html = initial_html
-    offset = 20
-    max_results = 20
+    offset = LOAD_MORE_PAGE_SIZE
 
     while True:
-        ajax_request_url = ajax_url.replace(
-            f"/plz/{postal_code}",
-            f"/plz/{postal_code}/offset/{offset}/max/{max_results}",
-        )
+        ajax_request_url = load_more_url(ajax_url, postal_code, offset)
 
         try:
-            ajax_response = requests.get(
-                ajax_request_url,
-                headers={
-                    "Accept": "application/json",
-                    "X-Requested-With": "XMLHttpRequest",
-                },
+            ajax_response = cached_get(
+                ajax_request_url, "club_search", headers=LOAD_MORE_HEADERS
             )
 
             if ajax_response.status_code != 200:
                 break
 
-            json_data = ajax_response.json()
-
-            # Check if we got more results
-            if "html" not in json_data or not json_data["html"].strip():
+            merged_html = append_load_more_html(all_html, ajax_response.json())
+            if merged_html is None:
                 break
+            all_html = merged_html
 
-            # Append new results to our HTML
-            additional_html = json_data["html"]
-            all_html = all_html.replace("</ul>", additional_html + "</ul>")
-
-            offset += max_results
+            offset += LOAD_MORE_PAGE_SIZE
             logger.debug(
                 "Loaded %d more results for %s (offset: %d)",
-                max_results,
+                LOAD_MORE_PAGE_SIZE,
                 postal_code,
                 offset,
             )
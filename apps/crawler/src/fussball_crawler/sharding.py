@@ -0,0 +1,46 @@
+"""Deterministic split of crawl work across machines."""
+
+import hashlib
+from collections.abc import Callable, Iterable
+from typing import NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+
+class Shard(NamedTuple):
+    """Shard ``index`` (1-based) of ``count``."""
+
+    index: int
+    count: int
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    def owns(self, key: str) -> bool:
+        """Whether this shard is responsible for a postal code or club ID.
+
+        Depends on nothing but the key, so growing the input list never moves
+        existing keys to another shard.
+        """
+        digest = hashlib.sha256(key.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") % self.count == self.index - 1
+
+
+def parse_shard(value: str) -> Shard:
+    """Parse a "K/N" shard spec with 1 <= K <= N."""
+    index, sep, count = value.partition("/")
+    if not sep or not index.isdigit() or not count.isdigit():
+        raise ValueError(f"expected K/N, got {value!r}")
+    shard = Shard(int(index), int(count))
+    if not 1 <= shard.index <= shard.count:
+        raise ValueError(f"shard index must be between 1 and {shard.count}: {value}")
+    return shard
+
+
+def select_shard(
+    items: Iterable[T], shard: Shard | None, key: Callable[[T], str] = str
+) -> list[T]:
+    """The items owned by a shard (all of them without one)."""
+    if shard is None:
+        return list(items)
+    return [item for item in items if shard.owns(key(item))]
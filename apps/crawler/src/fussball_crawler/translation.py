@@ -0,0 +1,63 @@
+"""Compiled char translation for deobfuscated fussball.de text."""
+
+import re
+
+# Post-processing cleanup for common patterns
+CLEANUP_PATTERNS = {
+    "germandbls": "ß",
+    "udieresis": "ü",
+    "adieresis": "ä",
+    "odieresis": "ö",
+    "Udieresis": "Ü",
+    "Adieresis": "Ä",
+    "Odieresis": "Ö",
+    "bar": "|",
+    " bar ": " | ",
+    "k.A. bar k.A. bar k.A.": "k.A. | k.A. | k.A.",
+}
+
+# Longest patterns first, so one left-to-right pass gives the same result as
+# applying the replacements one after another
+_CLEANUP_RE = re.compile(
+    "|".join(re.escape(p) for p in sorted(CLEANUP_PATTERNS, key=len, reverse=True))
+)
+
+
+def _cleanup(match: re.Match[str]) -> str:
+    return CLEANUP_PATTERNS[match.group(0)]
+
+
+class CharTranslator:
+    """
+    A font's char mapping compiled into a single ``str.translate`` table.
+
+    Applying the mapping entry by entry with ``str.replace`` lets a replacement
+    be rewritten again by a later entry. Every key is a single character, so
+    that chain can be resolved per character up front, which keeps the output
+    identical to the sequential replacement.
+    """
+
+    __slots__ = ("mapping", "_table")
+
+    def __init__(self, char_mapping: dict[str, str]) -> None:
+        self.mapping = char_mapping
+        order = {char: index for index, char in enumerate(char_mapping)}
+        values = list(char_mapping.values())
+
+        def resolve(text: str, start: int) -> str:
+            # Result of applying entries start.. to text, one char at a time
+            parts = []
+            for char in text:
+                index = order.get(char)
+                if index is None or index < start:
+                    parts.append(char)
+                else:
+                    parts.append(resolve(values[index], index + 1))
+            return "".join(parts)
+
+        table = {ord(char): resolve(char, 0).replace("\xa0", " ") for char in order}
+        table.setdefault(0xA0, " ")
+        self._table = table
+
+    def translate(self, text: str) -> str:
+        return _CLEANUP_RE.sub(_cleanup, text.translate(self._table))
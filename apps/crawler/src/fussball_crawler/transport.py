@@ -0,0 +1,177 @@
+"""Pooled, rate-limited HTTP transport for fussball.de, font and geocoder requests."""
+
+import random
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .rate_limit import get_limiter
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TransportConfig(NamedTuple):
+    pool_size: int = 10
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    retries: int = 3
+    backoff_factor: float = 0.5
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        return (self.connect_timeout, self.read_timeout)
+
+
+def backoff_delay(config: TransportConfig, attempt: int) -> float:
+    """Jittered delay before retry number ``attempt`` (starting at 1)."""
+    return random.uniform(0, config.backoff_factor * 2 ** (attempt - 1))
+
+
+def retry_after(headers: Mapping[str, str] | None) -> float:
+    """Seconds a response's Retry-After header asks to wait (0 if none)."""
+    value = headers.get("Retry-After", "") if headers is not None else ""
+    return float(value) if value.isdigit() else 0.0
+
+
+def retry_delay(
+    config: TransportConfig, attempt: int, headers: Mapping[str, str] | None = None
+) -> float:
+    """Delay before retry number ``attempt``, at least what Retry-After asks."""
+    return max(backoff_delay(config, attempt), retry_after(headers))
+
+
+def allowed_retries(config: TransportConfig, method: str) -> int:
+    """Retries of a request; only idempotent methods are retried."""
+    return config.retries if method in Retry.DEFAULT_ALLOWED_METHODS else 0
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that sends every request through its host's AdaptiveLimiter.
+
+    Idempotent requests are retried here on connection errors, timeouts and
+    RETRY_STATUSES (not in urllib3), so every attempt waits for a token and
+    reports its own status and latency to the limiter.
+    """
+
+    def __init__(self, config: TransportConfig | None = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.config = config or TransportConfig(retries=0)
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        retries = allowed_retries(self.config, request.method)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self._send_attempt(request, *args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt > retries:
+                    raise
+                delay = backoff_delay(self.config, attempt)
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt > retries:
+                    return response
+                delay = retry_delay(self.config, attempt, response.headers)
+                response.close()
+            time.sleep(delay)
+
+    def _send_attempt(
+        self, request: Any, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        limiter = get_limiter(request.url)
+        if limiter is None:
+            return super().send(request, *args, **kwargs)
+        limiter.acquire()
+        started = time.monotonic()
+        status_code = None
+        try:
+            response = super().send(request, *args, **kwargs)
+            status_code = response.status_code
+            return response
+        finally:
+            latency = time.monotonic() - started
+            limiter.release(status_code, latency if request.method == "GET" else None)
+
+
+class TransportSession(requests.Session):
+    """Session that applies the transport's timeouts to every request."""
+
+    def __init__(self, timeout: tuple[float, float]) -> None:
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+_config = TransportConfig()
+_adapter: RateLimitedAdapter | None = None
+_api_adapter: RateLimitedAdapter | None = None
+_lock = threading.Lock()
+# Sessions hold cookies and are kept per thread; the adapter, and with it the
+# keep-alive connection pools, is shared by all of them
+_thread_local = threading.local()
+_generation = 0
+
+
+def configure_transport(**changes: Any) -> TransportConfig:
+    """Change transport settings (see TransportConfig) for sessions created from now on."""
+    global _config, _adapter, _api_adapter, _generation
+    with _lock:
+        _config = _config._replace(**changes)
+        for adapter in (_adapter, _api_adapter):
+            if adapter is not None:
+                adapter.close()
+        _adapter = None
+        _api_adapter = None
+        _generation += 1
+        return _config
+
+
+def get_transport_config() -> TransportConfig:
+    return _config
+
+
+def _get_adapter() -> RateLimitedAdapter:
+    global _adapter
+    with _lock:
+        if _adapter is None:
+            _adapter = RateLimitedAdapter(
+                _config,
+                pool_connections=_config.pool_size,
+                pool_maxsize=_config.pool_size,
+            )
+        return _adapter
+
+
+def get_api_adapter() -> RateLimitedAdapter:
+    """The adapter all Calcio API sessions share; API requests are not retried."""
+    global _api_adapter
+    with _lock:
+        if _api_adapter is None:
+            _api_adapter = RateLimitedAdapter(
+                _config._replace(retries=0),
+                pool_connections=_config.pool_size,
+                pool_maxsize=_config.pool_size,
+            )
+        return _api_adapter
+
+
+def get_session() -> requests.Session:
+    """This thread's session on the shared connection pools."""
+    session: TransportSession | None = getattr(_thread_local, "session", None)
+    if session is None or _thread_local.generation != _generation:
+        session = TransportSession(_config.timeout)
+        adapter = _get_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _thread_local.session = session
+        _thread_local.generation = _generation
+    return session
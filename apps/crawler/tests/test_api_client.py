@@ -0,0 +1,190 @@
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler import api_client, transport
+from fussball_crawler.api_client import LookupCache
+
+
+def _response(status_code, body=None):
+    return MagicMock(status_code=status_code, json=lambda: body, text=str(body))
+
+
+class TestLookupCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LookupCache(max_entries=2)
+        cache.put("age_group", "Herren", 1)
+        cache.put("age_group", "Damen", 2)
+        cache.get("age_group", "Herren")
+        cache.put("age_group", "A-Junioren", 3)
+
+        self.assertEqual(cache.get("age_group", "Herren"), 1)
+        self.assertIsNone(cache.get("age_group", "Damen"))
+        self.assertEqual(cache.stats(), (2, 1, 2))
+
+    def test_invalidate_single_entry_or_kind(self):
+        cache = LookupCache()
+        cache.put("venue", "a", 1)
+        cache.put("venue", "b", 2)
+        cache.put("club", "a", 3)
+
+        cache.invalidate("venue", "a")
+        self.assertIsNone(cache.get("venue", "a"))
+        self.assertEqual(cache.get("venue", "b"), 2)
+
+        cache.invalidate("venue")
+        self.assertIsNone(cache.get("venue", "b"))
+        self.assertEqual(cache.get("club", "a"), 3)
+
+    def test_ignores_non_integer_ids(self):
+        cache = LookupCache()
+        cache.put("team", "x", None)
+        self.assertEqual(cache.stats().size, 0)
+
+
+class TestThreadClients(unittest.TestCase):
+    def test_threads_share_one_adapter_until_the_transport_changes(self):
+        clients = []
+
+        def get():
+            clients.append(api_client._get_thread_client("http://api"))
+
+        threads = [threading.Thread(target=get) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(client.session) for client in clients}), 3)
+        self.assertEqual(len({id(client.adapter) for client in clients}), 1)
+
+        original = transport.get_api_adapter()
+        transport.configure_transport()
+        client = api_client._get_thread_client("http://api")
+        self.assertIsNot(client.adapter, original)
+        self.assertIs(client.adapter, transport.get_api_adapter())
+
+
+class TestApiClientMemoization(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        for target, kwargs in (
+            ("fussball_crawler.api_client.lookup_cache", {"new": LookupCache()}),
+            (
+                "fussball_crawler.api_client._get_initialized_client",
+                {"return_value": self.client},
+            ),
+        ):
+            patcher = patch(target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_repeated_reference_lookups_hit_the_api_once(self):
+        self.client._post.return_value = _response(200, {"id": 7})
+
+        for _ in range(3):
+            api_client.insert_age_group("Herren")
+            self.assertEqual(api_client.get_age_group_id_by_name("Herren"), 7)
+
+        self.client._post.assert_called_once()
+        self.client._get.assert_not_called()
+        self.assertEqual(api_client.lookup_cache.stats().hits, 5)
+
+    def test_failed_match_write_invalidates_references(self):
+        self.client._get.return_value = _response(200, 3)
+        self.assertEqual(api_client.get_venue_id_by_address("Platz 1"), 3)
+
+        self.client._post.return_value = _response(400, "unknown venue")
+        with self.assertLogs("fussball_crawler.api_client", level="ERROR"):
+            api_client.upsert_match("url", "time", None, None, 3, 1, 1)
+
+        api_client.get_venue_id_by_address("Platz 1")
+        self.assertEqual(self.client._get.call_count, 2)
+
+
+class TestUpsertMatches(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.records = [
+            api_client.match_payload(
+                f"url{i}", "2025-08-01T15:00:00", None, None, 1, 1, 1
+            )
+            for i in range(5)
+        ]
+        for target, kwargs in (
+            ("fussball_crawler.api_client.lookup_cache", {"new": LookupCache()}),
+            (
+                "fussball_crawler.api_client._get_initialized_client",
+                {"return_value": self.client},
+            ),
+        ):
+            patcher = patch(target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_sends_batches_and_reports_each_record(self):
+        def bulk(endpoint, data):
+            return _response(
+                200,
+                {
+                    "results": [
+                        {
+                            "index": i,
+                            "success": record["url"] != "url3",
+                            "matchId": i + 1,
+                            "error": "Venue 1 not found"
+                            if record["url"] == "url3"
+                            else None,
+                        }
+                        for i, record in enumerate(data["matches"])
+                    ]
+                },
+            )
+
+        self.client._post.side_effect = bulk
+        with self.assertLogs("fussball_crawler.api_client", level="ERROR") as logs:
+            outcomes = api_client.upsert_matches(self.records, batch_size=2)
+
+        self.assertEqual(
+            [len(call.args[1]["matches"]) for call in self.client._post.call_args_list],
+            [2, 2, 1],
+        )
+        self.assertEqual([o.url for o in outcomes], [f"url{i}" for i in range(5)])
+        self.assertEqual([o.success for o in outcomes], [True] * 3 + [False, True])
+        self.assertEqual(outcomes[3].error, "Venue 1 not found")
+        self.assertIn("url3", "\n".join(logs.output))
+
+    def test_batches_are_split_at_the_api_limit(self):
+        self.client._post.side_effect = lambda endpoint, data: _response(
+            200, {"results": []}
+        )
+
+        with patch.object(api_client, "MAX_MATCH_BATCH_SIZE", 2):
+            api_client.upsert_matches(self.records, batch_size=1000)
+
+        self.assertEqual(
+            [len(call.args[1]["matches"]) for call in self.client._post.call_args_list],
+            [2, 2, 1],
+        )
+
+    def test_falls_back_to_single_upserts_without_bulk_endpoint(self):
+        self.client._post.side_effect = lambda endpoint, data: _response(
+            404 if endpoint.endswith("/bulk") else 200, {}
+        )
+
+        outcomes = api_client.upsert_matches(self.records[:2])
+
+        self.assertTrue(all(o.success for o in outcomes))
+        self.assertEqual(
+            [call.args[0] for call in self.client._post.call_args_list],
+            ["/api/matches/bulk", "/api/matches", "/api/matches"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler import async_engine, scraper
+from fussball_crawler.async_engine import HttpResponse
+from fussball_crawler.deobfuscator import Deobfuscator, font_url
+from fussball_crawler.geocode_cache import GeocodeCache
+from fussball_crawler.transport import TransportConfig
+
+
+class FakeHttp:
+    """Answers AsyncHttp.get from a dict of URL prefix -> response."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requested = []
+
+    async def get(self, url, **kwargs):
+        self.requested.append(url)
+        for prefix, response in self.routes.items():
+            if url.startswith(prefix):
+                return response
+        return HttpResponse(404, b"", None)
+
+
+class TestAsyncEngine(unittest.TestCase):
+    def setUp(self):
+        data_dir = Path(__file__).parent / "data"
+        self.fonts_dir = data_dir / "fonts"
+        self.page = (data_dir / "files" / "fussball_de_original.html").read_bytes()
+
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        env = patch.dict(os.environ, {"FUSSBALL_CRAWLER_CACHE_DIR": cache_dir.name})
+        env.start()
+        self.addCleanup(env.stop)
+        for target, kwargs in (
+            ("fussball_crawler.scraper._font_cache", {"new": None}),
+            ("fussball_crawler.scraper._http_cache", {"new": None}),
+            ("fussball_crawler.match_finder._geocode_cache", {"new": GeocodeCache()}),
+        ):
+            patcher = patch(target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_fetch_club_matches_matches_sync_parser(self):
+        routes = {
+            scraper.club_schedule_url("club", "2025-08-01", "2025-08-31"): (
+                HttpResponse(200, self.page, "utf-8")
+            )
+        }
+        for font in self.fonts_dir.iterdir():
+            routes[font_url(font.name)] = HttpResponse(200, font.read_bytes(), None)
+        http = FakeHttp(routes)
+
+        matches = asyncio.run(
+            async_engine.fetch_club_matches(http, "club", "2025-08-01", "2025-08-31")
+        )
+
+        expected = scraper.parse_club_matches(
+            self.page, "club", "utf-8", Deobfuscator(font_dir=str(self.fonts_dir))
+        )
+        self.assertTrue(matches)
+        self.assertEqual(matches, expected)
+
+    def test_fetch_club_matches_returns_empty_list_on_error(self):
+        http = FakeHttp({})
+        http.get = lambda *args, **kwargs: self._raise()
+        with self.assertLogs("fussball_crawler.async_engine", level="ERROR"):
+            matches = asyncio.run(
+                async_engine.fetch_club_matches(
+                    http, "club", "2025-08-01", "2025-08-31"
+                )
+            )
+        self.assertEqual(matches, [])
+
+    async def _raise(self):
+        raise ConnectionError("offline")
+
+    def test_geocoder_falls_back_to_unfiltered_query(self):
+        feature = {"geometry": {"coordinates": [13.7, 51.0]}}
+        http = FakeHttp(
+            {
+                "http://geo/api?q=Platz%201&osm_tag=leisure": HttpResponse(
+                    200, b'{"features": []}', None
+                ),
+                "http://geo/api?q=Platz%201": HttpResponse(
+                    200, json.dumps({"features": [feature]}).encode(), None
+                ),
+            }
+        )
+
+        coordinates = asyncio.run(
+            async_engine.find_lat_long_online(http, "http://geo/api", "Platz 1")
+        )
+
+        self.assertEqual(coordinates, (51.0, 13.7))
+        self.assertEqual(len(http.requested), 2)
+
+    def test_geocoder_errors_are_not_cached(self):
+        http = FakeHttp({"http://geo/api": HttpResponse(502, b"<html>", None)})
+
+        with self.assertLogs("fussball_crawler.async_engine", level="WARNING"):
+            coordinates = asyncio.run(
+                async_engine.find_lat_long_online(http, "http://geo/api", "Platz 1")
+            )
+
+        self.assertIsNone(coordinates)
+        self.assertIsNone(async_engine.get_geocode_cache().get("Platz 1"))
+
+    def test_retries_wait_for_retry_after_on_idempotent_methods(self):
+        http = async_engine.AsyncHttp(config=TransportConfig(backoff_factor=0.01))
+        responses = []
+
+        async def send(method, url, target, **kwargs):
+            return responses.pop(0)
+
+        async def request(method):
+            responses[:] = [
+                HttpResponse(429, b"", None, {"Retry-After": "7"}),
+                HttpResponse(200, b"", None),
+            ]
+            return (await http.request(method, "https://example.org")).status_code
+
+        with (
+            patch.object(http, "_send", send),
+            patch.object(async_engine.asyncio, "sleep") as sleep,
+        ):
+            self.assertEqual(asyncio.run(request("PUT")), 200)
+            self.assertEqual(sleep.call_args.args, (7.0,))
+            sleep.reset_mock()
+            self.assertEqual(asyncio.run(request("POST")), 429)
+            sleep.assert_not_called()
+
+    def test_find_clubs_consumes_postal_codes_as_it_goes(self):
+        finished = []
+
+        class Http(FakeHttp):
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                pass
+
+        async def fetch(http, postal_code):
+            await asyncio.sleep(0)
+            finished.append(postal_code)
+            return ""
+
+        def codes():
+            for i in range(20):
+                # At most twice the concurrency ahead of finished searches
+                self.assertLessEqual(i - len(finished), 2 * 2)
+                yield f"{i:05d}"
+
+        with (
+            patch.object(async_engine, "AsyncHttp", lambda **kwargs: Http({})),
+            patch.object(async_engine.AsyncApiClient, "available", return_value=True),
+            patch.object(async_engine, "fetch_all_clubs_for_post_code", fetch),
+            patch.object(async_engine, "extract_clubs", return_value=[]),
+            self.assertLogs("fussball_crawler.async_engine", level="INFO"),
+        ):
+            result = asyncio.run(async_engine.find_clubs(codes(), "api", concurrency=2))
+
+        self.assertEqual(result, (20, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
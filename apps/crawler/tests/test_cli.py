@@ -0,0 +1,125 @@
+import io
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler import cli
+
+
+class TestFindClubsCommand(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.state_file = str(Path(tmp.name) / "state.sqlite3")
+        self.searched = []
+        self.threads = set()
+
+        def find_clubs_main(postal_code, calio_api_url, state, check_api):
+            self.assertFalse(check_api)
+            self.threads.add(threading.current_thread().name)
+            time.sleep(0.001)
+            self.searched.append(postal_code)
+            if postal_code == "10115":
+                raise RuntimeError("boom")
+
+        patchers = [
+            patch.object(cli, "find_clubs_main", side_effect=find_clubs_main),
+            patch.object(cli, "configure_transport"),
+            patch.multiple(
+                cli.api_client,
+                get_client=lambda base_url: None,
+                available=lambda: True,
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run(self, stdin, *options):
+        args = cli.create_parser().parse_args(
+            ["find-clubs", "--state-file", self.state_file, *options]
+        )
+        with (
+            patch.object(sys, "stdin", io.StringIO(stdin)),
+            self.assertLogs("fussball_crawler.cli", level="INFO") as logs,
+        ):
+            code = cli.find_clubs_command(args)
+        return code, "\n".join(logs.output)
+
+    def test_workers_search_every_code_and_count_errors(self):
+        codes = [f"{i:05d}" for i in range(1000, 1040)]
+        stdin = "\n".join(codes + ["", "123", "10115"]) + "\n"
+
+        code, output = self._run(stdin, "--workers", "4")
+
+        self.assertEqual(code, 1)
+        self.assertCountEqual(self.searched, codes + ["10115"])
+        self.assertGreater(len(self.threads), 1)
+        self.assertIn("Completed processing 40 postal codes (2 errors)", output)
+
+    def test_resume_skips_completed_codes(self):
+        self._run("01099\n10115\n", "--workers", "2")
+        self.searched.clear()
+
+        code, output = self._run("01099\n10115\n80331\n", "--resume")
+
+        self.assertEqual(code, 1)
+        self.assertEqual(self.searched, ["10115", "80331"])
+        self.assertIn("Resuming: 1 postal codes already completed", output)
+
+    def test_unavailable_api_only_validates_codes_with_either_engine(self):
+        for engine in ("sync", "async"):
+            with (
+                self.subTest(engine=engine),
+                patch.object(cli.api_client, "available", return_value=False),
+            ):
+                code, output = self._run("01099\n123\n", "--engine", engine)
+                self.assertEqual(code, 1)
+                self.assertIn("Invalid postal code format: 123", output)
+                self.assertIn("Completed processing 1 postal codes (1 errors)", output)
+
+                code, _ = self._run("01099\n", "--engine", engine)
+                self.assertEqual(code, 0)
+        self.assertEqual(self.searched, [])
+
+    def test_checkpoint_only_with_resume_or_state_file(self):
+        parser = cli.create_parser()
+
+        plain = parser.parse_args(["find-matches"])
+        self.assertIsNone(cli.open_checkpoint(plain, "run"))
+
+        resumed = parser.parse_args(
+            ["find-matches", "--resume", "--state-file", self.state_file]
+        )
+        checkpoint = cli.open_checkpoint(resumed, "run")
+        self.assertIsNotNone(checkpoint)
+        checkpoint.close()
+
+    def test_batch_size_is_capped_at_the_api_limit(self):
+        parser = cli.create_parser()
+        args = parser.parse_args(["find-matches", "--batch-size", "1000"])
+        self.assertEqual(args.batch_size, 1000)
+        with (
+            patch.object(sys, "stderr", io.StringIO()),
+            self.assertRaises(SystemExit),
+        ):
+            parser.parse_args(["find-matches", "--batch-size", "1001"])
+
+    def test_empty_stdin_fails(self):
+        args = cli.create_parser().parse_args(["find-clubs"])
+        with (
+            patch.object(sys, "stdin", io.StringIO("\n\n")),
+            self.assertLogs("fussball_crawler.cli", level="ERROR"),
+        ):
+            self.assertEqual(cli.find_clubs_command(args), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
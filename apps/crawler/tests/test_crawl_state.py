@@ -0,0 +1,110 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler import match_finder, scraper
+from fussball_crawler.crawl_state import Checkpoint, CrawlState, schedule_key
+from fussball_crawler.deobfuscator import Deobfuscator
+
+
+class TestCrawlState(unittest.TestCase):
+    def test_fingerprints_persist_across_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "state.sqlite3")
+            state = CrawlState(path)
+            state.put("clubs", "01099", "abc")
+            state.close()
+
+            state = CrawlState(path)
+            self.assertEqual(state.get("clubs", "01099"), "abc")
+            self.assertIsNone(state.get("schedule", "01099"))
+            state.close()
+
+    def test_checkpoint_writes_completed_items_in_batches(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "state.sqlite3")
+            checkpoint = Checkpoint(path, "find-clubs", flush_every=2)
+            checkpoint.mark("01099")
+            self.assertEqual(Checkpoint(path, "find-clubs").completed(), set())
+
+            checkpoint.mark("10115")
+            checkpoint.mark("80331")
+            checkpoint.close()
+
+            resumed = Checkpoint(path, "find-clubs")
+            self.assertEqual(resumed.completed(), {"01099", "10115", "80331"})
+            self.assertEqual(Checkpoint(path, "other").completed(), set())
+            resumed.reset()
+            self.assertEqual(resumed.completed(), set())
+            resumed.close()
+
+
+class TestParseClubSchedule(unittest.TestCase):
+    def setUp(self):
+        data_dir = Path(__file__).parent / "data"
+        self.content = (data_dir / "files" / "fussball_de_original.html").read_bytes()
+        self.deobfuscator = Deobfuscator(font_dir=str(data_dir / "fonts"))
+
+    def test_unchanged_table_skips_match_extraction(self):
+        first = scraper.parse_club_schedule(
+            self.content, "club", "utf-8", self.deobfuscator
+        )
+        self.assertGreater(len(first.matches), 0)
+
+        with patch("fussball_crawler.scraper.get_matches") as get_matches:
+            again = scraper.parse_club_schedule(
+                self.content, "club", "utf-8", self.deobfuscator, first.fingerprint
+            )
+
+        get_matches.assert_not_called()
+        self.assertEqual(again[:2], (first.fingerprint, None))
+
+
+class TestIncrementalProcessClub(unittest.TestCase):
+    def setUp(self):
+        self.state = CrawlState()
+        self.key = schedule_key("club", "2025-08-01", "2025-08-31")
+        self.upsert = patch.object(match_finder, "upsert_club_matches").start()
+        self.addCleanup(patch.stopall)
+
+    def _process(self, schedule):
+        with patch.object(
+            scraper, "fetch_club_schedule_matches", return_value=schedule
+        ) as fetch:
+            count, _ = match_finder.process_club(
+                "club", "2025-08-01", "2025-08-31", "geo", state=self.state
+            )
+        return count, fetch.call_args.args[3]
+
+    def test_records_fingerprint_only_when_every_match_was_saved(self):
+        unsaved = 1
+
+        def upsert(matches, *args):
+            list(matches)  # Matches are streamed; a writer drains them
+            return unsaved
+
+        self.upsert.side_effect = upsert
+        self._process(scraper.ClubSchedule("v1", [{"url": "a"}]))
+        self.assertIsNone(self.state.get("schedule", self.key))
+
+        unsaved = 0
+        self._process(scraper.ClubSchedule("v1", [{"url": "a"}]))
+        self.assertEqual(self.state.get("schedule", self.key), "v1")
+
+    def test_unchanged_schedule_is_not_written(self):
+        self.state.put("schedule", self.key, "v1")
+
+        count, known = self._process(scraper.ClubSchedule("v1", None))
+
+        self.assertEqual((count, known), (0, "v1"))
+        self.upsert.assert_not_called()
+        self.assertEqual(self.state.skipped, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,8 @@
+import os
+import random
+import shutil
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -6,13 +10,18 @@ from unittest.mock import patch
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from bs4 import BeautifulSoup
+
 from fussball_crawler.deobfuscator import Deobfuscator
+from fussball_crawler.font_cache import FontMappingCache
+from fussball_crawler.translation import CLEANUP_PATTERNS, CharTranslator
 
 
 class TestFussballDeDeobfuscator(unittest.TestCase):
     def setUp(self):
         fonts_dir = Path(__file__).parent / "data" / "fonts"
-        self.deobfuscator = Deobfuscator(font_dir=str(fonts_dir))
+        # The expected file is html.parser's serialization of the page
+        self.deobfuscator = Deobfuscator(font_dir=str(fonts_dir), parser="html.parser")
         data_dir = Path(__file__).parent / "data" / "files"
 
         # Load obfuscated HTML (contains &#xE characters)
@@ -37,8 +46,8 @@ class TestFussballDeDeobfuscator(unittest.TestCase):
         if self.expected_html is None:
             self.skipTest("Expected HTML file not found")
 
-        # Patch requests.get so no network is performed even if code path is hit
-        with patch("fussball_crawler.deobfuscator.requests.get") as mock_get:
+        # Patch the session so no network is performed even if code path is hit
+        with patch("fussball_crawler.deobfuscator.get_session") as mock_get:
             mock_get.side_effect = AssertionError(
                 "Network call should not occur when using local fonts"
             )
@@ -54,6 +63,144 @@ class TestFussballDeDeobfuscator(unittest.TestCase):
         # Assert - result should match expected deobfuscated HTML
         self.assertEqual(result, self.expected_html)
 
+    def test_stream_mode_matches_tree_mode(self):
+        if self.obfuscated_html is None:
+            self.skipTest("Obfuscated HTML file not found")
+        if self.expected_html is None:
+            self.skipTest("Expected HTML file not found")
+
+        fonts_dir = Path(__file__).parent / "data" / "fonts"
+        stream_deobfuscator = Deobfuscator(font_dir=str(fonts_dir), mode="stream")
+        result = stream_deobfuscator.deobfuscate_html(self.obfuscated_html)
+
+        # Markup outside the spans is passed through raw, so compare parsed trees
+        self.assertNotIn("&#xE", result)
+        self.assertEqual(str(BeautifulSoup(result, "html.parser")), self.expected_html)
+
+    def test_stream_mode_rewrites_only_span_text(self):
+        deobfuscator = Deobfuscator(
+            font_fetcher=lambda _id: b"", mode="stream", cache=FontMappingCache()
+        )
+        deobfuscator.cache.put("x", "d", CharTranslator({"\ue000": "7"}))
+        html = (
+            '<script>var s = "<span data-obfuscation=x>&#xE000;</span>";</script>'
+            '<span data-obfuscation="x">&#xE000;<span class="i">&#xE000;</span>'
+            "&amp;&#xE000;</span>&#xE000;"
+        )
+
+        result = deobfuscator.deobfuscate_html(html)
+
+        self.assertEqual(
+            result,
+            '<script>var s = "<span data-obfuscation=x>&#xE000;</span>";</script>'
+            '<span data-obfuscation="x">7<span class="i">&#xE000;</span>'
+            "&amp;7</span>&#xE000;",
+        )
+
+
+class TestFontMappingCache(unittest.TestCase):
+    def setUp(self):
+        self.fonts_dir = Path(__file__).parent / "data" / "fonts"
+        self.fetched: list[str] = []
+
+    def _counting_fetcher(self, obfuscation_id):
+        self.fetched.append(obfuscation_id)
+        return str(self.fonts_dir / obfuscation_id), False
+
+    def test_memory_cache_skips_fetcher_on_repeat(self):
+        deobfuscator = Deobfuscator(font_fetcher=self._counting_fetcher)
+
+        first = deobfuscator.get_char_mapping("kury4yhl")
+        second = deobfuscator.get_char_mapping("kury4yhl")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.fetched, ["kury4yhl"])
+
+    def test_disk_cache_survives_new_instance(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            expected = Deobfuscator(
+                font_fetcher=self._counting_fetcher,
+                cache=FontMappingCache(cache_dir),
+            ).get_char_mapping("sth8k5hs")
+
+            fresh = Deobfuscator(
+                font_fetcher=self._counting_fetcher,
+                cache=FontMappingCache(cache_dir),
+            )
+            self.assertEqual(fresh.get_char_mapping("sth8k5hs"), expected)
+
+        self.assertEqual(self.fetched, ["sth8k5hs"])
+
+    def test_bytes_fetcher_matches_local_fonts(self):
+        def bytes_fetcher(obfuscation_id):
+            return (self.fonts_dir / obfuscation_id).read_bytes()
+
+        expected = Deobfuscator(font_dir=str(self.fonts_dir)).get_char_mapping(
+            "v3glti02"
+        )
+        result = Deobfuscator(font_fetcher=bytes_fetcher).get_char_mapping("v3glti02")
+
+        self.assertEqual(result, expected)
+
+    def test_legacy_path_fetcher_removes_temp_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_font = os.path.join(tmp_dir, "font_kury4yhl.woff")
+
+            def path_fetcher(obfuscation_id):
+                shutil.copy(self.fonts_dir / obfuscation_id, tmp_font)
+                return tmp_font, True
+
+            mapping = Deobfuscator(font_fetcher=path_fetcher).get_char_mapping(
+                "kury4yhl"
+            )
+
+            self.assertGreater(len(mapping), 0)
+            self.assertFalse(os.path.exists(tmp_font))
+
+    def test_lru_evicts_oldest_entry(self):
+        cache = FontMappingCache(max_entries=2)
+        translators = {
+            key: CharTranslator({"x": value})
+            for key, value in (("a", "1"), ("b", "2"), ("c", "3"))
+        }
+        cache.put("a", "d1", translators["a"])
+        cache.put("b", "d2", translators["b"])
+        cache.get("a")
+        cache.put("c", "d3", translators["c"])
+
+        self.assertIs(cache.get("a"), translators["a"])
+        self.assertIsNone(cache.get("b"))
+        self.assertIs(cache.get("c"), translators["c"])
+        self.assertEqual(cache.get_by_digest("d3").mapping, {"x": "3"})
+
+
+class TestCharTranslator(unittest.TestCase):
+    @staticmethod
+    def _replace_sequentially(text, char_mapping):
+        # The original str.replace implementation the translator must match
+        for obfuscated_char, real_char in char_mapping.items():
+            text = text.replace(obfuscated_char, real_char)
+        for pattern, replacement in CLEANUP_PATTERNS.items():
+            text = text.replace(pattern, replacement)
+        return text.replace("\xa0", " ")
+
+    def test_matches_sequential_replacement(self):
+        fonts_dir = Path(__file__).parent / "data" / "fonts"
+        deobfuscator = Deobfuscator(font_dir=str(fonts_dir))
+        rng = random.Random(0)
+        fragments = [*CLEANUP_PATTERNS, "k.A.", " ", "\xa0", "Uhr", "|"]
+
+        for obfuscation_id in ("kury4yhl", "sth8k5hs", "v3glti02"):
+            char_mapping = deobfuscator.get_char_mapping(obfuscation_id)
+            translator = CharTranslator(char_mapping)
+            alphabet = list(char_mapping) + fragments
+            for _ in range(200):
+                text = "".join(rng.choices(alphabet, k=rng.randint(0, 40)))
+                self.assertEqual(
+                    translator.translate(text),
+                    self._replace_sequentially(text, char_mapping),
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
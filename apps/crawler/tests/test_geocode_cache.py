@@ -0,0 +1,92 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler import match_finder
+from fussball_crawler.geocode_cache import GeocodeCache
+
+
+class TestGeocodeCache(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.path = os.path.join(cache_dir.name, "geocode.sqlite3")
+
+    def test_positive_and_negative_results_persist(self):
+        cache = GeocodeCache(self.path)
+        cache.put("Platz 1", (51.0, 13.7))
+        cache.put("Nirgendwo", None)
+        cache.close()
+
+        cache = GeocodeCache(self.path)
+        self.addCleanup(cache.close)
+        self.assertEqual(cache.get("Platz 1").coordinates, (51.0, 13.7))
+        self.assertIsNone(cache.get("Nirgendwo").coordinates)
+        self.assertIsNone(cache.get("Unbekannt"))
+
+    def test_negative_results_expire_on_their_own_ttl(self):
+        cache = GeocodeCache(self.path, ttl=3600, negative_ttl=60)
+        self.addCleanup(cache.close)
+        with patch("fussball_crawler.geocode_cache.time.time", return_value=1000):
+            cache.put("Platz 1", (51.0, 13.7))
+            cache.put("Nirgendwo", None)
+
+        with patch("fussball_crawler.geocode_cache.time.time", return_value=1100):
+            self.assertIsNotNone(cache.get("Platz 1"))
+            self.assertIsNone(cache.get("Nirgendwo"))
+            self.assertEqual(cache.purge_expired(), 1)
+
+
+class TestFindLatLongOnline(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(match_finder, "_geocode_cache", GeocodeCache())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cached_addresses_skip_the_geocoder(self):
+        features = {"features": [{"geometry": {"coordinates": [13.7, 51.0]}}]}
+        with patch("fussball_crawler.match_finder.get_session") as get_session:
+            get = get_session.return_value.get
+            get.return_value = MagicMock(status_code=200, json=lambda: features)
+            for _ in range(3):
+                self.assertEqual(
+                    match_finder.find_lat_long_online("geo", "Platz 1"), (51.0, 13.7)
+                )
+        get.assert_called_once()
+
+    def test_unresolvable_addresses_are_cached(self):
+        with patch("fussball_crawler.match_finder.get_session") as get_session:
+            get = get_session.return_value.get
+            get.return_value = MagicMock(status_code=200, json=lambda: {"features": []})
+            with self.assertLogs("fussball_crawler.match_finder", level="INFO"):
+                match_finder.find_lat_long_online("geo", "Nirgendwo")
+            self.assertIsNone(match_finder.find_lat_long_online("geo", "Nirgendwo"))
+        self.assertEqual(get.call_count, 2)
+
+    def test_geocoder_failures_are_not_cached(self):
+        def not_json():
+            raise ValueError("Expecting value")
+
+        with patch("fussball_crawler.match_finder.get_session") as get_session:
+            get = get_session.return_value.get
+            for response in (
+                MagicMock(status_code=503, json=lambda: {"features": []}),
+                MagicMock(status_code=200, json=not_json),
+                MagicMock(status_code=200, json=lambda: {"message": "busy"}),
+            ):
+                get.return_value = response
+                with self.assertLogs("fussball_crawler.match_finder", level="WARNING"):
+                    self.assertIsNone(
+                        match_finder.find_lat_long_online("geo", "Platz 1")
+                    )
+        self.assertIsNone(match_finder.get_geocode_cache().get("Platz 1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
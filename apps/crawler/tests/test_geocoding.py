@@ -0,0 +1,107 @@
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler import match_finder
+from fussball_crawler.geocode_cache import GeocodeCache
+from fussball_crawler.geocoding import DeferredGeocoder
+
+
+class TestDeferredGeocoder(unittest.TestCase):
+    def test_geocodes_each_address_once_and_backfills(self):
+        geocoded = []
+        lock = threading.Lock()
+
+        def geocode(address):
+            with lock:
+                geocoded.append(address)
+            return None if address == "Nirgendwo" else (51.0, 13.7)
+
+        with patch(
+            "fussball_crawler.geocoding.api_client.update_venue_coordinates",
+            return_value=True,
+        ) as update:
+            geocoder = DeferredGeocoder(geocode, workers=2)
+            for venue_id, address in enumerate(["Platz 1", "Platz 2", "Nirgendwo"] * 3):
+                geocoder.submit(address, venue_id)
+            with self.assertLogs("fussball_crawler.geocoding", level="INFO") as logs:
+                geocoder.finish()
+
+        self.assertCountEqual(geocoded, ["Platz 1", "Platz 2", "Nirgendwo"])
+        self.assertCountEqual(
+            [call.args for call in update.call_args_list],
+            [(0, (51.0, 13.7)), (1, (51.0, 13.7))],
+        )
+        self.assertIn("Geocoded 2 of 3 new venues", logs.output[0])
+
+    def test_venues_left_without_coordinates_are_resumed(self):
+        cache = GeocodeCache()
+        answers = iter([None, (51.0, 13.7)])  # The first lookup fails uncached
+
+        with patch(
+            "fussball_crawler.geocoding.api_client.update_venue_coordinates",
+            return_value=True,
+        ) as update:
+            geocoder = DeferredGeocoder(lambda address: next(answers), cache=cache)
+            geocoder.submit("Platz 1", 3)
+            with self.assertLogs("fussball_crawler.geocoding", level="INFO"):
+                geocoder.finish()
+            self.assertEqual(cache.pending(), [("Platz 1", 3)])
+
+            geocoder = DeferredGeocoder(lambda address: next(answers), cache=cache)
+            with self.assertLogs("fussball_crawler.geocoding", level="INFO") as logs:
+                self.assertEqual(geocoder.resume(), 1)
+                geocoder.finish()
+
+        update.assert_called_once_with(3, (51.0, 13.7))
+        self.assertEqual(cache.pending(), [])
+        self.assertIn("Resuming geocoding of 1 venues", logs.output[0])
+
+
+class TestResolveMatchWithDeferredGeocoding(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(match_finder, "_geocode_cache", GeocodeCache())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_new_venue_is_created_without_waiting_for_the_geocoder(self):
+        match = {
+            "address": "Platz 1",
+            "age_group": "Herren",
+            "league": "Kreisliga",
+            "home": "A",
+            "away": "B",
+            "url": "url",
+            "time": "2025-08-01T15:00:00",
+        }
+        with (
+            patch.multiple(
+                "fussball_crawler.match_finder.api_client",
+                find_venue_location=lambda address: None,
+                insert_venue=lambda address, coordinates=None: None,
+                get_venue_id_by_address=lambda address: 3,
+                insert_age_group=lambda name: None,
+                get_age_group_id_by_name=lambda name: 1,
+                insert_competition=lambda name: None,
+                get_competition_id_by_name=lambda name: 2,
+                get_club_id_by_external_id=lambda external_id: 5,
+                find_or_create_team=lambda *args: 4,
+            ),
+            patch.object(match_finder, "find_lat_long_online") as geocode,
+        ):
+            geocoder = DeferredGeocoder(geocode)
+            with patch.object(geocoder, "submit") as submit:
+                record = match_finder.resolve_match(match, "club", "geo", geocoder)
+
+        geocode.assert_not_called()
+        submit.assert_called_once_with("Platz 1", 3)
+        self.assertEqual(record["venueId"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
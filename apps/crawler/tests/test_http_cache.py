@@ -0,0 +1,75 @@
+import gzip
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import requests
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler.http_cache import HttpCache
+
+URL = "https://www.fussball.de/suche.verein/-/plz/01099#!/"
+
+
+def _response(status_code, content=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    response.encoding = "utf-8"
+    return response
+
+
+class TestHttpCache(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.cache_dir = Path(cache_dir.name)
+        self.cache = HttpCache(cache_dir.name)
+        self.session = MagicMock()
+
+    def test_fresh_entries_are_served_from_disk(self):
+        self.session.get.return_value = _response(200, b"<html>clubs</html>")
+
+        first = self.cache.get(self.session, URL, "club_search")
+        second = self.cache.get(self.session, URL.split("#")[0], "club_search")
+
+        self.session.get.assert_called_once()
+        self.assertEqual(second.text, first.text)
+        self.assertEqual(second.encoding, "utf-8")
+        stored = next(self.cache_dir.rglob("*.gz"))
+        self.assertIn(b"<html>clubs</html>", gzip.decompress(stored.read_bytes()))
+
+    def test_stale_entries_are_revalidated(self):
+        self.session.get.return_value = _response(
+            200, b"<html>v1</html>", {"ETag": '"v1"', "Last-Modified": "Mon"}
+        )
+        self.cache.get(self.session, URL, "schedule")
+
+        self.session.get.return_value = _response(304)
+        with patch("fussball_crawler.http_cache.time.time", return_value=1e12):
+            response = self.cache.get(self.session, URL, "schedule")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"<html>v1</html>")
+        self.assertEqual(
+            self.session.get.call_args.kwargs["headers"],
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"},
+        )
+        self.assertEqual((self.cache.hits, self.cache.revalidated), (0, 1))
+
+    def test_errors_are_not_cached(self):
+        self.session.get.return_value = _response(503)
+        self.cache.get(self.session, URL, "team")
+        self.cache.get(self.session, URL, "team")
+
+        self.assertEqual(self.session.get.call_count, 2)
+        self.assertEqual(list(self.cache_dir.rglob("*.gz")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
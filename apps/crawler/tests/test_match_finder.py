@@ -0,0 +1,162 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler import match_finder
+from fussball_crawler.api_client import MatchUpsertOutcome
+from fussball_crawler.crawl_state import Checkpoint
+
+
+class TestMatchFinderMain(unittest.TestCase):
+    def setUp(self):
+        self.clubs = [(f"club{i}",) for i in range(20)]
+        patcher = patch.multiple(
+            "fussball_crawler.match_finder.api_client",
+            get_client=lambda base_url: None,
+            available=lambda: True,
+            get_clubs=lambda post_codes=None: self.clubs,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_workers_process_every_club_once(self):
+        processed = []
+
+        def fake_process_club(
+            club_external_id,
+            from_date,
+            to_date,
+            geocoder_url,
+            batch_size,
+            geocoder,
+            state,
+            window_days,
+        ):
+            processed.append(club_external_id)
+            if club_external_id == "club7":
+                raise RuntimeError("boom")
+            return 0, 0
+
+        with (
+            patch.object(match_finder, "process_club", side_effect=fake_process_club),
+            self.assertLogs("fussball_crawler.match_finder", level="INFO") as logs,
+        ):
+            match_finder.main("2025-08-01", "2025-08-31", "geo", "api", workers=4)
+
+        self.assertCountEqual(processed, [club[0] for club in self.clubs])
+        output = "\n".join(logs.output)
+        self.assertIn("Progress: 20/20", output)
+        self.assertIn("Error processing club club7: boom", output)
+        self.assertIn("1 clubs failed to process", output)
+
+    def test_resume_skips_clubs_completed_before(self):
+        checkpoint = Checkpoint(None, "find-matches/2025-08-01/2025-08-31")
+        failing = {"club7"}
+        processed = []
+
+        def fake_process_club(club_external_id, *args):
+            processed.append(club_external_id)
+            if club_external_id in failing:
+                raise RuntimeError("boom")
+            return 0, 0
+
+        with (
+            patch.object(match_finder, "process_club", side_effect=fake_process_club),
+            self.assertLogs("fussball_crawler.match_finder", level="INFO"),
+        ):
+            match_finder.main(
+                "2025-08-01", "2025-08-31", "geo", "api", checkpoint=checkpoint
+            )
+            self.assertEqual(len(checkpoint.completed()), 19)
+
+            failing.clear()
+            processed.clear()
+            match_finder.main(
+                "2025-08-01", "2025-08-31", "geo", "api", checkpoint=checkpoint
+            )
+
+        self.assertEqual(processed, ["club7"])
+        # A run without errors starts the next one from scratch
+        self.assertEqual(checkpoint.completed(), set())
+
+    def test_clubs_with_unsaved_matches_are_not_checkpointed(self):
+        checkpoint = Checkpoint(None, "find-matches/2025-08-01/2025-08-31")
+
+        def fake_process_club(club_external_id, *args):
+            if club_external_id == "club0":
+                raise RuntimeError("boom")  # Keeps the checkpoint after the run
+            return 3, int(club_external_id == "club7")
+
+        with (
+            patch.object(match_finder, "process_club", side_effect=fake_process_club),
+            self.assertLogs("fussball_crawler.match_finder", level="INFO"),
+        ):
+            match_finder.main(
+                "2025-08-01", "2025-08-31", "geo", "api", checkpoint=checkpoint
+            )
+            completed = checkpoint.completed()
+
+        self.assertEqual(len(completed), 18)
+        self.assertNotIn("club7", completed)
+
+
+class TestWriteClubMatches(unittest.TestCase):
+    def setUp(self):
+        self.batches = []
+
+        def upsert_matches(records, batch_size):
+            self.batches.append([record["url"] for record in records])
+            return [MatchUpsertOutcome(record["url"], True) for record in records]
+
+        patchers = [
+            patch.object(match_finder, "resolve_match", lambda match, *args: match),
+            patch.object(
+                match_finder.api_client, "upsert_matches", side_effect=upsert_matches
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_batches_are_written_while_matches_are_extracted(self):
+        def matches():
+            for i in range(10):
+                # The writer can only lag a full batch plus the queue behind
+                self.assertLessEqual(i - sum(map(len, self.batches)), 4 + 2 + 1)
+                yield {"url": f"m{i}"}
+
+        count, unsaved = match_finder.write_club_matches(
+            matches(), "club", "geo", batch_size=4, queue_size=2
+        )
+
+        self.assertEqual((count, unsaved), (10, 0))
+        self.assertEqual([len(batch) for batch in self.batches], [4, 4, 2])
+
+    def test_writer_errors_stop_extraction(self):
+        extracted = []
+
+        def matches():
+            for i in range(1000):
+                extracted.append(i)
+                yield {"url": f"m{i}"}
+
+        with (
+            patch.object(
+                match_finder.api_client, "upsert_matches", side_effect=RuntimeError
+            ),
+            self.assertRaises(RuntimeError),
+        ):
+            match_finder.write_club_matches(
+                matches(), "club", "geo", batch_size=4, queue_size=2
+            )
+
+        self.assertLess(len(extracted), 100)
+        self.assertEqual(match_finder.write_club_matches([], "club", "geo"), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import pickle
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler.api_client import match_payload
+from fussball_crawler.match_record import MatchRecord
+
+
+def _match(url):
+    return {
+        "time": datetime(2025, 8, 3, 15, 0),
+        "home": "SV Dresden",
+        "away": "FC Leipzig",
+        "home_club_id": "00ES8GN75400001",
+        "away_club_id": "00ES8GN75400002",
+        "home_team_id": "011MIC9N0S000000",
+        "away_team_id": None,
+        "home_team_url": "https://www.fussball.de/mannschaft/-/team-id/011MIC9N0S000000",
+        "away_team_url": None,
+        "age_group": "Herren",
+        "league": "".join("Kreisliga"),  # A new string object per call
+        "address": "Marienallee 1, 01099 Dresden",
+        "url": url,
+    }
+
+
+class TestMatchRecord(unittest.TestCase):
+    def test_dict_view_matches_the_scraped_dict(self):
+        match = _match("https://www.fussball.de/spiel/1")
+        record = MatchRecord(**match)
+
+        self.assertEqual(record, match)
+        self.assertEqual(dict(record), match)
+        self.assertEqual(record["home_team_url"], match["home_team_url"])
+        self.assertEqual(record.get("missing", "default"), "default")
+        self.assertEqual(
+            record.home_team_path, "/mannschaft/-/team-id/011MIC9N0S000000"
+        )
+        with self.assertRaises(AttributeError):
+            record.extra = 1
+
+    def test_repeated_values_are_shared(self):
+        first = MatchRecord(**_match("a"))
+        second = MatchRecord(**_match("b"))
+
+        self.assertIs(first.league, second.league)
+        self.assertIs(first.home_team_path, second.home_team_path)
+
+    def test_pickles_smaller_than_a_dict(self):
+        match = _match("https://www.fussball.de/spiel/1")
+        record = MatchRecord(**match)
+
+        restored = pickle.loads(pickle.dumps(record))
+
+        self.assertIsInstance(restored, MatchRecord)
+        self.assertEqual(restored, record)
+        self.assertLess(len(pickle.dumps(record)), len(pickle.dumps(match)))
+
+    def test_payload_accepts_a_record(self):
+        record = MatchRecord(**_match("https://www.fussball.de/spiel/1"))
+
+        payload = match_payload(record, None, 1, 2, 3, 4, 5)
+
+        self.assertEqual(payload["url"], record.url)
+        self.assertEqual(payload, match_payload(record.url, record.time, 1, 2, 3, 4, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
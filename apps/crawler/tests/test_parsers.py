@@ -0,0 +1,92 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler import club_finder, parsers, scraper
+from fussball_crawler.deobfuscator import Deobfuscator
+
+
+class TestParserConformance(unittest.TestCase):
+    """Every installed backend must extract identical records."""
+
+    def setUp(self):
+        data_dir = Path(__file__).parent / "data"
+        self.fonts_dir = data_dir / "fonts"
+        self.schedule_bytes = (
+            data_dir / "files" / "fussball_de_original.html"
+        ).read_bytes()
+        self.clubs_html = (data_dir / "files" / "fussball_de_clubs.html").read_text(
+            encoding="utf-8"
+        )
+        self.previous_parser = parsers._parser
+
+    def tearDown(self):
+        parsers._parser = self.previous_parser
+
+    def _with_each_backend(self, extract):
+        results = {}
+        for backend in parsers.available_parsers():
+            parsers.configure_parser(backend)
+            results[backend] = extract()
+        return results
+
+    @unittest.skipUnless(
+        len(parsers.available_parsers()) > 1, "needs a second parser backend (lxml)"
+    )
+    def test_get_matches_identical_across_backends(self):
+        results = self._with_each_backend(
+            lambda: scraper.parse_club_matches(
+                self.schedule_bytes,
+                "club",
+                encoding="utf-8",
+                deobfuscator=Deobfuscator(font_dir=str(self.fonts_dir)),
+            )
+        )
+
+        reference = results["html.parser"]
+        self.assertGreater(len(reference), 0)
+        for backend, matches in results.items():
+            self.assertEqual(matches, reference, backend)
+
+    def test_club_list_identical_across_backends(self):
+        results = self._with_each_backend(
+            lambda: club_finder.get_clubs(self.clubs_html, "01099")
+        )
+
+        reference = results["html.parser"]
+        self.assertEqual(
+            reference,
+            [
+                ("00ES8GNAVO00000NVV0AG08LVUPGND5I", "SG Dresden Striesen"),
+                ("00ES8GNAVO00000TVV0AG08LVUPGND5I", "SV Blau-Weiß Zschachwitz"),
+                ("00ES8GNAVO00001BVV0AG08LVUPGND5I", "FV Dresden-Laubegast & Söhne"),
+                ("00ES8GNAVO00002HVV0AG08LVUPGND5I", "Post SV Dresden"),
+            ],
+        )
+        for backend, clubs in results.items():
+            self.assertEqual(clubs, reference, backend)
+
+    def test_deobfuscator_follows_the_configured_backend(self):
+        deobfuscator = Deobfuscator(font_dir=str(self.fonts_dir))
+        for backend in parsers.available_parsers():
+            parsers.configure_parser(backend)
+            self.assertEqual(deobfuscator.parser, backend)
+
+        pinned = Deobfuscator(font_dir=str(self.fonts_dir), parser="html.parser")
+        self.assertEqual(pinned.parser, "html.parser")
+
+    def test_missing_backend_falls_back_to_html_parser(self):
+        with patch.object(parsers, "is_available", return_value=False):
+            self.assertEqual(parsers.resolve_parser("lxml"), "html.parser")
+
+    def test_unknown_backend_is_rejected(self):
+        with self.assertRaises(ValueError):
+            parsers.resolve_parser("regex")
+
+
+if __name__ == "__main__":
+    unittest.main()
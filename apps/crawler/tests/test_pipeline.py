@@ -0,0 +1,81 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler import pipeline, scraper
+from fussball_crawler.match_finder import CrawlProgress
+
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        data_dir = Path(__file__).parent / "data"
+        self.fonts_dir = data_dir / "fonts"
+        self.page = (data_dir / "files" / "fussball_de_original.html").read_bytes()
+
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        env = patch.dict(os.environ, {"FUSSBALL_CRAWLER_CACHE_DIR": cache_dir.name})
+        env.start()
+        self.addCleanup(env.stop)
+        font_cache = patch.object(scraper, "_font_cache", None)
+        font_cache.start()
+        self.addCleanup(font_cache.stop)
+
+        response = MagicMock(content=self.page, encoding="utf-8")
+        for target, kwargs in (
+            (
+                "fussball_crawler.scraper.fetch_club_schedule",
+                {"return_value": response},
+            ),
+            (
+                "fussball_crawler.pipeline.network_font_fetcher",
+                {"side_effect": lambda i: (self.fonts_dir / i).read_bytes()},
+            ),
+        ):
+            patcher = patch(target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_download_prefetches_only_uncached_fonts(self):
+        task = pipeline.download_page("club", "2025-08-01", "2025-08-31")
+        self.assertEqual(set(task.fonts), {"kury4yhl", "sth8k5hs", "v3glti02"})
+
+        pipeline.parse_page(task)
+        again = pipeline.download_page("club", "2025-08-01", "2025-08-31")
+        self.assertEqual(again.fonts, {})
+
+    def test_run_pipeline_writes_every_club(self):
+        clubs = ["club1", "club2", "club3"]
+        schedule = pipeline.parse_page(pipeline.download_page("x", "a", "b"))
+        expected = len(schedule.matches)
+        progress = CrawlProgress(len(clubs))
+
+        with patch("fussball_crawler.pipeline.upsert_club_matches") as upsert:
+            pipeline.run_pipeline(
+                clubs,
+                "2025-08-01",
+                "2025-08-31",
+                "geo",
+                progress,
+                io_workers=2,
+                processes=1,
+                queue_size=1,
+            )
+
+        self.assertEqual(progress.done, len(clubs))
+        self.assertEqual(progress.errors, 0)
+        self.assertEqual(
+            [len(call.args[0]) for call in upsert.call_args_list],
+            [expected] * len(clubs),
+        )
+        self.assertCountEqual([call.args[1] for call in upsert.call_args_list], clubs)
+
+
+if __name__ == "__main__":
+    unittest.main()
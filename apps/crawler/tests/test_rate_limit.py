@@ -0,0 +1,61 @@
+import sys
+import unittest
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler.rate_limit import AdaptiveLimiter, HostPolicy
+
+
+class TestAdaptiveLimiter(unittest.TestCase):
+    def setUp(self):
+        self.limiter = AdaptiveLimiter(
+            "example.org", HostPolicy(rate=100.0, concurrency=2.0)
+        )
+
+    def _request(self, status_code=200, latency=0.01):
+        self.assertEqual(self.limiter.try_acquire(), 0.0)
+        self.limiter.release(status_code, latency)
+
+    def test_concurrency_window_bounds_requests_in_flight(self):
+        self.assertEqual(self.limiter.try_acquire(), 0.0)
+        self.assertEqual(self.limiter.try_acquire(), 0.0)
+        self.assertGreater(self.limiter.try_acquire(), 0.0)
+
+        self.limiter.release(200, 0.01)
+        self.assertEqual(self.limiter.try_acquire(), 0.0)
+
+    def test_successes_increase_and_throttling_halves_once_per_burst(self):
+        for _ in range(10):
+            self._request()
+        rate, concurrency = self.limiter.rate, self.limiter.concurrency
+        self.assertGreater(rate, 100.0)
+        self.assertGreater(concurrency, 2.0)
+
+        for _ in range(3):
+            self.assertEqual(self.limiter.try_acquire(), 0.0)
+        for _ in range(3):
+            self.limiter.release(429, 0.01)
+
+        self.assertAlmostEqual(self.limiter.rate, rate / 2)
+        self.assertAlmostEqual(self.limiter.concurrency, concurrency / 2)
+        self.assertEqual(self.limiter.throttled, 3)
+
+    def test_latency_spikes_count_as_throttling(self):
+        for _ in range(5):
+            self._request(latency=0.2)
+        self._request(latency=0.4)
+        self.assertEqual(self.limiter.throttled, 0)
+
+        self._request(latency=2.0)
+        self.assertEqual(self.limiter.throttled, 1)
+
+    def test_token_bucket_limits_rate(self):
+        limiter = AdaptiveLimiter("example.org", HostPolicy(rate=1.0))
+        self.assertEqual(limiter.try_acquire(), 0.0)
+        self.assertGreater(limiter.try_acquire(), 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler import match_finder
+from fussball_crawler.crawl_state import ClubHistory, CrawlState
+from fussball_crawler.scheduler import prioritize_clubs
+
+NOW = 1_700_000_000.0
+DAY = 24 * 3600
+
+
+class TestPrioritizeClubs(unittest.TestCase):
+    def test_orders_by_change_rate_matches_and_staleness(self):
+        histories = {
+            "static": ClubHistory(10, 0, 20, NOW - DAY),
+            "busy": ClubHistory(10, 9, 20, NOW - DAY),
+            "busy-but-fresh": ClubHistory(10, 9, 20, NOW - 60),
+            "busy-no-matches": ClubHistory(10, 9, 0, NOW - DAY),
+        }
+        clubs = [(club,) for club in [*histories, "new"]]
+
+        ordered = prioritize_clubs(clubs, histories, now=NOW)
+
+        self.assertEqual(
+            [club[0] for club in ordered],
+            ["new", "busy", "busy-no-matches", "static", "busy-but-fresh"],
+        )
+        self.assertEqual(len(prioritize_clubs(clubs, histories, 2, NOW)), 2)
+
+    def test_state_counts_schedule_changes(self):
+        state = CrawlState()
+        for fingerprint in ("a", "a", "b", "b"):
+            state.record_crawl("club", fingerprint, 5)
+        state.record_crawl("club", "c", None)
+
+        history = state.histories()["club"]
+        self.assertEqual((history.crawls, history.changes, history.matches), (5, 2, 5))
+
+
+class TestTimeBudget(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.multiple(
+            "fussball_crawler.match_finder.api_client",
+            get_client=lambda base_url: None,
+            available=lambda: True,
+            get_clubs=lambda post_codes=None: [(f"club{i}",) for i in range(5)],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_no_clubs_start_after_the_deadline(self):
+        with (
+            patch.object(match_finder, "process_club") as process_club,
+            patch.object(match_finder.CrawlProgress, "out_of_time", return_value=True),
+            self.assertLogs("fussball_crawler.match_finder", level="WARNING") as logs,
+        ):
+            match_finder.main("2025-08-01", "2025-08-31", "geo", "api", time_budget=1)
+
+        process_club.assert_not_called()
+        self.assertIn("5 clubs left for the next run", "\n".join(logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
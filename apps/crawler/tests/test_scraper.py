@@ -0,0 +1,169 @@
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bs4 import BeautifulSoup
+
+from fussball_crawler import scraper
+from fussball_crawler.deobfuscator import Deobfuscator
+
+TABLE_CLASS = "table table-striped table-full-width"
+
+
+class TestParseClubMatches(unittest.TestCase):
+    def setUp(self):
+        data_dir = Path(__file__).parent / "data"
+        self.fonts_dir = data_dir / "fonts"
+        self.original_bytes = (
+            data_dir / "files" / "fussball_de_original.html"
+        ).read_bytes()
+        self.expected_html = (
+            data_dir / "files" / "fussball_de_expected.html"
+        ).read_text(encoding="utf-8")
+
+    def test_single_parse_matches_deobfuscated_page(self):
+        table = BeautifulSoup(self.expected_html, "html.parser").find(
+            "table", {"class": TABLE_CLASS}
+        )
+        expected = scraper.get_matches(table)
+
+        result = scraper.parse_club_matches(
+            self.original_bytes,
+            "club",
+            encoding="utf-8",
+            deobfuscator=Deobfuscator(font_dir=str(self.fonts_dir)),
+        )
+
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(result, expected)
+
+
+class TestParseDateTime(unittest.TestCase):
+    def test_short_and_long_formats(self):
+        self.assertEqual(
+            scraper.parse_date_time("Fr, 25.07.25", "19:30"),
+            datetime(2025, 7, 25, 19, 30),
+        )
+        self.assertEqual(
+            scraper.parse_date_time("Sonntag, 15.06.2025", "13:00\n\t\t  Uhr"),
+            datetime(2025, 6, 15, 13, 0),
+        )
+
+    def test_invalid_dates_are_rejected(self):
+        with self.assertLogs("fussball_crawler.scraper", level="WARNING"):
+            for date, time in (
+                ("Xy, 25.07.25", "19:30"),
+                ("Fr, 31.02.25", "19:30"),
+                ("Fr, 25.07.25", "spielfrei"),
+            ):
+                self.assertIsNone(scraper.parse_date_time(date, time), date)
+
+
+class TestDateWindows(unittest.TestCase):
+    def test_windows_cover_the_range_without_overlap(self):
+        self.assertEqual(
+            scraper.date_windows("2025-08-01", "2025-08-17", 7),
+            [
+                ("2025-08-01", "2025-08-07"),
+                ("2025-08-08", "2025-08-14"),
+                ("2025-08-15", "2025-08-17"),
+            ],
+        )
+        self.assertEqual(
+            scraper.date_windows("2025-08-01", "2025-08-31"),
+            [("2025-08-01", "2025-08-31")],
+        )
+
+    def test_merge_drops_duplicates(self):
+        windows = scraper.date_windows("2025-08-01", "2025-08-14", 7)
+        schedules = [
+            scraper.ClubSchedule("a", [{"url": "m0"}, {"url": "m1"}]),
+            scraper.ClubSchedule("b", [{"url": "m0"}, {"url": "extra"}]),
+        ]
+
+        merged = scraper.merge_schedules("club", windows, schedules)
+
+        self.assertEqual(
+            [match["url"] for match in merged.matches], ["m0", "m1", "extra"]
+        )
+        self.assertEqual(set(merged.fingerprints), set(windows))
+
+    def test_warns_when_match_blocks_reach_the_cap(self):
+        # Blocks extraction skips still count towards the cap of the page
+        blocks = scraper.MAX_SCHEDULE_MATCHES * scraper.ROWS_PER_MATCH
+        rows = "<tr><td>spielfrei</td></tr>" * (1 + blocks)
+        page = f'<table class="{TABLE_CLASS}">{rows}</table>'
+        deobfuscator = Deobfuscator(
+            font_dir=str(Path(__file__).parent / "data" / "fonts")
+        )
+        windows = scraper.date_windows("2025-08-01", "2025-08-14", 7)
+
+        with self.assertLogs("fussball_crawler.scraper", level="WARNING") as logs:
+            schedule = scraper.parse_club_schedule(page, "club", None, deobfuscator)
+            merged = scraper.merge_schedules(
+                "club", windows, [schedule, scraper.ClubSchedule("b", [], 3)]
+            )
+
+        self.assertEqual(merged.matches, [])
+        capped = [line for line in logs.output if "match cap" in line]
+        self.assertEqual(len(capped), 1)
+        self.assertIn("2025-08-01 to 2025-08-07", capped[0])
+
+    def test_rows_below_the_match_cap_do_not_warn(self):
+        rows = scraper.MAX_SCHEDULE_MATCHES * scraper.ROWS_PER_MATCH
+        schedule = scraper.ClubSchedule("a", [], rows)
+
+        with self.assertNoLogs("fussball_crawler.scraper", level="WARNING"):
+            scraper.warn_if_truncated("club", ("2025-08-01", "2025-08-07"), schedule)
+
+    def test_unchanged_windows_are_left_out(self):
+        windows = scraper.date_windows("2025-08-01", "2025-08-14", 7)
+        known = {windows[0]: "a"}
+
+        def fetch(club, from_date, to_date, known_fingerprint=None):
+            if known_fingerprint is not None:
+                return scraper.ClubSchedule(known_fingerprint, None)
+            return scraper.ClubSchedule("b", [{"url": to_date}])
+
+        with patch.object(scraper, "fetch_club_schedule_matches", side_effect=fetch):
+            merged = scraper.fetch_club_windows(
+                "club", "2025-08-01", "2025-08-14", 7, known
+            )
+            unchanged = scraper.fetch_club_windows(
+                "club", "2025-08-01", "2025-08-07", 7, known
+            )
+
+        self.assertEqual(merged.matches, [{"url": "2025-08-14"}])
+        self.assertEqual(merged.fingerprints, {windows[1]: "b"})
+        self.assertIsNone(unchanged.matches)
+
+
+class TestClubMatchStream(unittest.TestCase):
+    def test_streams_changed_windows_without_duplicates(self):
+        windows = scraper.date_windows("2025-08-01", "2025-08-21", 7)
+        known = {windows[1]: "unchanged"}
+
+        def fetch(club, from_date, to_date, known_fingerprint=None, lazy=False):
+            self.assertTrue(lazy)
+            if known_fingerprint is not None:
+                return scraper.ClubSchedule(known_fingerprint, None)
+            return scraper.ClubSchedule(
+                to_date, iter([{"url": "shared"}, {"url": to_date}])
+            )
+
+        stream = scraper.ClubMatchStream("club", "2025-08-01", "2025-08-21", 7, known)
+        with patch.object(scraper, "fetch_club_schedule_matches", side_effect=fetch):
+            matches = [match["url"] for match in stream]
+
+        self.assertEqual(matches, ["shared", "2025-08-07", "2025-08-21"])
+        self.assertEqual(set(stream.fingerprints), {windows[0], windows[2]})
+        self.assertIsNotNone(stream.fingerprint)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import sys
+import unittest
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler.sharding import Shard, parse_shard, select_shard
+
+
+class TestSharding(unittest.TestCase):
+    def setUp(self):
+        self.codes = [f"{i:05d}" for i in range(1000, 1400)]
+
+    def test_shards_cover_every_item_exactly_once(self):
+        shards = [select_shard(self.codes, Shard(k, 4)) for k in range(1, 5)]
+
+        self.assertCountEqual(sum(shards, []), self.codes)
+        for selected in shards:
+            self.assertGreater(len(selected), 50)
+
+    def test_assignment_is_stable_when_input_grows(self):
+        shard = Shard(2, 3)
+        before = select_shard(self.codes, shard)
+        after = select_shard(
+            self.codes + [f"{i:05d}" for i in range(90000, 90100)], shard
+        )
+
+        self.assertEqual(after[: len(before)], before)
+
+    def test_clubs_are_sharded_by_id(self):
+        clubs = [(f"club{i}", "Dresden") for i in range(10)]
+        selected = select_shard(clubs, Shard(1, 2), key=lambda club: club[0])
+        self.assertEqual(selected, [c for c in clubs if Shard(1, 2).owns(c[0])])
+        self.assertEqual(select_shard(clubs, None), clubs)
+
+    def test_parse_shard(self):
+        self.assertEqual(parse_shard("2/8"), Shard(2, 8))
+        for value in ("0/8", "9/8", "2", "a/b", "1/0"):
+            with self.assertRaises(ValueError):
+                parse_shard(value)
+
+
+if __name__ == "__main__":
+    unittest.main()
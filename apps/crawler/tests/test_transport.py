@@ -0,0 +1,92 @@
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fussball_crawler import transport
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    statuses: list[int] = []
+    ports: list[int] = []
+
+    def do_GET(self):
+        status = self.statuses.pop(0) if self.statuses else 200
+        self.ports.append(self.client_address[1])
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        _FlakyHandler.statuses = []
+        _FlakyHandler.ports = []
+        server = HTTPServer(("127.0.0.1", 0), _FlakyHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.url = f"http://127.0.0.1:{server.server_port}/"
+
+        original = transport.get_transport_config()
+        self.addCleanup(lambda: transport.configure_transport(**original._asdict()))
+        transport.configure_transport(retries=2, backoff_factor=0.01)
+
+    def test_retries_transient_statuses(self):
+        _FlakyHandler.statuses = [503, 502]
+
+        response = transport.get_session().get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(_FlakyHandler.ports), 3)
+
+    def test_gives_up_after_configured_retries(self):
+        _FlakyHandler.statuses = [503, 503, 503, 503]
+
+        response = transport.get_session().get(self.url)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(_FlakyHandler.ports), 3)
+
+    def test_limiter_sees_every_attempt(self):
+        _FlakyHandler.statuses = [429, 503]
+        statuses = []
+
+        class Limiter:
+            def acquire(self):
+                statuses.append("acquire")
+
+            def release(self, status_code, latency):
+                statuses.append(status_code)
+
+        with patch.object(transport, "get_limiter", return_value=Limiter()):
+            response = transport.get_session().get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(statuses, ["acquire", 429, "acquire", 503, "acquire", 200])
+
+    def test_sessions_apply_timeouts_and_keep_connections_alive(self):
+        session = transport.get_session()
+        with patch.object(
+            transport.requests.Session, "request", autospec=True
+        ) as request:
+            session.get(self.url)
+        self.assertEqual(request.call_args.kwargs["timeout"], (5.0, 30.0))
+
+        for _ in range(3):
+            session.get(self.url)
+        self.assertEqual(len(set(_FlakyHandler.ports)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()